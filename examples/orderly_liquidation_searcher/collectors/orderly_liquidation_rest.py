@@ -1,42 +1,141 @@
 import asyncio
-from typing import Set
+from typing import Callable, Optional
 
-from orderly_sdk.rest import AsyncClient
+from artemis.http import SessionRegistry, get_sessions
+from artemis.utils.cache import TTLCache
 
-from liquidation_searcher.types import Collector, EventType
-from liquidation_searcher.utils.event_loop import get_loop
-from liquidation_searcher.utils.log import logger
+from liquidation_searcher.types import Collector, Event, EventType, LiquidationSource
+from liquidation_searcher.utils.log import LogSampler, logger
+
+_response_log = LogSampler(interval=60)
 
 
 class OrderlyLiquidationRestCollector(Collector):
-    pushed_liquidations: Set[int]
+    """
+    Polls the public liquidation endpoint incrementally, as a fallback feed.
 
-    def __init__(self, account_id, endpoint, loop=None):
-        self.orderly_rest_client = AsyncClient(
-            account_id=account_id,
-            endpoint=endpoint,
-        )
-        self.queue = asyncio.Queue(maxsize=512)
-        self.loop = loop or get_loop()
-        self.pushed_liquidations = set()
+    Each request asks only for liquidations since the newest one seen
+    (`start_t`, minus a small overlap for late rows) and pages through full
+    pages. The poll interval adapts: it drops to `min_poll_interval` while
+    new liquidations keep arriving, grows by `backoff` per empty poll up to
+    `max_poll_interval`, and stays at `max_poll_interval` whenever
+    `feed_alive()` reports the websocket feed as live. A burst larger than
+    `max_pages * page_size` between two polls is logged as a warning; its
+    oldest rows are not fetched.
+    """
 
-    async def _run(self):
-        while True:
-            res = await self.orderly_rest_client.get_liquidation(params=None)
-            logger.debug("orderly liquidation rest collector: {}", res)
-            for liquidation in res["data"]["rows"]:
-                liquidation_id = liquidation["liquidation_id"]
-                if liquidation_id not in self.pushed_liquidations:
-                    self.pushed_liquidations.add(liquidation_id)
-                    liquidation["event_type"] = EventType.ORDERLY_LIQUIDATION_REST
-                    await self.queue.put(liquidation)
-            await asyncio.sleep(2)
+    def __init__(
+        self,
+        account_id,
+        endpoint,
+        poll_interval=2,
+        sessions: Optional[SessionRegistry] = None,
+        min_poll_interval=0.5,
+        max_poll_interval=10,
+        backoff=1.5,
+        feed_alive: Optional[Callable[[], bool]] = None,
+        page_size=100,
+        max_pages=10,
+        overlap_ms=5000,
+    ):
+        self.account_id = account_id
+        self.endpoint = endpoint.rstrip("/")
+        self.sessions = sessions
+        self.poll_interval = poll_interval
+        self.min_poll_interval = min_poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.backoff = backoff
+        self.feed_alive = feed_alive
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.overlap_ms = overlap_ms
+        # timestamp (ms) of the newest liquidation seen, the start_t of the next poll
+        self.cursor: Optional[int] = None
+        # ids already yielded from the overlap window; bounded, rows older
+        # than the window are not requested again
+        self.recent: TTLCache[bool] = TTLCache(maxsize=10_000, ttl=300)
 
     def start(self, timeout=None):
-        self.loop.call_soon_threadsafe(asyncio.create_task, self._run())
+        pass
+
+    async def events(self):
+        interval = self.poll_interval
+        while True:
+            rows = await self.fetch()
+            fresh = 0
+            for liquidation in rows:
+                if not self.recent.add(liquidation["liquidation_id"], True):
+                    continue
+                fresh += 1
+                timestamp = liquidation["timestamp"]
+                if self.cursor is None or timestamp > self.cursor:
+                    self.cursor = timestamp
+                yield liquidation
+            interval = self.next_interval(interval, fresh)
+            await asyncio.sleep(interval)
 
-    async def get_event_stream(self):
-        if not self.queue.empty():
-            return await self.queue.get()
+    async def fetch(self):
+        """Fetch every liquidation since the cursor, newest pages first."""
+        # public endpoint: a plain GET on the shared, kept-warm "orderly" pool
+        sessions = self.sessions or get_sessions()
+        params = {"size": self.page_size}
+        if self.cursor is not None:
+            params["start_t"] = self.cursor - self.overlap_ms
+        rows = []
+        # without a cursor only the latest page is read, not the whole history
+        pages = self.max_pages if self.cursor is not None else 1
+        for page in range(1, pages + 1):
+            params["page"] = page
+            res = await sessions.get_json(
+                f"{self.endpoint}/v1/public/liquidation", name="orderly", params=params
+            )
+            _response_log.debug("orderly liquidation rest collector: {}", res)
+            page_rows = res["data"]["rows"]
+            rows.extend(page_rows)
+            if len(page_rows) < self.page_size:
+                break
         else:
-            return
+            if self.cursor is not None:
+                # pages are newest first: rows between the cursor and the
+                # oldest row read here were not fetched and will not be,
+                # because the cursor moves past them
+                logger.warning(
+                    "orderly liquidation rest collector: hit max_pages={} with {} rows, "
+                    "liquidations between {} and {} may be missing",
+                    self.max_pages,
+                    len(rows),
+                    params["start_t"],
+                    min(row["timestamp"] for row in rows),
+                )
+        # oldest first, so the cursor only moves forward
+        rows.sort(key=lambda row: row["timestamp"])
+        return rows
+
+    def next_interval(self, interval, fresh):
+        """Poll fast during cascades, slow down when idle or while the websocket is live."""
+        if self.feed_alive is not None and self.feed_alive():
+            return self.max_poll_interval
+        if fresh:
+            if interval > self.min_poll_interval:
+                logger.debug("orderly liquidation rest collector: {} new rows, polling fast", fresh)
+            return self.min_poll_interval
+        return min(max(interval, self.min_poll_interval) * self.backoff, self.max_poll_interval)
+
+    def normalize(self, raw):
+        return Event(
+            event_type=EventType.ORDERLY_LIQUIDATION,
+            timestamp=raw["timestamp"],
+            source=LiquidationSource.REST,
+            data={
+                "liquidation_id": raw["liquidation_id"],
+                "type": raw["type"],
+                "positions_by_perp": tuple(
+                    {
+                        "symbol": position["symbol"],
+                        "position_qty": position["position_qty"],
+                        "liquidator_fee": position["liquidator_fee"],
+                    }
+                    for position in raw["positions_by_perp"]
+                ),
+            },
+        )
@@ -1,36 +1,58 @@
-import asyncio
+from artemis.collectors import WebSocketCollector
 
-from orderly_sdk.ws import OrderlyPublicWsManager
-
-from liquidation_searcher.types import Collector, EventType
-from liquidation_searcher.utils.event_loop import get_loop
+from liquidation_searcher.types import Event, EventType, LiquidationSource
 from liquidation_searcher.utils.log import logger
 
 
-class OrderlyLiquidationWsCollector(Collector):
-    def __init__(self, account_id, endpoint, loop=None):
-        self.orderly_ws_client = OrderlyPublicWsManager(
-            account_id=account_id,
-            endpoint=endpoint,
+class OrderlyLiquidationWsCollector(WebSocketCollector):
+    """
+    Orderly public liquidation feed over a native websocket on the engine loop.
+
+    Orderly pings at the application level ({"event": "ping"}) and expects a
+    pong, on top of the protocol-level heartbeat handled by the base class.
+    """
+
+    def __init__(self, account_id, endpoint, topics=("liquidation",), **kwargs):
+        super().__init__(endpoint + account_id, topics=topics, **kwargs)
+        self.account_id = account_id
+
+    def subscribe_message(self, topic):
+        return {"id": f"{self.account_id}-{topic}", "event": "subscribe", "topic": topic}
+
+    async def handle_control(self, ws, message):
+        event = message.get("event")
+        if event == "ping":
+            await ws.send_json({"event": "pong", "ts": message.get("ts")})
+            return True
+        if event == "subscribe":
+            if message.get("success"):
+                logger.info("orderly ws subscribed: {}", message)
+            else:
+                logger.error("orderly ws subscribe failed: {}", message)
+            return True
+        return False
+
+    def decode(self, message):
+        if message.get("topic") != "liquidation":
+            return ()
+        return message.get("data") or ()
+
+    def normalize(self, raw):
+        # the websocket feed uses camelCase keys, map them to the REST schema
+        return Event(
+            event_type=EventType.ORDERLY_LIQUIDATION,
+            timestamp=raw["timestamp"],
+            source=LiquidationSource.WS,
+            data={
+                "liquidation_id": raw["liquidationId"],
+                "type": raw["type"],
+                "positions_by_perp": tuple(
+                    {
+                        "symbol": position["symbol"],
+                        "position_qty": position["positionQty"],
+                        "liquidator_fee": position["liquidatorFee"],
+                    }
+                    for position in raw["positions_by_perp"]
+                ),
+            },
         )
-        self.orderly_ws_client.subscribe("liquidation")
-        self.queue = asyncio.Queue(maxsize=512)
-        self.loop = loop or get_loop()
-
-    async def _run(self, timeout):
-        self.orderly_ws_client.start(timeout=15)
-        while True:
-            res = await self.orderly_ws_client.recv("liquidation", timeout=timeout)
-            logger.debug("orderly liquidation ws collector: {}", res)
-            for liquidation in res:
-                liquidation["event_type"] = EventType.ORDERLY_LIQUIDATION_WS
-                await self.queue.put(liquidation)
-
-    def start(self, timeout=30):
-        self.loop.call_soon_threadsafe(asyncio.create_task, self._run(timeout))
-
-    async def get_event_stream(self):
-        if not self.queue.empty():
-            await self.queue.get()
-        else:
-            return
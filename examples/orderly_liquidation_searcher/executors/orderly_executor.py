@@ -1,7 +1,10 @@
 import asyncio
 from decimal import ROUND_DOWN, Decimal
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+from artemis.http import SessionRegistry, get_sessions
+from artemis.tracing import mark
+from artemis.utils.singleflight import SingleFlight
 from orderly_sdk.rest import AsyncClient
 
 from liquidation_searcher.types import ActionType, Executor, LiquidationType
@@ -21,6 +24,12 @@ class OrderlyExecutor(Executor):
         endpoint,
         max_notional,
         liquidation_symbols,
+        sessions: Optional[SessionRegistry] = None,
+        warm_connections=4,
+        price_ttl=0.5,
+        position_poll_interval=0.05,
+        max_position_poll_interval=0.5,
+        position_timeout=5.0,
     ):
         self.orderly_client = AsyncClient(
             account_id=account_id,
@@ -31,18 +40,44 @@ class OrderlyExecutor(Executor):
         self.symbol_info = dict()
         self.max_notional = max_notional
         self.liquidation_symbols = liquidation_symbols
+        self.endpoint = endpoint.rstrip("/")
+        self.sessions = sessions
+        self.warm_connections = warm_connections
+        # concurrent lookups of one symbol share a request; results are
+        # reused for price_ttl seconds
+        self.mark_prices = SingleFlight(ttl=price_ttl)
+        # after a claim, positions are polled from position_poll_interval,
+        # doubling up to max_position_poll_interval, for position_timeout seconds
+        self.position_poll_interval = position_poll_interval
+        self.max_position_poll_interval = max_position_poll_interval
+        self.position_timeout = position_timeout
 
     async def sync_state(self):
-        symbols = await self.orderly_client.get_available_symbols()
+        # independent lookups, fetch them concurrently; open the warm
+        # connections used for mark price lookups at the same time
+        sessions = self.sessions or get_sessions()
+        symbols, balance, info, warmed = await asyncio.gather(
+            self.orderly_client.get_available_symbols(),
+            self.orderly_client.get_current_holding(),
+            self.orderly_client.get_account_info(),
+            sessions.prewarm(
+                f"{self.endpoint}/v1/public/system_info",
+                connections=self.warm_connections,
+                name="orderly",
+            ),
+        )
+        logger.info("orderly executor warmed {} connections", warmed)
+        # claims, orders and position queries are signed by the SDK and sent
+        # over its own client, which the shared pool cannot warm; a cheap
+        # signed request on every keep-warm interval keeps its connection open
+        sessions.keep_warm(self.orderly_client.get_account_info)
         for symbol in symbols["data"]["rows"]:
             self.symbol_info[symbol["symbol"]] = {
                 "base_tick": str(symbol["base_tick"]),
                 "base_min": str(symbol["base_min"]),
                 "min_notional": str(symbol["min_notional"]),
             }
-        balance = await self.orderly_client.get_current_holding()
         logger.info("orderly executor balance: {}", balance)
-        info = await self.orderly_client.get_account_info()
         logger.info("orderly executor account info: {}", info)
 
     async def execute(self, action):
@@ -52,16 +87,17 @@ class OrderlyExecutor(Executor):
                 action["type"] == LiquidationType.LIQUIDATED
                 or action["type"] == LiquidationType.CLAIM
             ):
-                total_notional = 0
                 ratio = 0
-                for position in action["positions_by_perp"]:
-                    symbol = position["symbol"]
-                    position_qty = position["position_qty"]
-                    future_prices = (
-                        await self.orderly_client.get_futures_for_one_market(symbol)
-                    )
-                    mark_price = future_prices["data"]["mark_price"]
-                    total_notional += mark_price * position_qty
+                positions = action["positions_by_perp"]
+                # current positions are the baseline to detect the transfer against
+                baseline, *mark_prices = await asyncio.gather(
+                    self.get_position_quantities(),
+                    *(self.get_mark_price(position["symbol"]) for position in positions),
+                )
+                total_notional = sum(
+                    mark_price * position["position_qty"]
+                    for mark_price, position in zip(mark_prices, positions)
+                )
                 if total_notional == 0:
                     logger.error(
                         "orderly executor claim_liquidated_positions total_notional is 0"
@@ -78,8 +114,20 @@ class OrderlyExecutor(Executor):
                 logger.info(
                     "orderly executor claim_liquidated_positions json: {}", json
                 )
+                # liquidation seen -> claim sent / answered, exported as the
+                # "claim_sent" and "claim_acked" latency stages
+                mark(action, "claim_sent")
                 res = await self.orderly_client.claim_liquidated_positions(json)
+                mark(action, "claim_acked")
                 logger.info("orderly executor claim_liquidated_positions res: {}", res)
+                if not res or not res.get("success"):
+                    # nothing was claimed, don't hold the lane polling for a transfer
+                    logger.error(
+                        "orderly executor claim_liquidated_positions failed for {}: {}",
+                        liquidation_id,
+                        res,
+                    )
+                    return
             # elif action["type"] == LiquidationType.CLAIM:
             #     for position in action["positions_by_perp"]:
             #         symbol = position["symbol"]
@@ -115,44 +163,126 @@ class OrderlyExecutor(Executor):
             #         # We have only one liquidation_id, so we can only claim the first symbol for now
             #         break
             else:
-                logger.error(f"Unknown liquidation type: {action['type']}")
+                logger.error("Unknown liquidation type: {}", action["type"])
+                return
 
-            # wait for claim position transfer
-            await asyncio.sleep(2)
+            # hedge each claimed symbol as soon as its position shows up in the
+            # account, while polling goes on for the ones still in transfer
+            symbols = {position["symbol"] for position in positions}
+            hedges = [
+                asyncio.create_task(self.hedge_positions(rows))
+                async for rows in self.wait_for_positions(symbols, baseline)
+            ]
+            await asyncio.gather(*hedges)
+        else:
+            logger.error("Unknown action type: {}", action["action_type"])
+            return
+
+    async def get_position_quantities(self):
+        positions = await self.orderly_client.get_all_positions()
+        return {
+            row["symbol"]: row["position_qty"] for row in positions["data"]["rows"]
+        }
 
+    async def wait_for_positions(self, symbols, baseline):
+        """
+        Poll positions and yield the rows of `symbols` as they differ from `baseline`.
+
+        Each symbol is yielded once, in the poll that first sees its
+        transfer. The interval starts at position_poll_interval, doubles up
+        to max_position_poll_interval and starts over whenever a transfer is
+        seen. After position_timeout seconds the current rows of the symbols
+        still pending are yielded anyway, so nothing claimed goes unhedged.
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        delay = self.position_poll_interval
+        pending = set(symbols)
+        while pending:
             positions = await self.orderly_client.get_all_positions()
-            logger.info("orderly executor positions: {}", positions)
-            for position in positions["data"]["rows"]:
-                symbol = position["symbol"]
-                position_qty = position["position_qty"]
-                side = ""
-                if position_qty > 0:
-                    side = "SELL"
-                elif position_qty < 0:
-                    side = "BUY"
-                else:
-                    logger.debug(
-                        f"Unknown position symbol: {symbol}, qty: {position_qty}"
-                    )
-                    continue
-                json = dict(
-                    symbol=symbol,
-                    order_type="MARKET",
-                    side=side,
-                    order_quantity=self.format_qty(symbol, abs(position_qty)),
-                    reduce_only=True,
+            rows = [row for row in positions["data"]["rows"] if row["symbol"] in pending]
+            moved = [
+                row
+                for row in rows
+                if row["position_qty"] != baseline.get(row["symbol"], 0)
+            ]
+            if moved:
+                logger.info(
+                    "orderly executor position transfer of {} observed after {:.3f}s",
+                    [row["symbol"] for row in moved],
+                    loop.time() - started,
                 )
-                if json["order_quantity"] == 0:
-                    logger.debug(
-                        f"Empty position quantity symbol: {symbol}, qty: {position_qty}"
-                    )
-                    continue
-                logger.info("orderly executor create_order json: {}", json)
-                res = await self.orderly_client.create_order(json)
-                logger.info("orderly executor create_order res: {}", res)
-        else:
-            logger.error(f"Unknown action type: {action['action_type']}")
+                pending.difference_update(row["symbol"] for row in moved)
+                delay = self.position_poll_interval
+                yield moved
+                if not pending:
+                    return
+            if loop.time() - started >= self.position_timeout:
+                logger.warning(
+                    "orderly executor no position transfer observed for {} within {}s",
+                    pending,
+                    self.position_timeout,
+                )
+                yield [row for row in rows if row["symbol"] in pending]
+                return
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_position_poll_interval)
+
+    async def hedge_positions(self, rows):
+        """Close every open position with reduce-only market orders, sent concurrently."""
+        logger.debug("orderly executor positions: {}", rows)
+        orders = []
+        for position in rows:
+            symbol = position["symbol"]
+            position_qty = position["position_qty"]
+            side = ""
+            if position_qty > 0:
+                side = "SELL"
+            elif position_qty < 0:
+                side = "BUY"
+            else:
+                logger.debug(
+                    "Unknown position symbol: {}, qty: {}", symbol, position_qty
+                )
+                continue
+            json = dict(
+                symbol=symbol,
+                order_type="MARKET",
+                side=side,
+                order_quantity=self.format_qty(symbol, abs(position_qty)),
+                reduce_only=True,
+            )
+            if float(json["order_quantity"]) == 0:
+                logger.debug(
+                    "Empty position quantity symbol: {}, qty: {}", symbol, position_qty
+                )
+                continue
+            orders.append(json)
+        if not orders:
             return
+        logger.info("orderly executor create_order json: {}", orders)
+        results = await asyncio.gather(
+            *(self.orderly_client.create_order(json) for json in orders),
+            return_exceptions=True,
+        )
+        for json, res in zip(orders, results):
+            if isinstance(res, Exception):
+                logger.error(
+                    "orderly executor create_order {} failed: {}", json["symbol"], res
+                )
+            else:
+                logger.info("orderly executor create_order res: {}", res)
+
+    async def get_mark_price(self, symbol):
+        return await self.mark_prices.do(symbol, lambda: self.fetch_mark_price(symbol))
+
+    async def fetch_mark_price(self, symbol):
+        # public market data goes over the shared, pre-warmed "orderly" pool
+        sessions = self.sessions or get_sessions()
+        future_prices = await sessions.get_json(
+            f"{self.endpoint}/v1/public/futures/{symbol}", name="orderly"
+        )
+        return future_prices["data"]["mark_price"]
 
     def calc_claim_qty(self, symbol, position_qty, mark_price) -> Tuple[float, float]:
         if position_qty == 0 or mark_price == 0:
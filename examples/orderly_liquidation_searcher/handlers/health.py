@@ -1,5 +1,20 @@
+from dataclasses import asdict
+
 from aiohttp import web
 
+from artemis import Engine
+
+ENGINE_KEY = web.AppKey("engine", Engine)
+
 
 async def health_check(_request):
     return web.Response(text="OK")
+
+
+async def readiness_check(request):
+    engine = request.app[ENGINE_KEY]
+    ready = engine.warm and all(status.ready for status in engine.readiness)
+    return web.json_response(
+        {"ready": ready, "components": [asdict(status) for status in engine.readiness]},
+        status=200 if ready else 503,
+    )
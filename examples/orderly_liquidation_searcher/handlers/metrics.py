@@ -0,0 +1,10 @@
+from aiohttp import web
+
+from artemis.metrics import CONTENT_TYPE, MetricsRegistry
+
+METRICS_KEY = web.AppKey("metrics", MetricsRegistry)
+
+
+async def metrics(request):
+    registry = request.app[METRICS_KEY]
+    return web.Response(body=registry.render().encode(), headers={"Content-Type": CONTENT_TYPE})
@@ -17,15 +17,17 @@ Requirements:
 """
 
 import argparse
-import asyncio
 import os
 from argparse import Namespace
 
 import yaml
 
 from artemis import Engine
+from artemis.collectors import RacedCollector
+from artemis.engine import field_key
+from artemis.http import SessionRegistry
+from artemis.utils.event_loop import run, run_options
 from artemis.utils.log import logger, set_level
-from artemis.utils.event_loop import get_loop
 
 from collectors.orderly_liquidation_rest import OrderlyLiquidationRestCollector
 from collectors.orderly_liquidation_ws import OrderlyLiquidationWsCollector
@@ -47,15 +49,17 @@ def parse_args() -> Namespace:
     return args
 
 
-async def main(args: Namespace):
+def load_config(path: str) -> dict:
+    """Load the YAML configuration file."""
+    logger.info("Parsing config file: {}", path)
+    with open(path, "r", encoding="utf-8") as config_file:
+        return yaml.safe_load(config_file)
+
+
+async def main(config: dict):
     """Main entry point for the liquidation searcher."""
     logger.info("Starting Orderly Liquidation Searcher...")
-    logger.info(f"Parsing config file: {args.config}")
-
-    # Load configuration
-    with open(args.config, "r", encoding="utf-8") as config_file:
-        config = yaml.safe_load(config_file)
-    logger.info(f"Loaded configuration: {config}")
+    logger.info("Loaded configuration: {}", config)
 
     # Extract configuration values
     port = config["app"]["port"]
@@ -75,24 +79,37 @@ async def main(args: Namespace):
         logger.error("ORDERLY_KEY or ORDERLY_SECRET is not set")
         raise ValueError("ORDERLY_KEY or ORDERLY_SECRET is not set")
 
-    # Initialize the Artemis engine
-    loop = get_loop()
-    engine = Engine()
+    # Initialize the Artemis engine; latency tracing feeds /metrics. Components
+    # share one pooled, kept-warm HTTP session per upstream
+    engine = Engine(
+        trace_latency=True,
+        sessions=SessionRegistry(),
+    )
 
     # Add collectors
     orderly_liquidation_ws_collector = OrderlyLiquidationWsCollector(
         account_id=orderly_account_id,
         endpoint=orderly_ws_public_endpoint,
-        loop=loop,
     )
-    engine.add_collector(orderly_liquidation_ws_collector)
 
     orderly_liquidation_rest_collector = OrderlyLiquidationRestCollector(
         account_id=orderly_account_id,
         endpoint=orderly_rest_endpoint,
-        loop=loop,
+        # REST is the fallback feed: poll slowly while the websocket is live
+        feed_alive=orderly_liquidation_ws_collector.live,
+    )
+
+    # Race both feeds: each liquidation is emitted once, on first arrival, and
+    # per-feed win rates and lead times are exported on /metrics. This is the
+    # only deduplication; engine-level dedup_key would never see a duplicate
+    orderly_liquidation_feeds = RacedCollector(
+        [orderly_liquidation_ws_collector, orderly_liquidation_rest_collector],
+        key=field_key("liquidation_id"),
+        names=["ws", "rest"],
+        ttl=24 * 3600,
+        metrics=engine.metrics,
     )
-    engine.add_collector(orderly_liquidation_rest_collector)
+    engine.add_collector(orderly_liquidation_feeds)
 
     # Add strategy
     orderly_hedge_strategy = OrderlyHedgeStrategy()
@@ -109,12 +126,14 @@ async def main(args: Namespace):
     )
     engine.add_executor(orderly_executor)
 
-    # Start health check server for monitoring
-    await run_web(port)
+    # Start health, readiness and Prometheus metrics server for monitoring
+    await run_web(port, engine)
     
     # Start the engine
     await engine.run()
 
 
 if __name__ == "__main__":
-    asyncio.run(main(parse_args()), debug=True)
+    config = load_config(parse_args().config)
+    # uvloop when installed; debug mode only if enabled in the config
+    run(main(config), **run_options(config["app"]))
@@ -2,22 +2,32 @@ from aiohttp import web
 
 from liquidation_searcher.utils.log import logger
 
-from .handlers.health import health_check
+from .handlers.health import ENGINE_KEY, health_check, readiness_check
+from .handlers.metrics import METRICS_KEY, metrics
 
 
-def web_app(port):
+def web_app(port, engine=None):
     app = web.Application()
     app.add_routes(
         [
             web.get("/health", health_check),
         ]
     )
+    if engine is not None:
+        app[ENGINE_KEY] = engine
+        app[METRICS_KEY] = engine.metrics
+        app.add_routes(
+            [
+                web.get("/ready", readiness_check),
+                web.get("/metrics", metrics),
+            ]
+        )
     logger.info("listening on port: {}", port)
     return app
 
 
-async def run_web(port):
-    app = web_app(port)
+async def run_web(port, engine=None):
+    app = web_app(port, engine)
     runner = web.AppRunner(app)
     await runner.setup()
     site = web.TCPSite(runner, "0.0.0.0", port)
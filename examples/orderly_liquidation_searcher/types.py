@@ -1,40 +1,23 @@
-from abc import ABC, abstractmethod
 from enum import Enum
 
+from artemis.types import Action, Collector, Event, Executor, Strategy
 
-class Collector(ABC):
-    @abstractmethod
-    def start(self, timeout):
-        pass
-
-    @abstractmethod
-    async def get_event_stream(self):
-        pass
-
-
-class Strategy(ABC):
-    @abstractmethod
-    async def sync_state(self):
-        pass
-
-    @abstractmethod
-    async def process_event(self, event):
-        pass
-
-
-class Executor(ABC):
-    @abstractmethod
-    async def sync_state(self):
-        pass
-
-    @abstractmethod
-    async def execute(self, action):
-        pass
+__all__ = [
+    "Collector",
+    "Strategy",
+    "Executor",
+    "Event",
+    "Action",
+    "EventType",
+    "ActionType",
+    "LiquidationSource",
+    "LiquidationType",
+]
 
 
 class EventType(str, Enum):
-    ORDERLY_LIQUIDATION_REST = "orderly_liquidation_rest"
-    ORDERLY_LIQUIDATION_WS = "orderly_liquidation_ws"
+    # normalized liquidation event, emitted by both the REST and WS collectors
+    ORDERLY_LIQUIDATION = "orderly_liquidation"
     ORDERLY_EXECUTOR_RESULT = "orderly_executor_result"
 
 
@@ -42,6 +25,11 @@ class ActionType(str, Enum):
     ORDERLY_LIQUIDATION_ORDER = "orderly_liquidation_order"
 
 
+class LiquidationSource(str, Enum):
+    REST = "rest"
+    WS = "ws"
+
+
 class LiquidationType(str, Enum):
     LIQUIDATED = "liquidated"
     CLAIM = "claim"
@@ -1,19 +1,12 @@
 import sys
 
-from loguru import logger
+from artemis.utils.log import LogSampler, configure, logger
 
-logger.add(
-    sys.stderr,
-    format='{{"timestamp":"{time}","level":"{level}","message":"{message}"}}',
-    level="INFO",
-)
+__all__ = ["LogSampler", "logger", "set_level"]
+
+# One JSON object per line on stderr, written from a background thread
+configure("INFO", sink=sys.stderr, json=True)
 
 
 def set_level(level):
-    global logger
-    logger.remove()
-    logger.add(
-        sys.stderr,
-        format='{{"timestamp":"{time}","level":"{level}","message":"{message}"}}',
-        level=level,
-    )
+    configure(level)
@@ -13,6 +13,7 @@ import random
 from typing import Any, Dict, Optional
 
 from artemis import Collector, Engine, Executor, Strategy
+from artemis.utils.event_loop import run
 from artemis.utils.log import logger, set_level
 
 
@@ -27,13 +28,16 @@ class MockPriceCollector(Collector):
     def start(self, timeout: Optional[int] = None) -> None:
         """Start generating price events."""
         self.is_running = True
-        logger.info(f"Started price collector for {self.symbol}")
+        logger.info("Started price collector for {}", self.symbol)
 
     async def get_event_stream(self) -> Optional[Dict[str, Any]]:
         """Generate a mock price event."""
         if not self.is_running:
             return None
 
+        # One tick every 100ms; EVENT mode polls again as soon as this returns
+        await asyncio.sleep(0.1)
+
         # Simulate price changes
         change = random.uniform(-0.02, 0.02)  # ±2% change
         self.price *= (1 + change)
@@ -50,19 +54,19 @@ class MockPriceCollector(Collector):
 class PriceChangeStrategy(Strategy):
     """A simple strategy that detects significant price changes."""
 
+    # Only price updates are routed to this strategy
+    subscribed_event_types = frozenset({"price_update"})
+
     def __init__(self, threshold: float = 1.0):
         self.threshold = threshold  # Threshold for significant change (%)
         self.last_prices: Dict[str, float] = {}
 
     async def sync_state(self) -> None:
         """Initialize strategy state."""
-        logger.info(f"Initialized price change strategy with {self.threshold}% threshold")
+        logger.info("Initialized price change strategy with {}% threshold", self.threshold)
 
     async def process_event(self, event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Process price events and detect significant changes."""
-        if event.get("event_type") != "price_update":
-            return None
-
         symbol = event["symbol"]
         current_price = event["price"]
         change = abs(event.get("change", 0))
@@ -73,7 +77,7 @@ class PriceChangeStrategy(Strategy):
         # Check if change exceeds threshold
         if change >= self.threshold:
             direction = "UP" if event.get("change", 0) > 0 else "DOWN"
-            logger.info(f"Significant price change detected: {symbol} {direction} {change:.2f}%")
+            logger.info("Significant price change detected: {} {} {:.2f}%", symbol, direction, change)
 
             return {
                 "action_type": "alert",
@@ -102,7 +106,7 @@ class AlertExecutor(Executor):
         if action.get("action_type") == "alert":
             self.alert_count += 1
             message = action.get("message", "Unknown alert")
-            logger.warning(f"🚨 ALERT #{self.alert_count}: {message}")
+            logger.warning("🚨 ALERT #{}: {}", self.alert_count, message)
 
             # In a real implementation, you might:
             # - Send notifications to Discord/Slack
@@ -142,4 +146,5 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop when installed (pip install artemis-py[speed]), else asyncio
+    run(main())
@@ -12,13 +12,21 @@ The framework uses asyncio for concurrent processing and provides a simple,
 extensible architecture for building complex trading systems.
 """
 
+from .clock import Clock, VirtualClock, get_clock, set_clock
 from .engine import Engine
 from .types import (
+    Action,
     ActionType,
     Collector,
+    EngineMode,
+    Event,
     EventType,
     Executor,
+    OverflowPolicy,
     Strategy,
+    poll_events,
+    to_action,
+    to_event,
 )
 
 __version__ = "0.1.0"
@@ -27,6 +35,17 @@ __all__ = [
     "Collector",
     "Strategy", 
     "Executor",
+    "Event",
+    "Action",
     "EventType",
     "ActionType",
+    "EngineMode",
+    "OverflowPolicy",
+    "poll_events",
+    "to_event",
+    "to_action",
+    "Clock",
+    "VirtualClock",
+    "get_clock",
+    "set_clock",
 ]
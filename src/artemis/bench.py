@@ -0,0 +1,332 @@
+"""
+Offline throughput and latency benchmark for the Artemis engine.
+
+Builds an Engine from synthetic components (a finite price collector,
+no-op or CPU-heavy strategies and null executors), pushes a fixed number of
+events through it for every combination of strategy kind, fan-out and queue
+capacity, and reports events/sec, per-stage latency percentiles and memory
+per queued event as JSON, so results can be compared across releases.
+
+Usage:
+    artemis-bench --events 20000 --fan-out 1,4,16 --capacity 64,512 --output bench.json
+    artemis-bench --loop asyncio,uvloop   # compare event loop implementations
+"""
+
+import argparse
+import asyncio
+import gc
+import itertools
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence
+
+from . import __version__
+from .engine import Channel, Engine
+from .tracing import STAGES, Trace
+from .types import Action, Collector, Event, Executor, OverflowPolicy, Strategy
+from .utils.event_loop import LOOP_ASYNCIO, LOOP_AUTO, LOOP_UVLOOP, loop_name, run
+from .utils.log import set_level
+
+
+class SyntheticPriceCollector(Collector):
+    """Finite push-style collector emitting random-walk price updates, like MockPriceCollector."""
+
+    def __init__(self, count: int, symbols: Sequence[str] = ("BTC/USDT",), seed: int = 0, rate: float = 0.0):
+        """
+        Initialize the collector.
+
+        Args:
+            count: Number of events to emit before the stream ends
+            symbols: Symbols to rotate through
+            seed: Seed of the random walk, for reproducible runs
+            rate: Target events per second; 0 emits as fast as the engine accepts
+        """
+        self.count = count
+        self.symbols = tuple(symbols)
+        self.random = random.Random(seed)
+        self.rate = rate
+
+    def start(self, timeout: Optional[int] = None) -> None:
+        pass
+
+    async def events(self) -> AsyncIterator[Event]:
+        if not self.rate:
+            for event in self.generate():
+                yield event
+            return
+        # Paced: keep to the schedule, so latency is measured below saturation
+        started = time.perf_counter()
+        for index, event in enumerate(self.generate()):
+            delay = started + index / self.rate - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            yield event
+
+    def generate(self) -> Iterator[Event]:
+        """Yield the collector's events synchronously."""
+        price = 50000.0
+        symbols = itertools.cycle(self.symbols)
+        for _ in range(self.count):
+            change = self.random.uniform(-0.02, 0.02)
+            price *= 1 + change
+            yield Event(
+                event_type="price_update",
+                symbol=next(symbols),
+                data={"price": round(price, 2), "change": round(change * 100, 2)},
+            )
+
+
+class NoopStrategy(Strategy):
+    """Strategy that does no work and emits an action every `action_every` events."""
+
+    def __init__(self, action_every: int = 10):
+        self.action_every = max(1, action_every)
+        self.seen = 0
+
+    async def sync_state(self) -> None:
+        pass
+
+    async def process_event(self, event: Event) -> Optional[Action]:
+        self.seen += 1
+        if self.seen % self.action_every:
+            return None
+        return Action("alert", {"price": event["price"]}, symbol=event.symbol)
+
+
+class CpuHeavyStrategy(NoopStrategy):
+    """Strategy that burns `work` floating point iterations per event."""
+
+    def __init__(self, action_every: int = 10, work: int = 2000):
+        super().__init__(action_every)
+        self.work = work
+
+    async def process_event(self, event: Event) -> Optional[Action]:
+        value = event["price"]
+        for i in range(self.work):
+            value = math.sqrt(value * value + i)
+        return await super().process_event(event)
+
+
+class NullExecutor(Executor):
+    """Executor that only counts actions."""
+
+    def __init__(self):
+        self.count = 0
+
+    async def sync_state(self) -> None:
+        pass
+
+    async def execute(self, action: Action) -> None:
+        self.count += 1
+
+    async def execute_many(self, actions: List[Action]) -> None:
+        self.count += len(actions)
+
+
+STRATEGIES = {
+    "noop": NoopStrategy,
+    "cpu": CpuHeavyStrategy,
+}
+
+
+def memory_per_queued_event(capacity: int) -> float:
+    """
+    Measure the memory held by a full event channel, per event.
+
+    Events carry a Trace, as they do while queued in a traced engine.
+
+    Args:
+        capacity: Number of events to queue
+
+    Returns:
+        Bytes allocated per queued event, including the channel's share
+    """
+    collector = SyntheticPriceCollector(capacity)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        channel = Channel(capacity, OverflowPolicy.BLOCK)
+        for event in collector.generate():
+            object.__setattr__(event, "trace", Trace("SyntheticPriceCollector", time.monotonic_ns()))
+            channel.put_nowait(event)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return (after - before) / capacity
+
+
+async def run_scenario(
+    strategy: str,
+    fan_out: int,
+    capacity: int,
+    events: int,
+    action_every: int = 10,
+    cpu_work: int = 2000,
+    max_batch_size: int = 64,
+    rate: float = 0.0,
+) -> Dict[str, Any]:
+    """
+    Run one benchmark scenario on the running event loop.
+
+    Args:
+        strategy: Strategy kind, a key of STRATEGIES
+        fan_out: Number of strategies every event is delivered to
+        capacity: Capacity of the event, action and inbox channels
+        events: Number of events to push through the engine
+        action_every: Each strategy emits one action per this many events
+        cpu_work: Iterations per event of the CPU-heavy strategy
+        max_batch_size: Engine batch size
+        rate: Collector events per second; 0 floods the engine
+
+    Returns:
+        The scenario parameters and results
+    """
+    engine = Engine(
+        event_channel_capacity=capacity,
+        action_channel_capacity=capacity,
+        strategy_inbox_capacity=capacity,
+        executor_inbox_capacity=capacity,
+        max_batch_size=max_batch_size,
+        trace_latency=True,
+    )
+    engine.add_collector(SyntheticPriceCollector(events, symbols=("BTC/USDT", "ETH/USDT", "SOL/USDT"), rate=rate))
+    for _ in range(fan_out):
+        if strategy == "cpu":
+            engine.add_strategy(CpuHeavyStrategy(action_every, cpu_work))
+        else:
+            engine.add_strategy(STRATEGIES[strategy](action_every))
+    executor = NullExecutor()
+    engine.add_executor(executor)
+
+    gc.collect()
+    started = time.perf_counter()
+    await engine.run_until_complete()
+    elapsed = time.perf_counter() - started
+
+    latency = {}
+    tracer = engine.tracer
+    if tracer is None:
+        raise RuntimeError("Benchmark engine runs without latency tracing")
+    for stage in STAGES:
+        histogram = tracer.histogram(stage)
+        p50, p99, p999 = histogram.percentiles((50, 99, 99.9))
+        latency[stage] = {"p50_us": p50 / 1e3, "p99_us": p99 / 1e3, "p999_us": p999 / 1e3}
+    loop = loop_name()
+    return {
+        "name": f"{strategy}-fanout{fan_out}-cap{capacity}-{loop}",
+        "loop": loop,
+        "strategy": strategy,
+        "fan_out": fan_out,
+        "capacity": capacity,
+        "events": events,
+        "rate": rate,
+        "actions": executor.count,
+        "elapsed_s": elapsed,
+        "events_per_sec": events / elapsed if elapsed > 0 else 0.0,
+        "latency": latency,
+        "dropped": sum(stats["dropped"] for stats in engine.channel_stats().values()),
+    }
+
+
+def run_suite(
+    strategies: Sequence[str] = ("noop", "cpu"),
+    fan_outs: Sequence[int] = (1, 4, 16),
+    capacities: Sequence[int] = (64, 512),
+    events: int = 20000,
+    action_every: int = 10,
+    cpu_work: int = 2000,
+    max_batch_size: int = 64,
+    rate: float = 0.0,
+    loops: Sequence[str] = (LOOP_AUTO,),
+) -> Dict[str, Any]:
+    """
+    Run every combination of strategy kind, fan-out, capacity and event loop
+    implementation.
+
+    Each scenario runs in a fresh event loop.
+
+    Returns:
+        A JSON-serializable report with environment details and one entry
+        per scenario
+    """
+    scenarios = []
+    for strategy, fan_out, capacity, loop in itertools.product(strategies, fan_outs, capacities, loops):
+        result = run(
+            run_scenario(strategy, fan_out, capacity, events, action_every, cpu_work, max_batch_size, rate),
+            implementation=loop,
+        )
+        result["memory_per_queued_event_bytes"] = memory_per_queued_event(capacity)
+        scenarios.append(result)
+    return {
+        "artemis_version": __version__,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": time.time(),
+        "scenarios": scenarios,
+    }
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(item) for item in value.split(",") if item]
+
+
+def _loop_list(value: str) -> List[str]:
+    items = [item for item in value.split(",") if item]
+    unknown = set(items) - {LOOP_AUTO, LOOP_ASYNCIO, LOOP_UVLOOP}
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown event loops: {', '.join(sorted(unknown))}")
+    return items
+
+
+def _str_list(value: str) -> List[str]:
+    items = [item for item in value.split(",") if item]
+    unknown = set(items) - set(STRATEGIES)
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown strategies: {', '.join(sorted(unknown))}")
+    return items
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Command line entry point (`artemis-bench`)."""
+    parser = argparse.ArgumentParser(description="Artemis engine benchmark")
+    parser.add_argument("--events", type=int, default=20000, help="events per scenario")
+    parser.add_argument("--strategies", type=_str_list, default=["noop", "cpu"], help="comma separated: noop,cpu")
+    parser.add_argument("--fan-out", type=_int_list, default=[1, 4, 16], help="comma separated strategy counts")
+    parser.add_argument("--capacity", type=_int_list, default=[64, 512], help="comma separated channel capacities")
+    parser.add_argument("--action-every", type=int, default=10, help="one action per this many events per strategy")
+    parser.add_argument("--cpu-work", type=int, default=2000, help="iterations per event of the cpu strategy")
+    parser.add_argument("--max-batch-size", type=int, default=64, help="engine batch size")
+    parser.add_argument("--rate", type=float, default=0.0, help="collector events/sec; 0 floods the engine")
+    parser.add_argument("--loop", type=_loop_list, default=[LOOP_AUTO], help="comma separated: auto,asyncio,uvloop")
+    parser.add_argument("--output", "-o", type=str, default=None, help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    set_level("WARNING")
+    report = run_suite(
+        strategies=args.strategies,
+        fan_outs=args.fan_out,
+        capacities=args.capacity,
+        events=args.events,
+        action_every=args.action_every,
+        cpu_work=args.cpu_work,
+        max_batch_size=args.max_batch_size,
+        rate=args.rate,
+        loops=args.loop,
+    )
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Clock abstraction for the Artemis framework.
+
+Components that need the current time or want to wait should go through
+the active clock instead of calling `time` or `asyncio.sleep` directly. In
+live trading the active clock is the wall clock. During a replay it is a
+VirtualClock driven by the recorded event timestamps, so strategies see the
+recorded time and waits complete instantly.
+"""
+
+import asyncio
+import time
+
+
+class Clock:
+    """Wall clock backed by the `time` module and `asyncio.sleep`."""
+
+    def time(self) -> float:
+        """Return the current time in seconds since the epoch."""
+        return time.time()
+
+    def time_ns(self) -> int:
+        """Return the current time in nanoseconds since the epoch."""
+        return time.time_ns()
+
+    async def sleep(self, delay: float) -> None:
+        """Wait for `delay` seconds."""
+        await asyncio.sleep(delay)
+
+
+class VirtualClock(Clock):
+    """
+    Simulated clock for deterministic replays.
+
+    Time only moves when the replay advances it to the next recorded event,
+    or when a component sleeps: sleeping returns immediately and moves the
+    clock forward by the requested delay. Time never moves backwards.
+    """
+
+    def __init__(self, start_ns: int = 0):
+        """
+        Initialize the clock.
+
+        Args:
+            start_ns: Initial time in nanoseconds since the epoch
+        """
+        self.now_ns = start_ns
+
+    def time(self) -> float:
+        """Return the simulated time in seconds since the epoch."""
+        return self.now_ns / 1e9
+
+    def time_ns(self) -> int:
+        """Return the simulated time in nanoseconds since the epoch."""
+        return self.now_ns
+
+    def advance_to(self, timestamp_ns: int) -> None:
+        """Move the clock forward to `timestamp_ns` (never backwards)."""
+        if timestamp_ns > self.now_ns:
+            self.now_ns = timestamp_ns
+
+    async def sleep(self, delay: float) -> None:
+        """Advance the clock by `delay` seconds and yield to other tasks once."""
+        if delay > 0:
+            self.advance_to(self.now_ns + int(delay * 1e9))
+        await asyncio.sleep(0)
+
+
+_clock: Clock = Clock()
+
+
+def get_clock() -> Clock:
+    """Return the active clock."""
+    return _clock
+
+
+def set_clock(clock: Clock) -> None:
+    """Make `clock` the active clock (the engine does this on startup)."""
+    global _clock
+    _clock = clock
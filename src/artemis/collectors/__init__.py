@@ -0,0 +1,8 @@
+"""
+Reusable collectors and collector combinators.
+"""
+
+from .raced import RacedCollector, SourceStats
+from .websocket import WebSocketCollector
+
+__all__ = ["RacedCollector", "SourceStats", "WebSocketCollector"]
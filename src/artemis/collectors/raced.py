@@ -0,0 +1,229 @@
+"""
+First-arrival-wins racing of redundant feeds.
+
+A RacedCollector subscribes to several collectors that deliver the same
+logical events (e.g. two websocket connections to different endpoints plus
+a REST fallback) and emits each event once, from whichever source delivered
+it first. For every later copy it records which source won and by how much,
+so slow feeds can be identified and dropped.
+"""
+
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Sequence, Set, Tuple, Union
+
+from ..engine.dedup import EventKey
+from ..metrics import MetricsRegistry
+from ..tracing import LatencyHistogram
+from ..types import Collector, Event, to_event
+from ..utils.cache import TTLCache
+from ..utils.log import LogSampler, logger
+
+# Put on the queue by a source whose stream has finished
+_DONE = object()
+
+_normalize_log = LogSampler(interval=1.0)
+
+
+class SourceStats:
+    """Race results of one source."""
+
+    __slots__ = ("events", "errors", "wins", "losses", "lead", "lag")
+
+    def __init__(self):
+        self.events = 0
+        # Payloads the source failed to normalize
+        self.errors = 0
+        self.wins = 0
+        self.losses = 0
+        # How far ahead of the runner-up this source was when it won, and
+        # how far behind the winner it was when it lost, in ns
+        self.lead = LatencyHistogram()
+        self.lag = LatencyHistogram()
+
+    def summary(self) -> Dict[str, float]:
+        """Return event counts, win rate and lead/lag percentiles in microseconds."""
+        raced = self.wins + self.losses
+        lead_p50, lead_p99 = self.lead.percentiles((50, 99))
+        lag_p50, lag_p99 = self.lag.percentiles((50, 99))
+        return {
+            "events": self.events,
+            "errors": self.errors,
+            "wins": self.wins,
+            "losses": self.losses,
+            "win_rate": self.wins / raced if raced else 0.0,
+            "lead_p50_us": lead_p50 / 1e3,
+            "lead_p99_us": lead_p99 / 1e3,
+            "lag_p50_us": lag_p50 / 1e3,
+            "lag_p99_us": lag_p99 / 1e3,
+        }
+
+
+class RacedCollector(Collector):
+    """
+    Races equivalent collectors and emits each logical event once.
+
+    Every source runs in its own task and is restarted with backoff if its
+    stream fails, so one broken feed does not stop the others. Payloads are
+    normalized with their source's `normalize()` and identified with `key`;
+    the first copy of an identity is emitted, later copies only update the
+    race statistics. Events whose key is None are always emitted. A payload
+    that fails to normalize is dropped and counted; its source keeps running.
+
+    A copy arriving after its identity was forgotten (`ttl`, `maxsize`) is
+    treated as new, so the window must exceed the slowest source's delay.
+    """
+
+    def __init__(
+        self,
+        sources: Sequence[Collector],
+        key: EventKey,
+        names: Optional[Sequence[str]] = None,
+        ttl: float = 300.0,
+        maxsize: int = 100_000,
+        capacity: int = 512,
+        min_restart_delay: float = 0.5,
+        max_restart_delay: float = 30.0,
+        metrics: Optional[MetricsRegistry] = None,
+    ):
+        """
+        Initialize the race.
+
+        Args:
+            sources: Collectors delivering the same logical events
+            key: Maps a normalized event to its identity, see
+                `artemis.engine.dedup.field_key`
+            names: Source names for stats and logs; class names, numbered
+                for duplicates (`Name#2`), by default
+            ttl: Seconds an identity is remembered after its first arrival
+            maxsize: Maximum number of remembered identities
+            capacity: Maximum events buffered between the sources and the engine
+            min_restart_delay: Initial delay before restarting a failed source
+            max_restart_delay: Upper bound of the source restart backoff
+            metrics: Registry to publish `artemis_race_events_total` and
+                `artemis_race_wins_total` per source in, if given; normalize
+                failures are counted in `artemis_errors_total`
+        """
+        if names is None:
+            names = []
+            for source in sources:
+                name = source.__class__.__name__
+                count = sum(1 for other in names if other.split("#")[0] == name)
+                names.append(f"{name}#{count + 1}" if count else name)
+        if len(names) != len(sources):
+            raise ValueError("names must match sources")
+        self.sources: List[Tuple[str, Collector]] = list(zip(names, sources))
+        self.key = key
+        self.capacity = capacity
+        self.min_restart_delay = min_restart_delay
+        self.max_restart_delay = max_restart_delay
+        # identity -> (winning source, arrival time in ns, sources seen so far)
+        self.first_seen: TTLCache[Tuple[str, int, Set[str]]] = TTLCache(maxsize, ttl)
+        self.source_stats: Dict[str, SourceStats] = {name: SourceStats() for name in names}
+        self.metrics = metrics
+        if metrics is not None:
+            metrics.counter(
+                "artemis_race_events_total", "Events delivered by each raced source", ("source",),
+                callback=lambda: [((name,), stats.events) for name, stats in self.source_stats.items()],
+            )
+            metrics.counter(
+                "artemis_race_wins_total", "Events each raced source delivered first", ("source",),
+                callback=lambda: [((name,), stats.wins) for name, stats in self.source_stats.items()],
+            )
+
+    def start(self, timeout: Optional[int] = None) -> None:
+        for _, source in self.sources:
+            source.start(timeout)
+
+    async def events(self) -> AsyncIterator[Event]:
+        queue: asyncio.Queue = asyncio.Queue(self.capacity)
+        tasks = [
+            asyncio.create_task(self._run_source(name, source, queue), name=f"race-{name}")
+            for name, source in self.sources
+        ]
+        running = len(tasks)
+        try:
+            while running:
+                event = await queue.get()
+                if event is _DONE:
+                    running -= 1
+                    continue
+                yield event
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def normalize(self, raw: Union[Event, Mapping[str, Any]]) -> Optional[Event]:
+        # Sources normalize their own payloads before the race
+        return to_event(raw)
+
+    async def _run_source(self, name: str, source: Collector, queue: asyncio.Queue) -> None:
+        """Feed one source's first arrivals into the queue, restarting it on errors."""
+        restart_delay = self.min_restart_delay
+        stats = self.source_stats[name]
+        errors = None
+        if self.metrics is not None:
+            errors = self.metrics.counter(
+                "artemis_errors_total", "Errors raised by components", ("component", "name")
+            ).labels("collector", name)
+        while True:
+            try:
+                async for raw in source.events():
+                    restart_delay = self.min_restart_delay
+                    try:
+                        event = source.normalize(raw)
+                    except Exception as e:
+                        # Drop the malformed payload without reconnecting the source
+                        stats.errors += 1
+                        if errors is not None:
+                            errors.inc()
+                        _normalize_log.error("Raced source {} failed to normalize {!r}: {!r}", name, raw, e)
+                        continue
+                    if event is not None and self.arrive(name, event):
+                        await queue.put(event)
+                logger.info("Raced source {} stream finished", name)
+                await queue.put(_DONE)
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Error in raced source {}: {}, restarting in {:.1f}s", name, e, restart_delay)
+                await asyncio.sleep(restart_delay)
+                restart_delay = min(restart_delay * 2, self.max_restart_delay)
+
+    def arrive(self, source: str, event: Event) -> bool:
+        """
+        Record the arrival of an event from a source.
+
+        Returns:
+            True if this is the first copy and should be emitted
+        """
+        now = time.monotonic_ns()
+        stats = self.source_stats[source]
+        stats.events += 1
+        identity = self.key(event)
+        if identity is None:
+            return True
+        first = self.first_seen.get(identity)
+        if first is None:
+            self.first_seen.set(identity, (source, now, {source}))
+            return True
+        winner, arrived_ns, seen = first
+        if source in seen:
+            # A repeat from the same source, not part of the race
+            return False
+        delay = now - arrived_ns
+        if len(seen) == 1:
+            # The winner's lead is measured against the runner-up
+            winner_stats = self.source_stats[winner]
+            winner_stats.wins += 1
+            winner_stats.lead.record(delay)
+        seen.add(source)
+        stats.losses += 1
+        stats.lag.record(delay)
+        return False
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Return the race results per source, see SourceStats.summary()."""
+        return {name: stats.summary() for name, stats in self.source_stats.items()}
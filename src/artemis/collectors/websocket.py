@@ -0,0 +1,167 @@
+"""
+Native asyncio websocket collector.
+
+Runs the websocket client on the engine's event loop with aiohttp, so
+messages go from the socket to the engine channel without crossing a thread
+or an intermediate queue. One connection carries any number of topic
+subscriptions; heartbeats, stale-connection detection and reconnects with
+backoff are handled here, venue specifics in a few small hooks.
+"""
+
+import asyncio
+import json
+import random
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Optional, Sequence
+
+import aiohttp
+
+from ..http import SessionRegistry, get_sessions
+from ..types import Collector
+from ..utils.log import LogSampler, logger
+
+try:
+    import orjson
+
+    _loads: Callable[..., Any] = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+_message_log = LogSampler(interval=1.0)
+
+
+class WebSocketCollector(Collector):
+    """
+    Push-style collector over one websocket connection.
+
+    Subclasses describe the venue by overriding:
+    - `subscribe_message(topic)`: the message subscribing to a topic
+    - `handle_control(ws, message)`: answer pings and consume acks; return
+      True for messages that carry no events
+    - `decode(message)`: the raw payloads carried by a data message
+    - `normalize(raw)`: map a payload to an Event, as for any collector
+
+    The connection is opened when the engine starts iterating `events()`.
+    When the socket closes, errors, or is silent for `receive_timeout`
+    seconds, it is reopened after an exponential backoff with jitter and all
+    topics are subscribed again.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        topics: Sequence[str] = (),
+        heartbeat: Optional[float] = 10.0,
+        receive_timeout: Optional[float] = 60.0,
+        min_reconnect_delay: float = 0.1,
+        max_reconnect_delay: float = 30.0,
+        sessions: Optional[SessionRegistry] = None,
+        session_name: str = "websocket",
+    ):
+        """
+        Initialize the collector.
+
+        Args:
+            url: Websocket URL
+            topics: Topics subscribed on every connect
+            heartbeat: Interval of protocol-level ping frames, in seconds;
+                the connection is closed if a pong does not arrive in time.
+                None disables them
+            receive_timeout: Reconnect if no message arrives for this many
+                seconds; None waits indefinitely
+            min_reconnect_delay: Initial delay before reconnecting
+            max_reconnect_delay: Upper bound of the reconnect backoff
+            sessions: Session registry providing the aiohttp session; the
+                process-wide registry if None
+            session_name: Name of the session in the registry
+        """
+        self.url = url
+        self.topics = list(topics)
+        self.heartbeat = heartbeat
+        self.receive_timeout = receive_timeout
+        self.min_reconnect_delay = min_reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.sessions = sessions
+        self.session_name = session_name
+        self.ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        # Monotonic time of the last message of any kind, see live()
+        self.last_message_at = 0.0
+        self.connects = 0
+
+    def start(self, timeout: Optional[int] = None) -> None:
+        # The connection is opened by events(), on the engine's loop
+        pass
+
+    def subscribe_message(self, topic: str) -> Dict[str, Any]:
+        """Return the message subscribing to `topic`."""
+        return {"event": "subscribe", "topic": topic}
+
+    async def handle_control(self, ws: aiohttp.ClientWebSocketResponse, message: Any) -> bool:
+        """
+        Handle a control message such as an application-level ping.
+
+        Returns:
+            True if the message was consumed and carries no events
+        """
+        return False
+
+    def decode(self, message: Any) -> Iterable[Any]:
+        """Return the raw payloads of a decoded data message."""
+        return (message,)
+
+    async def subscribe(self, topic: str) -> None:
+        """Subscribe to another topic, now if connected and on every reconnect."""
+        if topic not in self.topics:
+            self.topics.append(topic)
+        if self.ws is not None and not self.ws.closed:
+            await self.ws.send_str(json.dumps(self.subscribe_message(topic)))
+
+    def live(self, max_age: float = 30.0) -> bool:
+        """True if any message arrived within the last `max_age` seconds."""
+        return time.monotonic() - self.last_message_at < max_age
+
+    async def events(self) -> AsyncIterator[Any]:
+        delay = self.min_reconnect_delay
+        while True:
+            connects = self.connects
+            try:
+                async for raw in self._connection():
+                    yield raw
+                logger.warning("Websocket {} closed, reconnecting", self.url)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Websocket {} failed: {!r}, reconnecting", self.url, e)
+            if self.connects != connects:
+                # The last attempt got through, start the backoff over
+                delay = self.min_reconnect_delay
+            await asyncio.sleep(delay * random.uniform(0.8, 1.2))
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def _connection(self) -> AsyncIterator[Any]:
+        """Connect, subscribe, and yield payloads until the connection ends."""
+        session = (self.sessions or get_sessions()).session(self.session_name)
+        async with session.ws_connect(self.url, heartbeat=self.heartbeat, autoping=True) as ws:
+            self.ws = ws
+            self.connects += 1
+            logger.info("Websocket {} connected, subscribing to {}", self.url, self.topics)
+            try:
+                for topic in self.topics:
+                    await ws.send_str(json.dumps(self.subscribe_message(topic)))
+                while True:
+                    msg = await ws.receive(timeout=self.receive_timeout)
+                    if msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                        self.last_message_at = time.monotonic()
+                        message = _loads(msg.data)
+                        _message_log.debug("websocket message: {}", message)
+                        if await self.handle_control(ws, message):
+                            continue
+                        for raw in self.decode(message):
+                            yield raw
+                    elif msg.type == aiohttp.WSMsgType.ERROR:
+                        raise ws.exception() or aiohttp.ClientError("websocket error")
+                    else:
+                        # CLOSE, CLOSING, CLOSED
+                        return
+            finally:
+                self.ws = None
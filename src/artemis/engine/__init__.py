@@ -1,3 +1,9 @@
+from .broadcast import BroadcastQueue
+from .channel import Channel, ConflatingChannel
 from .core import Engine
+from .dedup import Deduplicator, field_key
+from .lanes import ExecutorLane
+from .process import ProcessStrategyRunner
+from .warmup import ComponentStatus
 
-__all__ = ["Engine"]
+__all__ = ["Engine", "BroadcastQueue", "Channel", "ConflatingChannel", "ExecutorLane", "ProcessStrategyRunner", "ComponentStatus", "Deduplicator", "field_key"]
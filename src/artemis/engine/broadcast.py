@@ -0,0 +1,82 @@
+"""
+Broadcast fan-out for the Artemis engine.
+
+A BroadcastQueue hands every published item to a set of subscriber queues.
+The engine gives each strategy its own bounded inbox this way, so a slow
+strategy only falls behind on its own inbox instead of pacing everyone else.
+"""
+
+import asyncio
+from typing import Any, Iterable, List, Optional, TypeVar
+
+from ..types import OverflowPolicy
+from .channel import Channel
+
+Q = TypeVar("Q", bound=asyncio.Queue)
+
+
+class BroadcastQueue:
+    """
+    Fan items out to per-subscriber bounded queues.
+
+    Unlike a single shared queue, every subscriber consumes at its own pace.
+    Publishing only waits when a subscriber's queue is full and its overload
+    policy is OverflowPolicy.BLOCK.
+    """
+
+    def __init__(self):
+        """Initialize an empty broadcast queue."""
+        self.subscribers: List[asyncio.Queue] = []
+
+    def subscribe(
+        self,
+        capacity: int = 0,
+        policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        sample_rate: int = 10,
+        name: str = "",
+    ) -> Channel:
+        """
+        Create a new subscriber queue.
+
+        Args:
+            capacity: Maximum number of pending items, 0 for unbounded
+            policy: Overload policy of the subscriber queue
+            sample_rate: Sampling rate for OverflowPolicy.SAMPLE
+            name: Channel name used in logs and stats
+
+        Returns:
+            The channel that will receive published items
+        """
+        return self.attach(Channel(capacity, policy, sample_rate, name))
+
+    def attach(self, subscriber: Q) -> Q:
+        """
+        Register an existing queue (e.g. a ConflatingChannel) as a subscriber.
+
+        Args:
+            subscriber: The queue that will receive published items
+
+        Returns:
+            The same queue
+        """
+        self.subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: asyncio.Queue) -> None:
+        """Stop delivering items to a subscriber queue."""
+        self.subscribers.remove(subscriber)
+
+    async def publish(self, item: Any, subscribers: Optional[Iterable[asyncio.Queue]] = None) -> None:
+        """
+        Deliver an item to subscriber queues.
+
+        Args:
+            item: The item to deliver
+            subscribers: Subset of subscriber queues to deliver to; all
+                subscribers when omitted
+        """
+        for subscriber in self.subscribers if subscribers is None else subscribers:
+            if subscriber.full():
+                await subscriber.put(item)
+            else:
+                subscriber.put_nowait(item)
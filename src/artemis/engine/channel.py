@@ -0,0 +1,184 @@
+"""
+Bounded engine channels with explicit overload policies.
+
+A Channel is an asyncio.Queue that decides what to shed when it is full
+instead of always blocking the producer, and counts what it dropped. A
+ConflatingChannel additionally keeps only the latest pending event per
+(event_type, symbol) for market data that is superseded by newer values.
+"""
+
+import asyncio
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable
+
+from ..types import OverflowPolicy
+from ..utils.log import logger
+
+
+class Channel(asyncio.Queue):
+    """
+    Bounded queue with a configurable OverflowPolicy and drop counters.
+
+    With OverflowPolicy.BLOCK it behaves exactly like asyncio.Queue. The
+    other policies never block the producer; shed items are counted in
+    `dropped`.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        sample_rate: int = 10,
+        name: str = "",
+    ):
+        """
+        Initialize the channel.
+
+        Args:
+            maxsize: Maximum number of queued items, 0 for unbounded
+            policy: What to do with new items while the channel is full
+            sample_rate: With OverflowPolicy.SAMPLE, admit one in this many
+                items while full
+            name: Channel name used in logs and stats
+        """
+        super().__init__(maxsize)
+        self.policy = OverflowPolicy(policy)
+        self.sample_rate = max(1, sample_rate)
+        self.name = name
+        self.accepted = 0
+        self.dropped = 0
+        self._overflowed = 0
+
+    async def put(self, item: Any) -> None:
+        """Put an item, waiting for space only with OverflowPolicy.BLOCK."""
+        if self.policy == OverflowPolicy.BLOCK:
+            # asyncio.Queue.put() finishes through put_nowait(), which counts it
+            await super().put(item)
+            return
+        self.put_nowait(item)
+
+    def put_nowait(self, item: Any) -> None:
+        """Put an item without waiting, applying the overload policy if full."""
+        if self.full() and self.policy != OverflowPolicy.BLOCK:
+            if self.policy == OverflowPolicy.DROP_NEWEST:
+                self._drop()
+                return
+            if self.policy == OverflowPolicy.SAMPLE:
+                self._overflowed += 1
+                if self._overflowed % self.sample_rate:
+                    self._drop()
+                    return
+            # DROP_OLDEST, or a sampled item: evict the head to make room
+            self.get_nowait()
+            self.task_done()
+            self._drop()
+        super().put_nowait(item)
+        self.accepted += 1
+
+    def done(self, count: int = 1) -> None:
+        """Mark `count` consumed items as fully processed (batched task_done)."""
+        for _ in range(count):
+            self.task_done()
+
+    def _drop(self) -> None:
+        """Count a shed item, warning once per channel."""
+        self.dropped += 1
+        if self.dropped == 1:
+            logger.warning("Channel {} is full, shedding items ({})", self.name or id(self), self.policy.value)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of the channel's size and counters."""
+        return {
+            "size": self.qsize(),
+            "capacity": self.maxsize,
+            "policy": self.policy.value,
+            "accepted": self.accepted,
+            "dropped": self.dropped,
+        }
+
+
+class ConflatingChannel(Channel):
+    """
+    Channel that keeps at most one pending event per (event_type, symbol).
+
+    For event types in `conflated_event_types` (typically TICK and
+    ORDER_BOOK), a new event replaces the pending event with the same key in
+    place, keeping its position in the queue. A consumer that falls behind
+    therefore always sees the freshest state, and queue memory is bounded by
+    the number of symbols rather than the message rate. Other events, and
+    events without a symbol, are queued normally.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        sample_rate: int = 10,
+        name: str = "",
+        conflated_event_types: Iterable[Any] = (),
+    ):
+        """
+        Initialize the channel.
+
+        Args:
+            maxsize: Maximum number of queued items, 0 for unbounded
+            policy: What to do with new items while the channel is full
+            sample_rate: With OverflowPolicy.SAMPLE, admit one in this many
+                items while full
+            name: Channel name used in logs and stats
+            conflated_event_types: Event types to conflate per symbol
+        """
+        super().__init__(maxsize, policy, sample_rate, name)
+        self.conflated_event_types = frozenset(conflated_event_types)
+        self.conflated = 0
+        self._sequence = 0
+
+    def _init(self, maxsize: int) -> None:
+        # Pending items keyed by conflation key, in arrival order of the key
+        self._queue: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def _key(self, item: Any) -> Hashable:
+        """Return the conflation key of an item, unique if it is not conflated."""
+        event_type = getattr(item, "event_type", None)
+        symbol = getattr(item, "symbol", None)
+        if symbol is not None and event_type in self.conflated_event_types:
+            return (event_type, symbol)
+        self._sequence += 1
+        return self._sequence
+
+    def _put(self, item: Any) -> None:
+        self._queue[self._key(item)] = item
+
+    def _get(self) -> Any:
+        return self._queue.popitem(last=False)[1]
+
+    def _replace(self, item: Any) -> bool:
+        """Overwrite a pending item with the same key; return True if replaced."""
+        event_type = getattr(item, "event_type", None)
+        symbol = getattr(item, "symbol", None)
+        if symbol is None or event_type not in self.conflated_event_types:
+            return False
+        key = (event_type, symbol)
+        if key not in self._queue:
+            return False
+        self._queue[key] = item
+        self.conflated += 1
+        return True
+
+    async def put(self, item: Any) -> None:
+        """Put an item, overwriting a pending item with the same key."""
+        if self._replace(item):
+            return
+        await super().put(item)
+
+    def put_nowait(self, item: Any) -> None:
+        """Put an item without waiting, overwriting a pending item with the same key."""
+        if self._replace(item):
+            return
+        super().put_nowait(item)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of the channel's size and counters."""
+        stats = super().stats()
+        stats["conflated"] = self.conflated
+        return stats
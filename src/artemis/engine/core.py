@@ -6,10 +6,30 @@ interactions between collectors, strategies, and executors.
 """
 
 import asyncio
-from typing import List
+import functools
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
 
-from ..types import Collector, Executor, Strategy
-from ..utils.log import logger
+from ..clock import Clock, get_clock, set_clock
+from ..http import SessionRegistry, set_sessions
+from ..journal import Journal
+from ..metrics import MetricsRegistry
+from ..tracing import LatencyTracker, Trace
+from ..types import Collector, EngineMode, Event, Executor, OverflowPolicy, Strategy, poll_events, to_action
+from ..utils.log import LogSampler, logger
+from .broadcast import BroadcastQueue
+from .channel import Channel, ConflatingChannel
+from .dedup import Deduplicator, EventKey
+from .lanes import ExecutorLane
+from .process import ProcessStrategyRunner
+from .warmup import ComponentStatus, sync_component
+
+
+# Per-event and per-batch debug logs, rate-limited so DEBUG level stays usable under load
+_event_log = LogSampler(interval=1.0)
+_batch_log = LogSampler(interval=1.0)
+_duplicate_log = LogSampler(interval=1.0)
+_normalize_log = LogSampler(interval=1.0)
 
 
 class Engine:
@@ -20,14 +40,96 @@ class Engine:
     1. Collector loop: Gathers events and queues them
     2. Strategy loop: Processes events and generates actions
     3. Executor loop: Executes actions on external systems
+    
+    In EngineMode.EVENT (the default) every collector runs in its own
+    supervised task that forwards events straight into the event queue. A
+    dispatcher fans events out to a long-lived worker per strategy, each with
+    its own bounded inbox, so a slow strategy only lags itself. Actions are
+    fanned out the same way to one ExecutorLane per executor. All loops
+    block on their queues and wake as soon as an item arrives. EngineMode.THROTTLED keeps
+    the original behaviour of handling at most one item per stage every
+    `throttle_interval` seconds.
     """
 
     def __init__(
         self,
         event_channel_capacity: int = 512,
         action_channel_capacity: int = 512,
+        mode: EngineMode = EngineMode.EVENT,
+        throttle_interval: float = 0.1,
+        min_poll_interval: float = 0.001,
+        max_poll_interval: float = 0.05,
+        min_restart_delay: float = 0.5,
+        max_restart_delay: float = 30.0,
+        max_batch_size: int = 64,
+        max_batch_delay: float = 0.0,
+        strategy_inbox_capacity: int = 512,
+        executor_inbox_capacity: int = 512,
+        event_channel_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        action_channel_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        inbox_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        sample_rate: int = 10,
+        conflated_event_types: Iterable[Any] = (),
+        process_start_method: Optional[str] = None,
+        clock: Optional[Clock] = None,
+        journal: Optional[Journal] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        trace_latency: bool = False,
+        sync_timeout: Optional[float] = 30.0,
+        sessions: Optional[SessionRegistry] = None,
+        dedup_key: Optional[EventKey] = None,
+        dedup_ttl: float = 300.0,
+        dedup_maxsize: int = 100_000,
     ):
-        """Initialize the engine with configurable queue capacities."""
+        """
+        Initialize the engine.
+        
+        Args:
+            event_channel_capacity: Maximum number of queued events
+            action_channel_capacity: Maximum number of queued actions
+            mode: Scheduling mode, see EngineMode
+            throttle_interval: Sleep between items in EngineMode.THROTTLED
+            min_poll_interval: Initial idle backoff when polling collectors
+            max_poll_interval: Upper bound of the idle collector backoff
+            min_restart_delay: Initial delay before restarting a failed collector
+            max_restart_delay: Upper bound of the collector restart backoff
+            max_batch_size: Maximum events/actions handed over per wakeup
+            max_batch_delay: Time to wait for a batch to fill, in seconds;
+                0 hands over whatever is already queued
+            strategy_inbox_capacity: Maximum pending events per strategy worker
+            executor_inbox_capacity: Maximum pending actions per executor lane
+            event_channel_policy: Overload policy of the event queue
+            action_channel_policy: Overload policy of the action queue
+            inbox_policy: Default overload policy of strategy and executor
+                inboxes; components can override it with `inbox_policy`
+            sample_rate: Admit one in this many items on full channels using
+                OverflowPolicy.SAMPLE
+            conflated_event_types: Default event types conflated per symbol in
+                strategy inboxes; strategies can override it with
+                `conflated_event_types`
+            process_start_method: multiprocessing start method for the worker
+                processes of CPU-bound strategies; platform default if None
+            clock: Clock used for engine waits and made the active clock on
+                startup; a VirtualClock makes replays run at full speed
+            journal: Optional Journal that records every normalized event and
+                every queued action; flushed in the background and closed on
+                shutdown
+            metrics: Registry to publish engine metrics in; a private one is
+                created if None. Render it with `engine.metrics.render()`
+            trace_latency: Stamp every event and action with a Trace and
+                aggregate per-path stage latencies in `engine.tracer`
+            sync_timeout: Default warm-up deadline for each component's
+                sync_state, in seconds; components can override it with
+                `sync_timeout`. None waits indefinitely
+            sessions: Shared HTTP session registry, made the process-wide
+                registry on startup and closed on shutdown
+            dedup_key: Maps an event to its identity (see
+                `artemis.engine.dedup.field_key`); later events with an
+                identity already seen are dropped before they are journaled
+                or queued. None disables deduplication
+            dedup_ttl: Seconds an event identity is remembered
+            dedup_maxsize: Maximum number of remembered identities
+        """
         self.collectors: List[Collector] = []
         self.strategies: List[Strategy] = []
         self.executors: List[Executor] = []
@@ -35,10 +137,110 @@ class Engine:
         
         self.event_channel_capacity = event_channel_capacity
         self.action_channel_capacity = action_channel_capacity
+        self.mode = EngineMode(mode)
+        self.throttle_interval = throttle_interval
+        self.min_poll_interval = min_poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.min_restart_delay = min_restart_delay
+        self.max_restart_delay = max_restart_delay
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_batch_delay = max_batch_delay
+        self.strategy_inbox_capacity = strategy_inbox_capacity
+        self.executor_inbox_capacity = executor_inbox_capacity
+        self.inbox_policy = OverflowPolicy(inbox_policy)
+        self.sample_rate = sample_rate
+        self.conflated_event_types = frozenset(conflated_event_types)
+        self.process_start_method = process_start_method
+        self.clock = clock or Clock()
+        self.journal = journal
+        self.sync_timeout = sync_timeout
+        self.sessions = sessions
+        self.dedup: Optional[Deduplicator] = (
+            Deduplicator(dedup_key, dedup_ttl, dedup_maxsize) if dedup_key is not None else None
+        )
+
+        # Readiness report of the last warm-up, see warm_up()
+        self.readiness: List[ComponentStatus] = []
+        self._warm_up_task: Optional[asyncio.Task] = None
         
+        # Routing table: (event_type, symbol) -> subscribed strategies
+        self.routes: Dict[Tuple[Any, Optional[str]], List[Strategy]] = {}
+
+        # Per-strategy inboxes (keyed by id(strategy)), created when strategies start
+        self.broadcast = BroadcastQueue()
+        self.inboxes: Dict[int, Channel] = {}
+
+        # Worker processes of CPU-bound strategies (keyed by id(strategy))
+        self.process_runners: Dict[int, ProcessStrategyRunner] = {}
+
+        # Per-executor lanes, created when executors start
+        self.action_broadcast = BroadcastQueue()
+        self.lanes: List[ExecutorLane] = []
+
         # Create async queues for event and action processing
-        self.event_queue: asyncio.Queue = asyncio.Queue(self.event_channel_capacity)
-        self.action_queue: asyncio.Queue = asyncio.Queue(self.action_channel_capacity)
+        self.event_queue = Channel(self.event_channel_capacity, event_channel_policy, sample_rate, "events")
+        self.action_queue = Channel(self.action_channel_capacity, action_channel_policy, sample_rate, "actions")
+
+        # Every channel by name, for stats
+        self.channels: Dict[str, Channel] = {
+            "events": self.event_queue,
+            "actions": self.action_queue,
+        }
+
+        # Counters and histograms are updated in place; gauges are computed on scrape
+        self.metrics = metrics or MetricsRegistry()
+        self.collected_events = self.metrics.counter(
+            "artemis_collector_events_total", "Events received from each collector", ("collector",)
+        )
+        self.processed_events = self.metrics.counter(
+            "artemis_strategy_events_total", "Events processed by each strategy", ("strategy",)
+        )
+        self.produced_actions = self.metrics.counter(
+            "artemis_strategy_actions_total", "Actions produced by each strategy", ("strategy",)
+        )
+        self.executed_actions = self.metrics.counter(
+            "artemis_executor_actions_total", "Actions handled by each executor", ("executor",)
+        )
+        self.duplicate_events = self.metrics.counter(
+            "artemis_duplicate_events_total", "Duplicate events dropped, by the collector that delivered them late",
+            ("collector",),
+        )
+        self.component_errors = self.metrics.counter(
+            "artemis_errors_total", "Errors raised by components", ("component", "name")
+        )
+        self.processing_time = self.metrics.histogram(
+            "artemis_processing_seconds", "Time spent processing one batch", ("component", "name")
+        )
+        self.metrics.gauge(
+            "artemis_channel_depth", "Items currently queued in each channel", ("channel",),
+            callback=lambda: [((name,), channel.qsize()) for name, channel in self.channels.items()],
+        )
+        self.metrics.gauge(
+            "artemis_channel_capacity", "Capacity of each channel", ("channel",),
+            callback=lambda: [((name,), channel.maxsize) for name, channel in self.channels.items()],
+        )
+        self.metrics.counter(
+            "artemis_channel_dropped_total", "Items dropped by each channel's overload policy", ("channel",),
+            callback=lambda: [((name,), channel.dropped) for name, channel in self.channels.items()],
+        )
+        if journal is not None:
+            self.metrics.counter(
+                "artemis_journal_dropped_total", "Records the journal skipped or failed to write",
+                callback=lambda: [((), journal.dropped)],
+            )
+        self.metrics.gauge(
+            "artemis_component_ready", "1 if the component finished warm-up successfully", ("component", "name"),
+            callback=lambda: [((status.kind, status.name), int(status.ready)) for status in self.readiness],
+        )
+
+        # Per-path stage latencies, fed by traces when executors finish
+        self.tracer: Optional[LatencyTracker] = LatencyTracker() if trace_latency else None
+        if self.tracer is not None:
+            self.metrics.gauge(
+                "artemis_latency_seconds", "Stage latency quantiles per collector/strategy/executor path",
+                ("stage", "collector", "strategy", "executor", "quantile"),
+                callback=self.tracer.samples,
+            )
 
     def add_collector(self, collector: Collector) -> None:
         """Add a collector to the engine."""
@@ -47,102 +249,555 @@ class Engine:
     def add_strategy(self, strategy: Strategy) -> None:
         """Add a strategy to the engine."""
         self.strategies.append(strategy)
+        self.routes.clear()
 
     def add_executor(self, executor: Executor) -> None:
         """Add an executor to the engine."""
         self.executors.append(executor)
 
+    @property
+    def warm(self) -> bool:
+        """True once the warm-up phase has finished."""
+        return self._warm_up_task is not None and self._warm_up_task.done()
+
+    async def warm_up(self) -> List[ComponentStatus]:
+        """
+        Synchronize every strategy and executor concurrently, once.
+        
+        Each `sync_state` runs under its component's deadline (`sync_timeout`,
+        or the engine default). Failures and timeouts are logged and reported
+        but do not stop the engine. Concurrent callers share the same run.
+        
+        Returns:
+            The readiness report, one ComponentStatus per component
+        """
+        if self._warm_up_task is None:
+            self._warm_up_task = asyncio.create_task(self._warm_up(), name="warm-up")
+        return await asyncio.shield(self._warm_up_task)
+
+    async def _warm_up(self) -> List[ComponentStatus]:
+        logger.info("Warming up {} strategies and {} executors...", len(self.strategies), len(self.executors))
+        started = time.perf_counter()
+        jobs = [
+            sync_component(
+                "strategy", strategy, functools.partial(self._sync_strategy, strategy), self._sync_timeout(strategy)
+            )
+            for strategy in self.strategies
+        ] + [
+            sync_component("executor", executor, executor.sync_state, self._sync_timeout(executor))
+            for executor in self.executors
+        ]
+        self.readiness = list(await asyncio.gather(*jobs))
+
+        # Number repeated component classes like channel names: Name, Name#2, ...
+        seen: Dict[Tuple[str, str], int] = {}
+        for status in self.readiness:
+            key = (status.kind, status.name)
+            seen[key] = seen.get(key, 0) + 1
+            if seen[key] > 1:
+                status.name = f"{status.name}#{seen[key]}"
+
+        # Subscriptions may be set up in sync_state, so route afterwards
+        self.routes.clear()
+
+        ready = sum(status.ready for status in self.readiness)
+        logger.info(
+            "Warm-up finished in {:.3f}s: {}/{} components ready",
+            time.perf_counter() - started, ready, len(self.readiness),
+        )
+        for status in self.readiness:
+            if not status.ready:
+                logger.error("Error syncing {} {}: {}", status.kind, status.name, status.error)
+        return self.readiness
+
+    async def _sync_strategy(self, strategy: Strategy) -> None:
+        """Synchronize a strategy, in its worker process if it is CPU-bound."""
+        if not strategy.cpu_bound:
+            await strategy.sync_state()
+            return
+        # State lives in the worker process from here on
+        runner = self.process_runners.get(id(strategy))
+        if runner is None:
+            runner = ProcessStrategyRunner(strategy, self.process_start_method)
+            self.process_runners[id(strategy)] = runner
+        await runner.sync_state()
+
+    def _sync_timeout(self, component: Any) -> Optional[float]:
+        timeout = getattr(component, "sync_timeout", None)
+        return timeout if timeout is not None else self.sync_timeout
+
     async def run_collectors(self) -> None:
-        """Main collector loop."""
-        logger.info(f"Starting {len(self.collectors)} collectors...")
+        """Main collector loop, started once strategies and executors are warm."""
+        await self.warm_up()
+        logger.info("Starting {} collectors...", len(self.collectors))
         
         # Start all collectors
         for collector in self.collectors:
             collector.start(timeout=30)
-        
-        # Main collector event loop
+
+        # One supervised task per collector, so a slow feed only stalls itself.
+        # In EngineMode.THROTTLED pull-style collectors are polled round-robin
+        # and push-style ones are paced by the throttle interval
+        throttle = 0.0
+        pulled: List[Collector] = []
+        pushed = self.collectors
+        if self.mode == EngineMode.THROTTLED:
+            throttle = self.throttle_interval
+            pulled = [collector for collector in self.collectors if self._pull_style(collector)]
+            pushed = [collector for collector in self.collectors if not self._pull_style(collector)]
+        tasks = [
+            asyncio.create_task(
+                self._run_collector(collector, throttle),
+                name=f"collector:{collector.__class__.__name__}",
+            )
+            for collector in pushed
+        ]
+        if pulled:
+            tasks.append(asyncio.create_task(self._poll_collectors(pulled), name="collectors:throttled"))
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _run_collector(self, collector: Collector, throttle: float = 0.0) -> None:
+        """
+        Forward events from one collector, restarting its stream on errors.
+
+        Args:
+            collector: The collector to run
+            throttle: Pause after each forwarded event, in seconds
+        """
+        name = collector.__class__.__name__
+        collected = self.collected_events.labels(name)
+        errors = self.component_errors.labels("collector", name)
+        restart_delay = self.min_restart_delay
         while True:
-            for collector in self.collectors:
+            try:
+                async for raw in self._collector_events(collector):
+                    received_ns = time.monotonic_ns() if self.tracer is not None else 0
+                    restart_delay = self.min_restart_delay
+                    try:
+                        event = collector.normalize(raw)
+                    except Exception as e:
+                        # Drop the malformed payload, the stream itself is fine
+                        errors.inc()
+                        _normalize_log.error("Collector {} failed to normalize {!r}: {!r}", name, raw, e)
+                        continue
+                    if event is None:
+                        continue
+                    collected.inc()
+                    _event_log.debug("Engine received collector event: {}", event)
+                    await self._queue_event(event, name, received_ns)
+                    if throttle:
+                        await self.clock.sleep(throttle)
+                logger.info("Collector {} stream finished", name)
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                errors.inc()
+                logger.error("Error in collector {}: {}, restarting in {:.1f}s", name, e, restart_delay)
+                await self.clock.sleep(restart_delay)
+                restart_delay = min(restart_delay * 2, self.max_restart_delay)
+
+    async def _queue_event(self, event: Event, collector: str, received_ns: int) -> None:
+        """Deduplicate, trace and journal a normalized event and put it on the event queue."""
+        if self.dedup is not None and not self.dedup.admit(event):
+            self.duplicate_events.labels(collector).inc()
+            _duplicate_log.debug("Dropped duplicate event from {}: {}", collector, event)
+            return
+        trace = None
+        if self.tracer is not None:
+            trace = Trace(collector, received_ns)
+            object.__setattr__(event, "trace", trace)
+        if self.journal is not None:
+            self.journal.append_event(event)
+        await self.event_queue.put(event)
+        if trace is not None:
+            trace.enqueued_ns = time.monotonic_ns()
+
+    @staticmethod
+    def _pull_style(collector: Collector) -> bool:
+        """True if the collector implements get_event_stream() rather than events()."""
+        return type(collector).events is Collector.events
+
+    def _collector_events(self, collector: Collector) -> AsyncIterator[Any]:
+        """Return the event iterator for a collector, adapting pull-style ones."""
+        if self._pull_style(collector):
+            return poll_events(collector, self.min_poll_interval, self.max_poll_interval)
+        return collector.events()
+
+    async def _poll_collectors(self, collectors: List[Collector]) -> None:
+        """Poll pull-style collectors round-robin (EngineMode.THROTTLED)."""
+        while True:
+            for collector in collectors:
                 try:
-                    event = await collector.get_event_stream()
+                    raw = await collector.get_event_stream()
+                    received_ns = time.monotonic_ns() if self.tracer is not None else 0
+                    event = collector.normalize(raw) if raw is not None else None
                     if event is not None:
-                        logger.debug("Engine received collector event: {}", event)
-                        await self.event_queue.put(event)
+                        self.collected_events.labels(collector.__class__.__name__).inc()
+                        _event_log.debug("Engine received collector event: {}", event)
+                        await self._queue_event(event, collector.__class__.__name__, received_ns)
                 except Exception as e:
-                    logger.error(f"Error in collector {collector.__class__.__name__}: {e}")
-            await asyncio.sleep(0.1)
+                    self.component_errors.labels("collector", collector.__class__.__name__).inc()
+                    logger.error("Error in collector {}: {}", collector.__class__.__name__, e)
+            await self.clock.sleep(self.throttle_interval)
 
     async def run_strategies(self) -> None:
         """Main strategy loop."""
-        logger.info(f"Starting {len(self.strategies)} strategies...")
-        
-        # Sync state for all strategies
+        try:
+            await self.warm_up()
+            logger.info("Starting {} strategies...", len(self.strategies))
+            await self._run_strategy_loops()
+        finally:
+            self._close_process_runners()
+
+    async def _run_strategy_loops(self) -> None:
+        """Dispatch events to strategies until cancelled."""
+        if self.mode == EngineMode.THROTTLED:
+            # Main strategy processing loop
+            while True:
+                events = await self._next_batch(self.event_queue)
+                if events:
+                    _batch_log.debug("Engine processing {} strategy events", len(events))
+                    await self._fan_out(self._process_events, self._route_events(events))
+                    self.event_queue.done(len(events))
+
+        # One long-lived worker per strategy, each draining its own inbox
+        self.broadcast = BroadcastQueue()
+        self.inboxes = {}
+        workers = []
         for strategy in self.strategies:
+            inbox = self.broadcast.attach(self._strategy_inbox(strategy))
+            self.channels[inbox.name] = inbox
+            self.inboxes[id(strategy)] = inbox
+            workers.append(
+                asyncio.create_task(
+                    self._run_strategy(strategy, inbox),
+                    name=f"strategy:{strategy.__class__.__name__}",
+                )
+            )
+        try:
+            await self._dispatch_events()
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+    async def _dispatch_events(self) -> None:
+        """Fan events out from the event queue to subscribed strategy inboxes."""
+        inbox_routes: Dict[Tuple[Any, Optional[str]], List[Channel]] = {}
+        while True:
+            events = await self._next_batch(self.event_queue)
+            _batch_log.debug("Engine dispatching {} strategy events", len(events))
+            for event in events:
+                key = (event.event_type, event.symbol)
+                inboxes = inbox_routes.get(key)
+                if inboxes is None:
+                    inboxes = [self.inboxes[id(s)] for s in self._subscribers(*key)]
+                    inbox_routes[key] = inboxes
+                await self.broadcast.publish(event, inboxes)
+            self.event_queue.done(len(events))
+
+    async def _run_strategy(self, strategy: Strategy, inbox: Channel) -> None:
+        """Worker loop for a single strategy."""
+        while True:
+            events = await self._next_batch(inbox)
+            try:
+                await self._process_events(strategy, events)
+            finally:
+                inbox.done(len(events))
+
+    def _subscribers(self, event_type: Any, symbol: Optional[str]) -> List[Strategy]:
+        """Return the strategies subscribed to an (event_type, symbol) pair."""
+        key = (event_type, symbol)
+        subscribers = self.routes.get(key)
+        if subscribers is None:
+            subscribers = [s for s in self.strategies if s.accepts(event_type, symbol)]
+            self.routes[key] = subscribers
+        return subscribers
+
+    def _route_events(self, events: List[Any]) -> List[Tuple[Strategy, List[Any]]]:
+        """Split a batch of events into per-strategy batches by subscription."""
+        if len(self.strategies) == 1:
+            strategy = self.strategies[0]
+            events = [e for e in events if strategy in self._subscribers(e.event_type, e.symbol)]
+            return [(strategy, events)] if events else []
+        batches: Dict[int, Tuple[Strategy, List[Any]]] = {}
+        for event in events:
+            for strategy in self._subscribers(event.event_type, event.symbol):
+                entry = batches.get(id(strategy))
+                if entry is None:
+                    batches[id(strategy)] = (strategy, [event])
+                else:
+                    entry[1].append(event)
+        return list(batches.values())
+
+    def _close_process_runners(self) -> None:
+        """Stop the worker processes of CPU-bound strategies."""
+        for runner in self.process_runners.values():
+            runner.close()
+        self.process_runners.clear()
+
+    async def _process_events(self, strategy: Strategy, events: List[Any]) -> None:
+        """Run one strategy over a batch of events and queue its actions."""
+        name = strategy.__class__.__name__
+        runner = self.process_runners.get(id(strategy))
+        tracing = self.tracer is not None
+        started = time.perf_counter()
+        produced = 0
+        if runner is None and type(strategy).process_events is Strategy.process_events:
+            # Per-event calls keep one failing event from discarding the batch
+            for event in events:
+                try:
+                    start_ns = time.monotonic_ns() if tracing else 0
+                    action = await strategy.process_event(event)
+                    if action is not None:
+                        produced += 1
+                        end_ns = time.monotonic_ns() if tracing else 0
+                        await self._queue_action(action, event.trace, name, start_ns, end_ns)
+                except Exception as e:
+                    self.component_errors.labels("strategy", name).inc()
+                    logger.error("Error in strategy {}: {}", name, e)
+        else:
             try:
-                await strategy.sync_state()
+                start_ns = time.monotonic_ns() if tracing else 0
+                actions = await (runner or strategy).process_events(events)
+                end_ns = time.monotonic_ns() if tracing else 0
+                # Batch actions are attributed to the earliest event of the batch
+                source = None
+                if tracing:
+                    traces = [event.trace for event in events if event.trace is not None]
+                    source = min(traces, key=lambda trace: trace.received_ns, default=None)
+                for action in actions or ():
+                    if action is not None:
+                        produced += 1
+                        await self._queue_action(action, source, name, start_ns, end_ns)
             except Exception as e:
-                logger.error(f"Error syncing strategy {strategy.__class__.__name__}: {e}")
+                self.component_errors.labels("strategy", name).inc()
+                logger.error("Error in strategy {}: {}", name, e)
+        self.processing_time.labels("strategy", name).observe(time.perf_counter() - started)
+        self.processed_events.labels(name).inc(len(events))
+        if produced:
+            self.produced_actions.labels(name).inc(produced)
 
-        # Main strategy processing loop
-        while True:
-            if not self.event_queue.empty():
-                event = await self.event_queue.get()
-                if event is not None:
-                    logger.debug("Engine processing strategy event: {}", event)
-
-                    # Process event with all strategies concurrently
-                    async def process_event(strategy: Strategy, event):
-                        try:
-                            action = await strategy.process_event(event)
-                            if action is not None:
-                                await self.action_queue.put(action)
-                        except Exception as e:
-                            logger.error(f"Error in strategy {strategy.__class__.__name__}: {e}")
-
-                    tasks = []
-                    for strategy in self.strategies:
-                        tasks.append(asyncio.create_task(process_event(strategy, event)))
-                    
-                    if tasks:
-                        await asyncio.gather(*tasks, return_exceptions=True)
-            await asyncio.sleep(0.1)
+    async def _queue_action(
+        self,
+        action: Any,
+        source: Optional[Trace] = None,
+        strategy: str = "",
+        start_ns: int = 0,
+        end_ns: int = 0,
+    ) -> None:
+        """Trace and journal an action produced by a strategy and put it on the action queue."""
+        action = to_action(action)
+        trace = None
+        if source is not None:
+            trace = source.derive(strategy, start_ns, end_ns)
+            object.__setattr__(action, "trace", trace)
+        if self.journal is not None:
+            self.journal.append_action(action)
+        await self.action_queue.put(action)
+        if trace is not None:
+            trace.action_enqueued_ns = time.monotonic_ns()
 
     async def run_executors(self) -> None:
         """Main executor loop."""
-        logger.info(f"Starting {len(self.executors)} executors...")
-        
-        # Sync state for all executors
+        await self.warm_up()
+        logger.info("Starting {} executors...", len(self.executors))
+
+        if self.mode == EngineMode.THROTTLED:
+            # Main executor processing loop
+            while True:
+                actions = await self._next_batch(self.action_queue)
+                if actions:
+                    _batch_log.debug("Engine executing {} actions", len(actions))
+                    await self._fan_out(self._execute_actions, [(e, actions) for e in self.executors])
+                    self.action_queue.done(len(actions))
+
+        # One independent lane per executor
+        self.action_broadcast = BroadcastQueue()
+        self.lanes = []
+        workers = []
         for executor in self.executors:
+            inbox = self.action_broadcast.subscribe(
+                self.executor_inbox_capacity,
+                executor.inbox_policy or self.inbox_policy,
+                self.sample_rate,
+                self._channel_name("executor", executor),
+            )
+            self.channels[inbox.name] = inbox
+            lane = ExecutorLane(executor, inbox, self._execute_actions, self._next_batch)
+            self.lanes.append(lane)
+            workers.append(
+                asyncio.create_task(lane.run(), name=f"executor:{executor.__class__.__name__}")
+            )
+        try:
+            while True:
+                actions = await self._next_batch(self.action_queue)
+                _batch_log.debug("Engine dispatching {} actions", len(actions))
+                for action in actions:
+                    await self.action_broadcast.publish(action)
+                self.action_queue.done(len(actions))
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+    async def _execute_actions(self, executor: Executor, actions: List[Any]) -> None:
+        """Run one executor over a batch of actions."""
+        name = executor.__class__.__name__
+        tracer = self.tracer
+        started = time.perf_counter()
+        if type(executor).execute_many is Executor.execute_many:
+            for action in actions:
+                start_ns = time.monotonic_ns() if tracer is not None else 0
+                try:
+                    await executor.execute(action)
+                except Exception as e:
+                    self.component_errors.labels("executor", name).inc()
+                    logger.error("Error in executor {}: {}", name, e)
+                if tracer is not None and action.trace is not None:
+                    tracer.record(action.trace, name, start_ns, time.monotonic_ns())
+        else:
+            start_ns = time.monotonic_ns() if tracer is not None else 0
             try:
-                await executor.sync_state()
+                await executor.execute_many(actions)
             except Exception as e:
-                logger.error(f"Error syncing executor {executor.__class__.__name__}: {e}")
+                self.component_errors.labels("executor", name).inc()
+                logger.error("Error in executor {}: {}", name, e)
+            if tracer is not None:
+                end_ns = time.monotonic_ns()
+                for action in actions:
+                    if action.trace is not None:
+                        tracer.record(action.trace, name, start_ns, end_ns)
+        self.processing_time.labels("executor", name).observe(time.perf_counter() - started)
+        self.executed_actions.labels(name).inc(len(actions))
 
-        # Main executor processing loop
-        while True:
-            if not self.action_queue.empty():
-                action = await self.action_queue.get()
-                if action is not None:
-                    logger.debug("Engine executing action: {}", action)
-
-                    # Execute action with all executors concurrently
-                    async def execute_action(executor: Executor, action):
-                        try:
-                            await executor.execute(action)
-                        except Exception as e:
-                            logger.error(f"Error in executor {executor.__class__.__name__}: {e}")
-
-                    tasks = []
-                    for executor in self.executors:
-                        tasks.append(asyncio.create_task(execute_action(executor, action)))
-                    
-                    if tasks:
-                        await asyncio.gather(*tasks, return_exceptions=True)
-            await asyncio.sleep(0.1)
+    @staticmethod
+    async def _fan_out(handler, batches: List[Tuple[Any, List[Any]]]) -> None:
+        """Hand each component its batch concurrently, one task per component."""
+        if len(batches) == 1:
+            await handler(*batches[0])
+            return
+        tasks = [asyncio.create_task(handler(component, batch)) for component, batch in batches]
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _next_batch(self, queue: asyncio.Queue) -> List[Any]:
+        """
+        Wait for the next batch of items on a queue according to the engine mode.
+        
+        In EngineMode.EVENT this blocks for the first item, then drains up to
+        `max_batch_size` items, waiting at most `max_batch_delay` seconds for
+        stragglers. EngineMode.THROTTLED returns at most one item per call.
+        """
+        item = await self._next_item(queue)
+        if item is None:
+            return []
+        batch = [item]
+        if self.mode == EngineMode.THROTTLED:
+            return batch
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_batch_delay
+        while len(batch) < self.max_batch_size:
+            if not queue.empty():
+                item = queue.get_nowait()
+            else:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            if item is not None:
+                batch.append(item)
+        return batch
+
+    def _strategy_inbox(self, strategy: Strategy) -> Channel:
+        """Create the inbox channel for a strategy worker."""
+        name = self._channel_name("strategy", strategy)
+        policy = strategy.inbox_policy or self.inbox_policy
+        conflated = strategy.conflated_event_types
+        if conflated is None:
+            conflated = self.conflated_event_types
+        if conflated:
+            return ConflatingChannel(self.strategy_inbox_capacity, policy, self.sample_rate, name, conflated)
+        return Channel(self.strategy_inbox_capacity, policy, self.sample_rate, name)
+
+    def _channel_name(self, kind: str, component: Any) -> str:
+        """Return a unique channel name for a component inbox."""
+        name = f"{kind}:{component.__class__.__name__}"
+        if name not in self.channels:
+            return name
+        index = 2
+        while f"{name}#{index}" in self.channels:
+            index += 1
+        return f"{name}#{index}"
+
+    def channel_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return size and drop counters for every engine channel.
+        
+        Returns:
+            Mapping of channel name ("events", "actions", "strategy:<Name>",
+            "executor:<Name>") to its Channel.stats()
+        """
+        return {name: channel.stats() for name, channel in self.channels.items()}
+
+    async def _next_item(self, queue: asyncio.Queue) -> Optional[Any]:
+        """Wait for the next item on a queue according to the engine mode."""
+        if self.mode == EngineMode.THROTTLED:
+            await self.clock.sleep(self.throttle_interval)
+            if queue.empty():
+                return None
+            return queue.get_nowait()
+        return await queue.get()
+
+    async def join(self) -> None:
+        """
+        Wait until every queued event and action has been fully processed.
+        
+        Stages are awaited in pipeline order (events, strategy inboxes,
+        actions, executor inboxes), so once the collectors have stopped this
+        returns only after the last resulting action has been executed.
+        """
+        await self.event_queue.join()
+        for inbox in list(self.inboxes.values()):
+            await inbox.join()
+        await self.action_queue.join()
+        for lane in list(self.lanes):
+            await lane.inbox.join()
+
+    async def run_until_complete(self) -> None:
+        """
+        Run until every collector stream is exhausted, drain all queued work,
+        then shut down.
+        
+        Intended for finite sources such as a ReplayCollector; with live
+        collectors that never finish this behaves like `run()`.
+        """
+        runner = asyncio.create_task(self.run())
+        await asyncio.sleep(0)
+        try:
+            await asyncio.wait([self.tasks[0], runner], return_when=asyncio.FIRST_COMPLETED)
+            if not runner.done():
+                await self.join()
+        finally:
+            await self.shutdown()
+            await asyncio.gather(runner, return_exceptions=True)
 
     async def run(self) -> None:
         """Start the engine and run all components concurrently."""
         logger.info("Starting Artemis Engine...")
+        # Components read the engine's clock while it runs; the process gets
+        # its previous clock back afterwards
+        previous_clock = get_clock()
+        set_clock(self.clock)
+        if self.sessions is not None:
+            set_sessions(self.sessions)
         
         # Create and start all component tasks
         self.tasks = [
@@ -150,6 +805,8 @@ class Engine:
             asyncio.create_task(self.run_strategies()),
             asyncio.create_task(self.run_executors()),
         ]
+        if self.journal is not None:
+            self.tasks.append(asyncio.create_task(self.journal.run(), name="journal"))
         
         try:
             # Run all tasks concurrently
@@ -158,15 +815,19 @@ class Engine:
             logger.info("Received interrupt signal, shutting down...")
             await self.shutdown()
         except Exception as e:
-            logger.error(f"Engine error: {e}")
+            logger.error("Engine error: {}", e)
             await self.shutdown()
             raise
+        finally:
+            set_clock(previous_clock)
 
     async def shutdown(self) -> None:
         """Gracefully shutdown the engine and all components."""
         logger.info("Shutting down Artemis Engine...")
         
         # Cancel all running tasks
+        if self._warm_up_task is not None and not self._warm_up_task.done():
+            self._warm_up_task.cancel()
         for task in self.tasks:
             if not task.done():
                 task.cancel()
@@ -174,5 +835,13 @@ class Engine:
         # Wait for tasks to complete cancellation
         if self.tasks:
             await asyncio.gather(*self.tasks, return_exceptions=True)
+
+        # Write whatever the journal still holds
+        if self.journal is not None:
+            await self.journal.close()
+
+        # Close pooled HTTP connections
+        if self.sessions is not None:
+            await self.sessions.close()
         
         logger.info("Engine shutdown complete.")
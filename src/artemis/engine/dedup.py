@@ -0,0 +1,72 @@
+"""
+Event deduplication for the Artemis engine.
+
+When several collectors deliver the same logical event (e.g. a liquidation
+seen on both the REST and the websocket feed), the engine admits the first
+copy and drops the later ones before they are journaled, queued or handed
+to any strategy. Identities are remembered in a bounded TTL/LRU cache, so
+memory stays flat in long-running processes.
+"""
+
+from typing import Callable, Hashable, Optional
+
+from ..types import Event
+from ..utils.cache import TTLCache
+
+# Maps an event to its identity; None means the event is never deduplicated
+EventKey = Callable[[Event], Optional[Hashable]]
+
+
+def field_key(*fields: str) -> EventKey:
+    """
+    Return an EventKey identifying events by type and the given fields.
+
+    Events missing any of the fields are not deduplicated.
+
+    Args:
+        *fields: Names looked up through the event's mapping view, e.g.
+            "liquidation_id"
+    """
+
+    def key(event: Event) -> Optional[Hashable]:
+        values = []
+        for name in fields:
+            value = event.get(name)
+            if value is None:
+                return None
+            values.append(value)
+        return (event.event_type, *values)
+
+    return key
+
+
+class Deduplicator:
+    """Admits the first event of each identity within a time window."""
+
+    def __init__(self, key: EventKey, ttl: float = 300.0, maxsize: int = 100_000):
+        """
+        Initialize the deduplicator.
+
+        Args:
+            key: Maps an event to its identity, see field_key()
+            ttl: Seconds an identity is remembered
+            maxsize: Maximum number of remembered identities; the least
+                recently seen are forgotten first
+        """
+        self.key = key
+        self.seen: TTLCache[bool] = TTLCache(maxsize, ttl)
+        self.duplicates = 0
+
+    def admit(self, event: Event) -> bool:
+        """Return True for the first copy of an event, False for duplicates."""
+        identity = self.key(event)
+        if identity is None or self.seen.add(identity, True):
+            return True
+        self.duplicates += 1
+        return False
+
+    def forget(self, event: Event) -> None:
+        """Forget an event's identity, so the next copy is admitted again."""
+        identity = self.key(event)
+        if identity is not None:
+            self.seen.pop(identity)
@@ -0,0 +1,114 @@
+"""
+Executor lanes for the Artemis engine.
+
+Every executor gets its own lane: a bounded inbox plus a worker that runs
+the executor with a configurable concurrency limit. Actions that share an
+ordering key (e.g. a symbol or liquidation id) are executed strictly in
+order, while actions with different keys may run in parallel. A slow
+executor such as a webhook notifier therefore never delays an order
+executor in another lane.
+"""
+
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+from ..types import Executor
+from .channel import Channel
+
+BatchHandler = Callable[[Executor, List[Any]], Awaitable[None]]
+BatchSource = Callable[[Channel], Awaitable[List[Any]]]
+
+
+class ExecutorLane:
+    """
+    Independent execution lane for a single executor.
+
+    With `max_concurrency == 1` batches are executed one after another, which
+    preserves the global action order. With a higher limit, each batch is
+    split into groups by `Executor.ordering_key`: groups with the same key
+    are chained so they run in order, and up to `max_concurrency` groups run
+    at once. Actions without a key form their own group each.
+    """
+
+    def __init__(
+        self,
+        executor: Executor,
+        inbox: Channel,
+        handler: BatchHandler,
+        next_batch: BatchSource,
+    ):
+        """
+        Initialize the lane.
+
+        Args:
+            executor: The executor served by this lane
+            inbox: Queue of actions routed to this executor
+            handler: Coroutine that executes a batch of actions
+            next_batch: Coroutine that waits for the next batch from a queue
+        """
+        self.executor = executor
+        self.inbox = inbox
+        self.handler = handler
+        self.next_batch = next_batch
+        self.max_concurrency = max(1, getattr(executor, "max_concurrency", 1))
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.tails: Dict[Hashable, asyncio.Task] = {}
+        self.in_flight: set = set()
+
+    async def run(self) -> None:
+        """Consume the inbox until cancelled."""
+        try:
+            while True:
+                actions = await self.next_batch(self.inbox)
+                if not actions:
+                    continue
+                if self.max_concurrency == 1:
+                    try:
+                        await self.handler(self.executor, actions)
+                    finally:
+                        self.inbox.done(len(actions))
+                    continue
+                for key, group in self._group(actions):
+                    # Admission control: never more than max_concurrency groups in flight
+                    await self.semaphore.acquire()
+                    task = asyncio.create_task(self._run_group(key, group, self.tails.get(key)))
+                    self.in_flight.add(task)
+                    task.add_done_callback(self.in_flight.discard)
+                    if key is not None:
+                        self.tails[key] = task
+                        task.add_done_callback(functools.partial(self._release_tail, key))
+        finally:
+            for task in list(self.in_flight):
+                task.cancel()
+
+    def _group(self, actions: List[Any]) -> List[tuple]:
+        """Split a batch into (key, actions) groups, preserving order within a key."""
+        groups: List[tuple] = []
+        keyed: Dict[Hashable, List[Any]] = {}
+        for action in actions:
+            key = self.executor.ordering_key(action)
+            if key is None:
+                groups.append((None, [action]))
+                continue
+            group = keyed.get(key)
+            if group is None:
+                group = keyed[key] = []
+                groups.append((key, group))
+            group.append(action)
+        return groups
+
+    async def _run_group(self, key: Optional[Hashable], actions: List[Any], previous: Optional[asyncio.Task]) -> None:
+        """Execute one group once the previous group with the same key is done."""
+        try:
+            if previous is not None and not previous.done():
+                await asyncio.wait([previous])
+            await self.handler(self.executor, actions)
+        finally:
+            self.semaphore.release()
+            self.inbox.done(len(actions))
+
+    def _release_tail(self, key: Hashable, task: asyncio.Task) -> None:
+        """Forget the chain for a key once its last group has finished."""
+        if self.tails.get(key) is task:
+            del self.tails[key]
@@ -0,0 +1,104 @@
+"""
+Out-of-process execution for CPU-bound strategies.
+
+A strategy marked with `cpu_bound = True` is moved into a dedicated worker
+process, so heavy computation (book imbalance, fair-value models, ...) no
+longer holds the GIL of the engine loop. Event batches and the resulting
+actions cross the process boundary as one pickled payload per batch.
+"""
+
+import asyncio
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, List, Optional, Tuple
+
+from ..types import Action, Strategy, to_action
+from ..utils.event_loop import new_event_loop
+
+# State of the worker process, set by _init_worker
+_strategy: Optional[Strategy] = None
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _init_worker(payload: bytes) -> None:
+    """Unpickle the strategy and create the worker's event loop (uvloop if installed)."""
+    global _strategy, _loop
+    _strategy = pickle.loads(payload)
+    _loop = new_event_loop()
+    asyncio.set_event_loop(_loop)
+
+
+def _worker() -> Tuple[Strategy, asyncio.AbstractEventLoop]:
+    """Return the worker's strategy and event loop."""
+    if _strategy is None or _loop is None:
+        raise RuntimeError("Strategy worker was not initialized")
+    return _strategy, _loop
+
+
+def _sync_state() -> None:
+    """Run the strategy's sync_state inside the worker process."""
+    strategy, loop = _worker()
+    loop.run_until_complete(strategy.sync_state())
+
+
+def _process_batch(payload: bytes) -> bytes:
+    """Process one pickled batch of events and return the pickled actions."""
+    events = pickle.loads(payload)
+    strategy, loop = _worker()
+    actions = loop.run_until_complete(strategy.process_events(events))
+    return pickle.dumps(
+        [to_action(action) for action in actions or () if action is not None],
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+
+
+class ProcessStrategyRunner:
+    """
+    Run a strategy in a dedicated worker process.
+
+    The strategy is pickled into the worker when the runner is created, and
+    from then on its state lives in that process: `sync_state` and
+    `process_events` execute there. The strategy class must therefore be
+    picklable and importable by the worker.
+    """
+
+    def __init__(self, strategy: Strategy, start_method: Optional[str] = None):
+        """
+        Start the worker process.
+
+        Args:
+            strategy: The CPU-bound strategy to run
+            start_method: multiprocessing start method ("fork", "spawn",
+                "forkserver"); the platform default when omitted
+        """
+        self.strategy = strategy
+        context = multiprocessing.get_context(start_method)
+        self.pool = ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(pickle.dumps(strategy, protocol=pickle.HIGHEST_PROTOCOL),),
+        )
+
+    async def sync_state(self) -> None:
+        """Synchronize the strategy's state inside the worker process."""
+        await asyncio.get_running_loop().run_in_executor(self.pool, _sync_state)
+
+    async def process_events(self, events: List[Any]) -> List[Action]:
+        """
+        Process a batch of events in the worker process.
+
+        Args:
+            events: The events to process
+
+        Returns:
+            The actions produced by the strategy
+        """
+        payload = pickle.dumps(events, protocol=pickle.HIGHEST_PROTOCOL)
+        result = await asyncio.get_running_loop().run_in_executor(self.pool, _process_batch, payload)
+        return pickle.loads(result)
+
+    def close(self) -> None:
+        """Stop the worker process, abandoning pending batches."""
+        self.pool.shutdown(wait=False, cancel_futures=True)
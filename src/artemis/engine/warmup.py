@@ -0,0 +1,65 @@
+"""
+Warm-up phase of the Artemis engine.
+
+Before any event flows, the engine synchronizes every strategy and executor
+concurrently, each bounded by its own deadline. The outcome is a readiness
+report with one ComponentStatus per component; collectors are only started
+once the warm-up has finished.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+
+@dataclass
+class ComponentStatus:
+    """Readiness of one strategy or executor after warm-up."""
+
+    kind: str
+    name: str
+    ready: bool = False
+    elapsed: float = 0.0
+    error: Optional[str] = None
+
+
+async def sync_component(
+    kind: str,
+    component: Any,
+    sync: Callable[[], Awaitable[None]],
+    timeout: Optional[float],
+) -> ComponentStatus:
+    """
+    Run one component's synchronization under a deadline.
+
+    Args:
+        kind: "strategy" or "executor"
+        component: The component being synchronized
+        sync: Coroutine function performing the synchronization
+        timeout: Deadline in seconds; None waits indefinitely
+
+    Returns:
+        The component's status; failures and timeouts are reported, not raised
+    """
+    status = ComponentStatus(kind, component.__class__.__name__)
+    started = time.perf_counter()
+    task = asyncio.ensure_future(sync())
+    try:
+        # Only the deadline expiring is a timeout; a TimeoutError raised by
+        # the component itself is reported as a plain error below
+        done, _ = await asyncio.wait({task}, timeout=timeout)
+        if not done:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            status.error = f"sync_state timed out after {timeout:g}s"
+        else:
+            task.result()
+            status.ready = True
+    except asyncio.CancelledError:
+        task.cancel()
+        raise
+    except Exception as e:
+        status.error = str(e) or e.__class__.__name__
+    status.elapsed = time.perf_counter() - started
+    return status
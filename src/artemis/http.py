@@ -0,0 +1,210 @@
+"""
+Shared HTTP sessions for Artemis components.
+
+Components that talk HTTP borrow an `aiohttp.ClientSession` from a
+SessionRegistry instead of building their own client, so they share one
+keep-alive connection pool, DNS cache and set of warm TLS connections per
+upstream. The registry can pre-warm connections (pay the TCP and TLS
+handshakes during warm-up, not on the first order) and keep them warm with
+periodic lightweight requests, so idle periods do not cost a new handshake.
+
+aiohttp enables TCP_NODELAY on every connection it opens, so small
+request bodies are sent without Nagle delays.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import aiohttp
+
+from .utils.log import logger
+
+
+class SessionRegistry:
+    """
+    Named, lazily created aiohttp sessions with tuned connection pools.
+
+    `session(name)` returns the same ClientSession for a name every time; use
+    one name per upstream service (e.g. "orderly") so each gets its own pool.
+    Sessions are created on first use inside the running event loop and
+    closed together by `close()`.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 32,
+        dns_cache_ttl: int = 300,
+        keepalive_timeout: float = 75.0,
+        keep_warm_interval: float = 15.0,
+        timeout: float = 10.0,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            limit: Maximum open connections per session
+            limit_per_host: Maximum open connections per host
+            dns_cache_ttl: Seconds to cache DNS resolutions
+            keepalive_timeout: Seconds an idle connection stays in the pool
+            keep_warm_interval: Seconds between keep-warm requests; must be
+                below the idle timeout of the servers and load balancers
+            timeout: Default total request timeout in seconds
+            headers: Default headers for every session
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.keep_warm_interval = keep_warm_interval
+        self.timeout = timeout
+        self.headers = dict(headers or {})
+        self.sessions: Dict[str, aiohttp.ClientSession] = {}
+        # (session name, url, connections) targets refreshed by the keep-warm loop
+        self.warm_targets: List[Tuple[str, str, int]] = []
+        # Requests made through clients outside the registry, see keep_warm()
+        self.warm_callbacks: List[Callable[[], Awaitable[Any]]] = []
+        self._keep_warm_task: Optional[asyncio.Task] = None
+
+    def session(self, name: str = "default") -> aiohttp.ClientSession:
+        """
+        Return the shared session for `name`, creating it on first use.
+
+        Must be called while the event loop is running.
+        """
+        session = self.sessions.get(name)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                use_dns_cache=True,
+                ttl_dns_cache=self.dns_cache_ttl,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers=self.headers,
+            )
+            self.sessions[name] = session
+        return session
+
+    async def get_json(self, url: str, name: str = "default", **kwargs: Any) -> Any:
+        """
+        GET a URL with the shared session and decode the JSON response.
+
+        Args:
+            url: The URL to fetch
+            name: Session name
+            **kwargs: Extra arguments for `ClientSession.get` (params, headers, ...)
+
+        Returns:
+            The decoded JSON body
+
+        Raises:
+            aiohttp.ClientResponseError: On a non-2xx response
+        """
+        async with self.session(name).get(url, **kwargs) as response:
+            response.raise_for_status()
+            return await response.json()
+
+    async def prewarm(self, url: str, connections: int = 1, name: str = "default", keep_warm: bool = True) -> int:
+        """
+        Open warm connections to a host by issuing concurrent requests to `url`.
+
+        Use a cheap, idempotent endpoint. The responses are discarded; what
+        matters is that DNS, TCP and TLS setup are done and the connections
+        return to the pool.
+
+        Args:
+            url: URL to request
+            connections: Number of connections to open
+            name: Session name
+            keep_warm: Refresh these connections periodically afterwards
+
+        Returns:
+            Number of requests that succeeded
+        """
+        if keep_warm:
+            if (name, url, connections) not in self.warm_targets:
+                self.warm_targets.append((name, url, connections))
+            self._start_keep_warm()
+        return await self._touch(name, url, connections)
+
+    def keep_warm(self, request: Callable[[], Awaitable[Any]]) -> None:
+        """
+        Call `request` on every keep-warm interval until the registry is closed.
+
+        For clients with their own connection pool, e.g. a venue SDK that
+        signs requests itself: a cheap authenticated call keeps its
+        connections from idling out between orders. Failures are logged and
+        ignored. Registering the same callable again is a no-op, so this is
+        safe to call from code that runs on every resync.
+
+        Args:
+            request: Coroutine function making one lightweight request
+        """
+        if request not in self.warm_callbacks:
+            self.warm_callbacks.append(request)
+        self._start_keep_warm()
+
+    def _start_keep_warm(self) -> None:
+        if self._keep_warm_task is None or self._keep_warm_task.done():
+            self._keep_warm_task = asyncio.create_task(self._keep_warm(), name="http-keep-warm")
+
+    async def _touch(self, name: str, url: str, connections: int) -> int:
+        async def request() -> bool:
+            try:
+                async with self.session(name).get(url) as response:
+                    await response.read()
+                return True
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.debug("Warming {} failed: {}", url, e)
+                return False
+
+        results = await asyncio.gather(*(request() for _ in range(max(1, connections))))
+        return sum(results)
+
+    async def _call(self, request: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            await request()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug("Keep-warm request {} failed: {}", getattr(request, "__qualname__", request), e)
+
+    async def _keep_warm(self) -> None:
+        """Refresh every warm target and callback until cancelled."""
+        while True:
+            await asyncio.sleep(self.keep_warm_interval)
+            await asyncio.gather(
+                *(self._touch(name, url, connections) for name, url, connections in self.warm_targets),
+                *(self._call(request) for request in self.warm_callbacks),
+            )
+
+    async def close(self) -> None:
+        """Stop keeping connections warm and close every session."""
+        if self._keep_warm_task is not None:
+            self._keep_warm_task.cancel()
+            await asyncio.gather(self._keep_warm_task, return_exceptions=True)
+            self._keep_warm_task = None
+        sessions, self.sessions = list(self.sessions.values()), {}
+        for session in sessions:
+            await session.close()
+        self.warm_targets.clear()
+        self.warm_callbacks.clear()
+
+
+_sessions: SessionRegistry = SessionRegistry()
+
+
+def get_sessions() -> SessionRegistry:
+    """Return the process-wide session registry."""
+    return _sessions
+
+
+def set_sessions(registry: SessionRegistry) -> None:
+    """Replace the process-wide session registry."""
+    global _sessions
+    _sessions = registry
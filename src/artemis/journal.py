@@ -0,0 +1,322 @@
+"""
+Append-only, memory-mapped event and action journal.
+
+The journal is an audit trail of everything the engine saw and did. The hot
+path only appends a reference to an in-memory list. A background task
+periodically serializes the pending records in one batch, copies them into a
+preallocated memory-mapped segment file, and msyncs the segment at a
+configurable interval.
+
+Segment layout:
+
+    segment header:  magic b"ARTJ", version (u16), reserved (10 bytes)
+    record:          length (u32), kind (u8), timestamp ns (i64), pickle payload
+
+A zero length marks the end of the written data, so readers can scan a
+segment that is still being written. Segments are named
+`journal-00000000.seg`, `journal-00000001.seg`, ... and rotate when full.
+"""
+
+import asyncio
+import mmap
+import os
+import pickle
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
+from typing import Any, BinaryIO, Iterator, List, Optional, Tuple
+
+from .clock import get_clock
+from .types import Action, Event
+from .utils.log import LogSampler, logger
+
+SEGMENT_MAGIC = b"ARTJ"
+SEGMENT_VERSION = 1
+SEGMENT_HEADER = struct.Struct("<4sH10x")
+RECORD_HEADER = struct.Struct("<IBq")
+
+_drop_log = LogSampler(interval=1.0)
+
+
+class RecordKind(IntEnum):
+    """Kind of a journal record."""
+
+    EVENT = 1
+    ACTION = 2
+
+
+def _segment_name(index: int) -> str:
+    return f"journal-{index:08d}.seg"
+
+
+class Journal:
+    """
+    Batched, memory-mapped journal writer.
+
+    Attach it to an engine with `Engine(journal=Journal(path))`; the engine
+    appends every normalized event and every queued action, runs the flush
+    task, and closes the journal on shutdown.
+
+    Journaling never stops the engine: a record that cannot be pickled or
+    does not fit in a segment is skipped, and a batch whose write fails is
+    given up. Both are logged and counted in `dropped`.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_size: int = 64 * 1024 * 1024,
+        flush_interval: float = 0.05,
+        fsync_interval: float = 1.0,
+    ):
+        """
+        Open (or continue) a journal directory.
+
+        Args:
+            directory: Directory holding the segment files
+            segment_size: Preallocated size of each segment file in bytes
+            flush_interval: Seconds between batch writes into the segment
+            fsync_interval: Seconds between msync calls; 0 syncs after every batch
+        """
+        self.directory = directory
+        self.segment_size = segment_size
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+        self.written = 0
+        # Records skipped or lost to a failed write
+        self.dropped = 0
+        self._pending: List[Tuple[int, int, Any]] = []
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="artemis-journal")
+        self._mmap: Optional[mmap.mmap] = None
+        self._file: Optional[BinaryIO] = None
+        self._offset = 0
+        self._dirty = False
+        self._closed = False
+
+        os.makedirs(directory, exist_ok=True)
+        existing = sorted(name for name in os.listdir(directory) if name.startswith("journal-"))
+        # Never append into an existing segment; start a fresh one after it
+        self._index = int(existing[-1][8:16]) + 1 if existing else 0
+
+    def append(self, kind: RecordKind, record: Any) -> None:
+        """Queue a record for the next batch write. Cheap enough for the hot path."""
+        self._pending.append((kind, get_clock().time_ns(), record))
+
+    def append_event(self, event: Event) -> None:
+        """Queue an event for the next batch write."""
+        self._pending.append((RecordKind.EVENT, get_clock().time_ns(), event))
+
+    def append_action(self, action: Action) -> None:
+        """Queue an action for the next batch write."""
+        self._pending.append((RecordKind.ACTION, get_clock().time_ns(), action))
+
+    async def run(self) -> None:
+        """Flush pending records every `flush_interval` seconds until cancelled."""
+        loop = asyncio.get_running_loop()
+        since_sync = 0.0
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            since_sync += self.flush_interval
+            sync = since_sync >= self.fsync_interval
+            if sync:
+                since_sync = 0.0
+            await self.flush(sync=sync, loop=loop)
+
+    async def flush(self, sync: bool = False, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """
+        Write all pending records on the writer thread.
+
+        Args:
+            sync: Also msync the current segment to disk
+            loop: Running event loop, looked up if omitted
+        """
+        batch, self._pending = self._pending, []
+        if not batch and not (sync and self._dirty):
+            return
+        loop = loop or asyncio.get_running_loop()
+        written, dropped = self.written, self.dropped
+        try:
+            await loop.run_in_executor(self._writer, self._write_batch, batch, sync)
+        except Exception as e:
+            # Records committed before the failure stay readable; the rest are lost
+            lost = len(batch) - (self.written - written) - (self.dropped - dropped)
+            self.dropped += lost
+            logger.error("Journal write failed, {} records lost: {!r}", lost, e)
+
+    def _write_batch(self, batch: List[Tuple[int, int, Any]], sync: bool) -> None:
+        """Serialize a batch and copy it into the mapped segment (writer thread)."""
+        buffer = bytearray()
+        buffered = 0
+        for kind, timestamp_ns, record in batch:
+            try:
+                payload = pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception as e:
+                self.dropped += 1
+                _drop_log.error("Journal skipped a record that cannot be pickled: {!r}", e)
+                continue
+            frame_size = RECORD_HEADER.size + len(payload)
+            if frame_size + SEGMENT_HEADER.size + 4 > self.segment_size:
+                self.dropped += 1
+                _drop_log.error(
+                    "Journal skipped a record of {} bytes, larger than a segment of {}", frame_size, self.segment_size
+                )
+                continue
+            if self._mmap is None or self._offset + len(buffer) + frame_size + 4 > self.segment_size:
+                self._commit(buffer)
+                self.written += buffered
+                buffer = bytearray()
+                buffered = 0
+                self._rotate()
+            buffer += RECORD_HEADER.pack(len(payload), kind, timestamp_ns)
+            buffer += payload
+            buffered += 1
+        self._commit(buffer)
+        self.written += buffered
+        if sync and self._mmap is not None and self._dirty:
+            self._mmap.flush()
+            self._dirty = False
+
+    def _commit(self, buffer: bytearray) -> None:
+        """Copy serialized records into the segment, publishing the first length last."""
+        if not buffer:
+            return
+        segment = self._mmap
+        if segment is None:
+            raise RuntimeError("Journal has no open segment")
+        start, end = self._offset, self._offset + len(buffer)
+        # Readers stop at a zero length, so the batch only becomes visible once
+        # its first length field is written, after the rest of the batch
+        segment[start + 4:end] = buffer[4:]
+        segment[start:start + 4] = buffer[:4]
+        self._offset = end
+        self._dirty = True
+
+    def _rotate(self) -> None:
+        """Close the current segment and map a new, preallocated one."""
+        self._close_segment()
+        path = os.path.join(self.directory, _segment_name(self._index))
+        self._index += 1
+        file = open(path, "w+b")
+        file.truncate(self.segment_size)
+        segment = mmap.mmap(file.fileno(), self.segment_size, access=mmap.ACCESS_WRITE)
+        segment[0:SEGMENT_HEADER.size] = SEGMENT_HEADER.pack(SEGMENT_MAGIC, SEGMENT_VERSION)
+        self._file, self._mmap = file, segment
+        self._offset = SEGMENT_HEADER.size
+        logger.debug("Journal opened segment {}", path)
+
+    def _close_segment(self) -> None:
+        """Sync, unmap and trim the current segment to its used size."""
+        if self._mmap is None or self._file is None:
+            return
+        self._mmap.flush()
+        self._mmap.close()
+        # Keep a zero terminator after the last record
+        self._file.truncate(min(self._offset + 4, self.segment_size))
+        self._file.close()
+        self._mmap = None
+        self._file = None
+        self._dirty = False
+
+    async def close(self) -> None:
+        """Write pending records, sync and close the journal. Safe to call twice."""
+        if self._closed:
+            return
+        self._closed = True
+        await self.flush(sync=True)
+        try:
+            await asyncio.get_running_loop().run_in_executor(self._writer, self._close_segment)
+        except OSError as e:
+            logger.error("Journal failed to close its segment: {!r}", e)
+        self._writer.shutdown(wait=True)
+
+
+class JournalReader:
+    """
+    Zero-copy reader over journal segments.
+
+    `scan()` yields memoryview slices of the mapped segments, so records can
+    be inspected or forwarded without copying. Views are only valid until the
+    reader is closed.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Open a journal directory for reading.
+
+        Args:
+            directory: Directory holding the segment files
+        """
+        self.directory = directory
+        self._maps: List[mmap.mmap] = []
+
+    def segments(self) -> List[str]:
+        """Return the segment file paths in write order."""
+        names = sorted(name for name in os.listdir(self.directory) if name.startswith("journal-"))
+        return [os.path.join(self.directory, name) for name in names]
+
+    def scan(self) -> Iterator[Tuple[RecordKind, int, memoryview]]:
+        """
+        Iterate over raw records.
+
+        Yields:
+            (kind, timestamp ns, payload view) tuples in write order
+        """
+        for path in self.segments():
+            with open(path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size <= SEGMENT_HEADER.size:
+                    continue
+                segment = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+            self._maps.append(segment)
+            magic, _version = SEGMENT_HEADER.unpack_from(segment, 0)
+            if magic != SEGMENT_MAGIC:
+                logger.warning("Skipping {}: not a journal segment", path)
+                continue
+            view = memoryview(segment)
+            offset = SEGMENT_HEADER.size
+            while offset + RECORD_HEADER.size <= size:
+                length, kind, timestamp_ns = RECORD_HEADER.unpack_from(segment, offset)
+                if length == 0:
+                    break
+                start = offset + RECORD_HEADER.size
+                if start + length > size:
+                    break
+                yield RecordKind(kind), timestamp_ns, view[start:start + length]
+                offset = start + length
+
+    def records(self) -> Iterator[Tuple[RecordKind, int, Any]]:
+        """
+        Iterate over decoded records.
+
+        Yields:
+            (kind, timestamp ns, Event or Action) tuples in write order
+        """
+        for kind, timestamp_ns, payload in self.scan():
+            yield kind, timestamp_ns, pickle.loads(payload)
+
+    def events(self) -> Iterator[Tuple[int, Event]]:
+        """
+        Iterate over journaled events only, e.g. as a ReplayCollector source.
+
+        Yields:
+            (timestamp ns, event) tuples in write order
+        """
+        for kind, timestamp_ns, payload in self.scan():
+            if kind == RecordKind.EVENT:
+                yield timestamp_ns, pickle.loads(payload)
+
+    def close(self) -> None:
+        """Unmap all segments. Views returned by `scan()` become invalid."""
+        for segment in self._maps:
+            try:
+                segment.close()
+            except BufferError:
+                # A caller still holds a view; the map is released with it
+                pass
+        self._maps.clear()
+
+    def __enter__(self) -> "JournalReader":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,244 @@
+"""
+Lightweight metrics for the Artemis framework.
+
+Counters, gauges and histograms are plain Python objects updated in place,
+so recording a sample costs an attribute increment (and a bisect for
+histograms). Nothing is formatted until the registry is scraped, at which
+point `MetricsRegistry.render()` produces the Prometheus text exposition
+format. Gauges and counters can also be computed at scrape time from a
+callback, e.g. the current depth of every engine queue.
+"""
+
+import math
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar, cast
+
+# Content type of the Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Default histogram buckets, in seconds
+DEFAULT_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+    0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+Samples = Iterable[Tuple[Tuple[str, ...], float]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Value:
+    """A single counter or gauge time series."""
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1) -> None:
+        """Increase the value by `amount`."""
+        self.value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        """Decrease the value by `amount`."""
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        """Set the value."""
+        self.value = value
+
+
+class _Metric:
+    """Base class of labelled metric families."""
+
+    type_name = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        callback: Optional[Callable[[], Samples]] = None,
+    ):
+        """
+        Create a metric family.
+
+        Args:
+            name: Metric name, e.g. "artemis_events_total"
+            help: One-line description shown in the exposition
+            labelnames: Names of the labels distinguishing the series
+            callback: Optional function returning (label values, value) pairs,
+                evaluated at scrape time instead of stored series
+        """
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.callback = callback
+        self.children: Dict[Tuple[str, ...], Any] = {}
+
+    def labels(self, *values: str):
+        """Return (creating on first use) the series for the given label values."""
+        child = self.children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+            child = self.children[values] = self._new_child()
+        return child
+
+    def _new_child(self):
+        return _Value()
+
+    def _samples(self) -> Samples:
+        if self.callback is not None:
+            return self.callback()
+        return [(values, child.value) for values, child in self.children.items()]
+
+    def render(self) -> List[str]:
+        """Return the exposition lines of this family."""
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type_name}"]
+        for values, value in self._samples():
+            lines.append(f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    """Monotonically increasing count, e.g. events processed."""
+
+    type_name = "counter"
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, e.g. a queue depth."""
+
+    type_name = "gauge"
+
+
+class _HistogramValue:
+    """A single histogram time series."""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Histogram(_Metric):
+    """Distribution of observations in fixed buckets, e.g. processing time."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        """
+        Create a histogram family.
+
+        Args:
+            name: Metric name, e.g. "artemis_processing_seconds"
+            help: One-line description shown in the exposition
+            labelnames: Names of the labels distinguishing the series
+            buckets: Upper bounds of the buckets; +Inf is implied
+        """
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(b for b in buckets if b != math.inf))
+
+    def _new_child(self):
+        return _HistogramValue(self.buckets)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for values, child in self.children.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), child.counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, values, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+            lines.append(f"{self.name}_count{labels} {child.count}")
+        return lines
+
+
+M = TypeVar("M", bound=_Metric)
+
+
+class MetricsRegistry:
+    """Collection of metric families rendered together on scrape."""
+
+    def __init__(self):
+        self.metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: M) -> M:
+        """
+        Add a metric family to the registry.
+
+        Args:
+            metric: The metric to add
+
+        Returns:
+            The registered metric, or the existing one with the same name
+        """
+        return cast(M, self.metrics.setdefault(metric.name, metric))
+
+    def counter(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        callback: Optional[Callable[[], Samples]] = None,
+    ) -> Counter:
+        """Create and register a Counter."""
+        return self.register(Counter(name, help, labelnames, callback))
+
+    def gauge(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        callback: Optional[Callable[[], Samples]] = None,
+    ) -> Gauge:
+        """Create and register a Gauge."""
+        return self.register(Gauge(name, help, labelnames, callback))
+
+    def histogram(
+        self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        """Create and register a Histogram."""
+        return self.register(Histogram(name, help, labelnames, buckets))
+
+    def render(self) -> str:
+        """Return all metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+        for metric in self.metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,273 @@
+"""
+Record and replay support for the Artemis framework.
+
+Live events can be recorded to disk by wrapping collectors in a
+RecordingCollector. A recording can later be replayed through the same
+Engine and strategies with a ReplayCollector and a VirtualClock: events are
+fed as fast as the engine can process them, in lockstep with the recorded
+time, so strategies see the time of the event they handle and waits complete
+instantly. This makes it possible to regression-test
+strategies and measure engine overhead offline.
+
+Recordings are a sequence of frames, each a small header (receive time in
+nanoseconds and payload length) followed by the pickled Event.
+"""
+
+import pickle
+import struct
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, BinaryIO, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from .clock import Clock, VirtualClock, get_clock
+from .engine import Engine
+from .types import Action, Collector, Event, Executor, Strategy
+
+# Frame header: receive time (ns since epoch), payload length
+FRAME_HEADER = struct.Struct("<qI")
+
+
+class EventRecorder:
+    """
+    Append events to a recording file.
+
+    Frames are written through a buffered file; call `close()` (or use the
+    recorder as a context manager) to make sure everything reaches disk.
+    """
+
+    def __init__(self, path: str, clock: Optional[Clock] = None):
+        """
+        Open a recording for appending.
+
+        Args:
+            path: Recording file path
+            clock: Clock used to stamp receive times; the active clock if None
+        """
+        self.path = path
+        self.clock = clock
+        self.count = 0
+        self._file: BinaryIO = open(path, "ab")
+
+    def write(self, event: Event) -> None:
+        """Append one event, stamped with the current receive time."""
+        clock = self.clock or get_clock()
+        payload = pickle.dumps(event, protocol=pickle.HIGHEST_PROTOCOL)
+        self._file.write(FRAME_HEADER.pack(clock.time_ns(), len(payload)))
+        self._file.write(payload)
+        self.count += 1
+
+    def flush(self) -> None:
+        """Flush buffered frames to the operating system."""
+        self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the recording."""
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self) -> "EventRecorder":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def read_events(path: str) -> Iterator[Tuple[int, Event]]:
+    """
+    Iterate over a recording.
+
+    Args:
+        path: Recording file path
+
+    Yields:
+        (receive time in ns, event) tuples in recording order
+    """
+    header_size = FRAME_HEADER.size
+    with open(path, "rb", buffering=1 << 20) as f:
+        while True:
+            header = f.read(header_size)
+            if len(header) < header_size:
+                return
+            received_ns, length = FRAME_HEADER.unpack(header)
+            payload = f.read(length)
+            if len(payload) < length:
+                # Truncated final frame, e.g. the recorder was killed mid-write
+                return
+            yield received_ns, pickle.loads(payload)
+
+
+class RecordingCollector(Collector):
+    """
+    Collector wrapper that records every normalized event it produces.
+
+    The wrapped collector behaves exactly as before; its events are written
+    to the recorder after normalization, i.e. in the schema strategies see.
+    """
+
+    def __init__(self, collector: Collector, recorder: EventRecorder):
+        """
+        Wrap a collector.
+
+        Args:
+            collector: The live collector to record
+            recorder: Where to write its events
+        """
+        self.collector = collector
+        self.recorder = recorder
+
+    def start(self, timeout: Optional[int] = None) -> None:
+        self.collector.start(timeout=timeout)
+
+    def events(self) -> AsyncIterator[Any]:
+        return self.collector.events()
+
+    def normalize(self, raw: Any) -> Optional[Event]:
+        event = self.collector.normalize(raw)
+        if event is not None:
+            self.recorder.write(event)
+        return event
+
+
+class ReplayCollector(Collector):
+    """
+    Push-style collector that replays a recording at maximum speed.
+
+    Before each event is emitted, the virtual clock is advanced to the
+    event's recorded receive time. With a `barrier` (normally `engine.join`)
+    the replay runs in lockstep: before the clock moves forward, every event
+    released so far and every action they produced are processed, so
+    components always read the recorded time of the event they are handling.
+    Events sharing a timestamp are released together and batch normally. The stream ends with the recording, so
+    `Engine.run_until_complete()` returns once everything was processed.
+    """
+
+    def __init__(
+        self,
+        source: Any,
+        clock: Optional[VirtualClock] = None,
+        barrier: Optional[Callable[[], Awaitable[None]]] = None,
+    ):
+        """
+        Initialize the collector.
+
+        Args:
+            source: Recording file path, or an iterable of
+                (receive time in ns, event) tuples
+            clock: Virtual clock to advance; not advanced if None
+            barrier: Awaited before the recorded time moves forward, e.g.
+                `engine.join`; without it the collector runs up to a full
+                queue ahead of the strategies
+        """
+        self.source = source
+        self.clock = clock
+        self.barrier = barrier
+        self.count = 0
+
+    def start(self, timeout: Optional[int] = None) -> None:
+        pass
+
+    async def events(self) -> AsyncIterator[Event]:
+        frames = read_events(self.source) if isinstance(self.source, str) else self.source
+        last_ns = 0
+        for received_ns, event in frames:
+            if self.barrier is not None and self.count and received_ns > last_ns:
+                await self.barrier()
+            last_ns = max(last_ns, received_ns)
+            if self.clock is not None:
+                self.clock.advance_to(received_ns)
+            self.count += 1
+            yield event
+
+
+class StubExecutor(Executor):
+    """Executor that records actions in memory instead of executing them."""
+
+    def __init__(self, keep: bool = True):
+        """
+        Initialize the executor.
+
+        Args:
+            keep: Keep every action in `actions`; only count them if False
+        """
+        self.keep = keep
+        self.count = 0
+        self.actions: List[Action] = []
+
+    async def sync_state(self) -> None:
+        pass
+
+    async def execute(self, action: Action) -> None:
+        self.count += 1
+        if self.keep:
+            self.actions.append(action)
+
+    async def execute_many(self, actions: List[Action]) -> None:
+        self.count += len(actions)
+        if self.keep:
+            self.actions.extend(actions)
+
+
+@dataclass
+class ReplayResult:
+    """Outcome of a replay run."""
+
+    events: int
+    actions: List[Action] = field(default_factory=list)
+    action_count: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def events_per_second(self) -> float:
+        """Replay throughput in events per second of wall time."""
+        return self.events / self.elapsed if self.elapsed > 0 else 0.0
+
+
+async def replay(
+    source: Any,
+    strategies: Iterable[Strategy],
+    executors: Optional[Iterable[Executor]] = None,
+    keep_actions: bool = True,
+    lockstep: bool = True,
+    **engine_kwargs: Any,
+) -> ReplayResult:
+    """
+    Replay a recording through strategies and return the produced actions.
+
+    A fresh Engine is built with a VirtualClock and a ReplayCollector. Events
+    are replayed in lockstep with the recorded time, so `get_clock()` inside
+    any strategy or executor returns the recorded receive time of the event
+    being handled. Lockstep drains the engine at every new timestamp; for
+    throughput runs that do not read the clock, pass `lockstep=False` to let
+    the collector run ahead and batch freely. It runs until the recording is exhausted and every resulting
+    action has been executed. A StubExecutor is always added to capture the actions.
+
+    Args:
+        source: Recording file path or iterable of (receive ns, event) tuples
+        strategies: Strategies under test
+        executors: Additional executors to run, e.g. a simulated exchange
+        keep_actions: Keep every action in the result; only count if False
+        lockstep: Drain the engine before the recorded time moves forward
+        **engine_kwargs: Extra Engine arguments (batch sizes, capacities, ...)
+
+    Returns:
+        A ReplayResult with event/action counts and wall-clock duration
+    """
+    clock = VirtualClock()
+    engine = Engine(clock=clock, **engine_kwargs)
+    collector = ReplayCollector(source, clock, barrier=engine.join if lockstep else None)
+    stub = StubExecutor(keep=keep_actions)
+    engine.add_collector(collector)
+    for strategy in strategies:
+        engine.add_strategy(strategy)
+    for executor in executors or ():
+        engine.add_executor(executor)
+    engine.add_executor(stub)
+
+    started = time.perf_counter()
+    await engine.run_until_complete()
+    return ReplayResult(
+        events=collector.count,
+        actions=stub.actions,
+        action_count=stub.count,
+        elapsed=time.perf_counter() - started,
+    )
@@ -0,0 +1,304 @@
+"""
+End-to-end latency tracing for the Artemis framework.
+
+With `Engine(trace_latency=True)` every event carries a Trace of monotonic
+nanosecond stamps taken as it moves through the engine: received from the
+collector, enqueued, strategy start and end, action enqueued, and executor
+start and end. Actions inherit the trace of the event that produced them.
+When an executor finishes an action, the stage latencies are recorded into
+log-linear (HDR-style) histograms keyed by the path the event took, i.e. the
+(collector, strategy, executor) triple.
+
+Executors can stamp milestones inside `execute()`, e.g. the moment an order
+request was sent, with `mark(action, "order_sent")`. Each milestone is
+recorded as its own stage, measured from the collector receive time, so
+latencies up to a point inside a long-running execute can be tracked.
+"""
+
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Sub-bucket resolution: 2**7 buckets per power of two, ~1.6% relative error
+SUB_BUCKET_BITS = 7
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+HALF_SUB_BUCKET_COUNT = SUB_BUCKET_COUNT >> 1
+BUCKET_COUNT = (64 - SUB_BUCKET_BITS + 1) * HALF_SUB_BUCKET_COUNT + HALF_SUB_BUCKET_COUNT
+
+# Stages recorded per path, in pipeline order
+STAGES = ("ingest", "event_queue", "strategy", "action_queue", "execute", "end_to_end")
+
+
+class Trace:
+    """
+    Monotonic nanosecond stamps of one event and the actions it produced.
+
+    Stamps that were not reached yet are 0.
+    """
+
+    __slots__ = (
+        "collector",
+        "received_ns",
+        "enqueued_ns",
+        "strategy",
+        "strategy_start_ns",
+        "strategy_end_ns",
+        "action_enqueued_ns",
+        "executor_start_ns",
+        "executor_end_ns",
+        "marks",
+    )
+
+    def __init__(self, collector: str, received_ns: int):
+        self.collector = collector
+        self.received_ns = received_ns
+        self.enqueued_ns = 0
+        self.strategy = ""
+        self.strategy_start_ns = 0
+        self.strategy_end_ns = 0
+        self.action_enqueued_ns = 0
+        self.executor_start_ns = 0
+        self.executor_end_ns = 0
+        # Milestone name -> monotonic ns, see mark()
+        self.marks: Optional[Dict[str, int]] = None
+
+    def mark(self, name: str) -> None:
+        """Stamp the milestone `name` with the current monotonic time."""
+        if self.marks is None:
+            self.marks = {}
+        self.marks[name] = time.monotonic_ns()
+
+    def derive(self, strategy: str, start_ns: int, end_ns: int) -> "Trace":
+        """Return the trace for an action produced by `strategy` from this event."""
+        trace = Trace(self.collector, self.received_ns)
+        trace.enqueued_ns = self.enqueued_ns
+        trace.strategy = strategy
+        trace.strategy_start_ns = start_ns
+        trace.strategy_end_ns = end_ns
+        return trace
+
+    def __repr__(self) -> str:
+        stamps = ", ".join(f"{name}={getattr(self, name)}" for name in self.__slots__)
+        return f"Trace({stamps})"
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of nanosecond latencies.
+
+    Values below 128ns are counted exactly; above that every power of two is
+    split into 64 linear sub-buckets, so any percentile is reported within
+    ~1.6% of the true value while recording stays O(1).
+    """
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    @staticmethod
+    def _index(value: int) -> int:
+        if value < SUB_BUCKET_COUNT:
+            return value
+        shift = value.bit_length() - SUB_BUCKET_BITS
+        return (shift << (SUB_BUCKET_BITS - 1)) + (value >> shift)
+
+    @staticmethod
+    def _upper_bound(index: int) -> int:
+        if index < SUB_BUCKET_COUNT:
+            return index
+        shift = (index >> (SUB_BUCKET_BITS - 1)) - 1
+        sub_bucket = index - (shift << (SUB_BUCKET_BITS - 1))
+        return ((sub_bucket + 1) << shift) - 1
+
+    def record(self, value: int) -> None:
+        """Record one latency in nanoseconds; negative values count as 0."""
+        if value < 0:
+            value = 0
+        self.counts[self._index(value)] += 1
+        if self.count == 0 or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    def percentile(self, percentile: float) -> int:
+        """
+        Return the latency at a percentile.
+
+        Args:
+            percentile: Percentile between 0 and 100, e.g. 99.9
+
+        Returns:
+            The highest value equivalent to the percentile's bucket, in ns
+        """
+        return self.percentiles((percentile,))[0]
+
+    def percentiles(self, percentiles: Sequence[float]) -> List[int]:
+        """
+        Return the latencies at several percentiles in one pass over the buckets.
+
+        Args:
+            percentiles: Percentiles between 0 and 100, in any order
+
+        Returns:
+            The latency at each percentile, in ns, in the order given
+        """
+        if self.count == 0:
+            return [0] * len(percentiles)
+        targets = sorted(
+            (max(1, int(round(self.count * percentile / 100.0))), position)
+            for position, percentile in enumerate(percentiles)
+        )
+        values = [self.max] * len(percentiles)
+        pending = 0
+        seen = 0
+        # Buckets above the maximum are empty, stop at its bucket
+        for index in range(self._index(self.max) + 1):
+            seen += self.counts[index]
+            while pending < len(targets) and seen >= targets[pending][0]:
+                values[targets[pending][1]] = min(self._upper_bound(index), self.max)
+                pending += 1
+            if pending == len(targets):
+                break
+        return values
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add the observations of another histogram to this one."""
+        if other.count == 0:
+            return
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.min = other.min if self.count == 0 else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    def summary(self) -> Dict[str, float]:
+        """Return count, mean, p50, p90, p99, p99.9 and max, in microseconds."""
+        p50, p90, p99, p999 = self.percentiles((50, 90, 99, 99.9))
+        return {
+            "count": self.count,
+            "mean_us": self.total / self.count / 1e3 if self.count else 0.0,
+            "p50_us": p50 / 1e3,
+            "p90_us": p90 / 1e3,
+            "p99_us": p99 / 1e3,
+            "p999_us": p999 / 1e3,
+            "max_us": self.max / 1e3,
+        }
+
+
+def mark(record: Any, name: str) -> None:
+    """
+    Stamp a milestone on a traced event or action; a no-op if it is untraced.
+
+    Args:
+        record: The Event or Action being handled
+        name: Milestone name, recorded as a stage, e.g. "claim_sent"
+    """
+    trace = getattr(record, "trace", None)
+    if trace is not None:
+        trace.mark(name)
+
+
+# (stage, collector, strategy, executor)
+PathKey = Tuple[str, str, str, str]
+
+
+class LatencyTracker:
+    """Aggregates finished traces into histograms per path and stage."""
+
+    def __init__(self):
+        self.histograms: Dict[PathKey, LatencyHistogram] = {}
+
+    def _histogram(self, key: PathKey) -> LatencyHistogram:
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = LatencyHistogram()
+        return histogram
+
+    def record(self, trace: Trace, executor: str, start_ns: int, end_ns: int) -> None:
+        """
+        Record every stage of a trace once an executor finished its action.
+
+        Args:
+            trace: Trace of the executed action
+            executor: Name of the executor
+            start_ns: Monotonic time the executor started
+            end_ns: Monotonic time the executor finished
+        """
+        trace.executor_start_ns = start_ns
+        trace.executor_end_ns = end_ns
+        path = (trace.collector, trace.strategy, executor)
+        stages = (
+            trace.enqueued_ns - trace.received_ns,
+            trace.strategy_start_ns - trace.enqueued_ns,
+            trace.strategy_end_ns - trace.strategy_start_ns,
+            start_ns - trace.action_enqueued_ns,
+            end_ns - start_ns,
+            end_ns - trace.received_ns,
+        )
+        for stage, value in zip(STAGES, stages):
+            self._histogram((stage,) + path).record(value)
+        if trace.marks:
+            for name, stamp_ns in trace.marks.items():
+                self._histogram((name,) + path).record(stamp_ns - trace.received_ns)
+
+    def histogram(
+        self,
+        stage: str = "end_to_end",
+        collector: Optional[str] = None,
+        strategy: Optional[str] = None,
+        executor: Optional[str] = None,
+    ) -> LatencyHistogram:
+        """
+        Return the merged histogram of one stage over all matching paths.
+
+        Args:
+            stage: One of STAGES, or a milestone name
+            collector: Only paths starting at this collector, if given
+            strategy: Only paths through this strategy, if given
+            executor: Only paths ending at this executor, if given
+        """
+        merged = LatencyHistogram()
+        for (key_stage, key_collector, key_strategy, key_executor), histogram in self.histograms.items():
+            if key_stage != stage:
+                continue
+            if collector is not None and key_collector != collector:
+                continue
+            if strategy is not None and key_strategy != strategy:
+                continue
+            if executor is not None and key_executor != executor:
+                continue
+            merged.merge(histogram)
+        return merged
+
+    def report(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Summarize every path.
+
+        Returns:
+            {"collector>strategy>executor": {stage: summary}} with summaries
+            as returned by LatencyHistogram.summary()
+        """
+        report: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for (stage, collector, strategy, executor), histogram in self.histograms.items():
+            report.setdefault(f"{collector}>{strategy}>{executor}", {})[stage] = histogram.summary()
+        return report
+
+    def samples(self, quantiles: Tuple[float, ...] = (0.5, 0.9, 0.99, 0.999)) -> List[Tuple[Tuple[str, ...], float]]:
+        """Return (labels, seconds) pairs per path, stage and quantile, for metrics."""
+        samples: List[Tuple[Tuple[str, ...], float]] = []
+        percentiles = [quantile * 100 for quantile in quantiles]
+        for key, histogram in self.histograms.items():
+            for quantile, value in zip(quantiles, histogram.percentiles(percentiles)):
+                samples.append((key + (str(quantile),), value / 1e9))
+        return samples
+
+    def reset(self) -> None:
+        """Forget all recorded latencies."""
+        self.histograms.clear()
+
@@ -6,12 +6,166 @@ This module defines the core interfaces that all components must implement:
 - Strategy: For processing events and generating actions  
 - Executor: For executing actions on external systems
 
-It also defines common enums for event and action types.
+It also defines the Event and Action records passed between them and common
+enums for event and action types.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, AsyncIterator, ClassVar, Dict, FrozenSet, Hashable, Iterator, List, Optional, Union
+
+from .clock import get_clock
+from .tracing import Trace
+
+
+class _Record(Mapping):
+    """
+    Read-only mapping view over a slotted record.
+    
+    Lets strategies and executors written against plain dicts keep using
+    `record["key"]` and `record.get("key")`. Fixed fields are read from slots,
+    everything else from the immutable `data` payload.
+    """
+
+    __slots__ = ()
+    _fields: ClassVar[FrozenSet[str]] = frozenset()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._fields:
+            value = getattr(self, key)
+            if value is None:
+                raise KeyError(key)
+            return value
+        return self.data[key]  # type: ignore[attr-defined]
+
+    def __iter__(self) -> Iterator[str]:
+        for name in self._field_order:  # type: ignore[attr-defined]
+            if name != "data" and getattr(self, name) is not None:
+                yield name
+        yield from self.data  # type: ignore[attr-defined]
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __post_init__(self) -> None:
+        data = self.data  # type: ignore[attr-defined]
+        if not isinstance(data, MappingProxyType):
+            object.__setattr__(self, "data", MappingProxyType(dict(data)))
+
+    def __reduce__(self):
+        # mappingproxy cannot be pickled, so rebuild from a plain dict
+        values = tuple(getattr(self, name) for name in self._field_order)  # type: ignore[attr-defined]
+        index = self._field_order.index("data")  # type: ignore[attr-defined]
+        values = values[:index] + (dict(values[index]),) + values[index + 1:]
+        return (self.__class__, values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a mutable dict copy of the record."""
+        return dict(self)
+
+
+@dataclass(frozen=True, slots=True, eq=False, repr=True)
+class Event(_Record):
+    """
+    Immutable event record produced by collectors.
+    
+    One instance can be shared by any number of strategies without copying.
+    
+    Attributes:
+        event_type: An EventType member or application-defined string
+        data: Remaining event fields, exposed as a read-only mapping
+        symbol: Instrument the event refers to, if any
+        timestamp: Source timestamp of the event, if known
+        source: Name of the feed that produced the event, if known
+        trace: Latency stamps set by the engine when tracing is enabled;
+            not part of the mapping view and not pickled
+    """
+
+    event_type: Union["EventType", str]
+    data: Mapping[str, Any] = field(default_factory=dict)
+    symbol: Optional[str] = None
+    timestamp: Optional[float] = None
+    source: Optional[str] = None
+    trace: Optional[Trace] = field(default=None, repr=False)
+
+    _field_order: ClassVar[tuple] = ("event_type", "data", "symbol", "timestamp", "source")
+    _fields: ClassVar[FrozenSet[str]] = frozenset(_field_order) - {"data"}
+
+    @classmethod
+    def from_dict(cls, raw: Mapping[str, Any], source: Optional[str] = None) -> "Event":
+        """
+        Build an event from a plain dict with an "event_type" key.
+        
+        Args:
+            raw: Event dictionary, as produced by dict-based collectors
+            source: Optional feed name to record on the event
+        """
+        data = dict(raw)
+        return cls(
+            event_type=data.pop("event_type"),
+            symbol=data.pop("symbol", None),
+            timestamp=data.pop("timestamp", None),
+            source=data.pop("source", source),
+            data=MappingProxyType(data),
+        )
+
+
+@dataclass(frozen=True, slots=True, eq=False, repr=True)
+class Action(_Record):
+    """
+    Immutable action record produced by strategies.
+    
+    Attributes:
+        action_type: An ActionType member or application-defined string
+        data: Remaining action fields, exposed as a read-only mapping
+        symbol: Instrument the action refers to, if any
+        timestamp: Timestamp of the event that triggered the action, if known
+        trace: Latency stamps inherited from the triggering event when
+            tracing is enabled; not part of the mapping view and not pickled
+    """
+
+    action_type: Union["ActionType", str]
+    data: Mapping[str, Any] = field(default_factory=dict)
+    symbol: Optional[str] = None
+    timestamp: Optional[float] = None
+    trace: Optional[Trace] = field(default=None, repr=False)
+
+    _field_order: ClassVar[tuple] = ("action_type", "data", "symbol", "timestamp")
+    _fields: ClassVar[FrozenSet[str]] = frozenset(_field_order) - {"data"}
+
+    @classmethod
+    def from_dict(cls, raw: Mapping[str, Any]) -> "Action":
+        """
+        Build an action from a plain dict with an "action_type" key.
+        
+        Args:
+            raw: Action dictionary, as produced by dict-based strategies
+        """
+        data = dict(raw)
+        return cls(
+            action_type=data.pop("action_type"),
+            symbol=data.pop("symbol", None),
+            timestamp=data.pop("timestamp", None),
+            data=MappingProxyType(data),
+        )
+
+
+def to_event(raw: Union[Event, Mapping[str, Any]]) -> Event:
+    """Return `raw` as an Event, converting plain dicts."""
+    if isinstance(raw, Event):
+        return raw
+    return Event.from_dict(raw)
+
+
+def to_action(raw: Union[Action, Mapping[str, Any]]) -> Action:
+    """Return `raw` as an Action, converting plain dicts."""
+    if isinstance(raw, Action):
+        return raw
+    return Action.from_dict(raw)
 
 
 class Collector(ABC):
@@ -26,6 +180,13 @@ class Collector(ABC):
     - External message queues
     
     Each collector runs independently and pushes events to the engine's event queue.
+    
+    Collectors come in two styles:
+    - Push-style collectors override `events()` as an async generator. The
+      engine runs each one in its own supervised task and forwards every
+      yielded event straight into the event channel.
+    - Pull-style collectors implement `get_event_stream()`. The default
+      `events()` adapts them by polling with an idle backoff.
     """
 
     @abstractmethod
@@ -38,15 +199,79 @@ class Collector(ABC):
         """
         pass
 
-    @abstractmethod
-    async def get_event_stream(self) -> Optional[Dict[str, Any]]:
+    async def get_event_stream(self) -> Optional[Union[Event, Dict[str, Any]]]:
         """
         Get the next event from the collector's stream.
         
+        Pull-style collectors implement this; push-style collectors override
+        `events()` instead and can leave it as is.
+        
         Returns:
-            Dict containing event data, or None if no events are available
+            An Event or event dict, or None if no events are available
         """
-        pass
+        return None
+
+    def events(self) -> AsyncIterator[Union[Event, Dict[str, Any]]]:
+        """
+        Iterate over the events produced by this collector.
+        
+        Override this with an async generator to push events to the engine as
+        they arrive. The default implementation polls `get_event_stream()`.
+        
+        Returns:
+            Async iterator of Events or event dictionaries
+        """
+        return poll_events(self)
+
+    def normalize(self, raw: Union[Event, Mapping[str, Any]]) -> Optional[Event]:
+        """
+        Convert a raw collector payload into an Event at ingestion time.
+        
+        The engine calls this for every item a collector produces, so
+        strategies always receive Event records in one schema. Override it to
+        map source-specific field names to a common shape, or return None to
+        drop the payload. The default converts dicts with `Event.from_dict`.
+        
+        Args:
+            raw: An Event or an event dictionary with an "event_type" key
+            
+        Returns:
+            The normalized Event, or None to discard the payload
+        """
+        return to_event(raw)
+
+
+async def poll_events(
+    collector: Collector,
+    min_interval: float = 0.001,
+    max_interval: float = 0.05,
+) -> AsyncIterator[Union[Event, Dict[str, Any]]]:
+    """
+    Adapt a pull-style collector to the async-iterator collector API.
+    
+    Events are yielded as long as `get_event_stream()` returns them. While it
+    returns None the poll delay doubles from `min_interval` up to
+    `max_interval`, so idle collectors cost almost no CPU.
+    
+    Args:
+        collector: The collector to poll
+        min_interval: Initial delay after an empty poll, in seconds
+        max_interval: Maximum delay between empty polls, in seconds
+        
+    Yields:
+        Events returned by the collector
+    """
+    idle_delay = min_interval
+    while True:
+        event = await collector.get_event_stream()
+        if event is None:
+            await get_clock().sleep(idle_delay)
+            idle_delay = min(idle_delay * 2, max_interval)
+            continue
+        idle_delay = min_interval
+        yield event
+        # Let other tasks run even if the collector never suspends
+        await asyncio.sleep(0)
 
 
 class Strategy(ABC):
@@ -61,8 +286,42 @@ class Strategy(ABC):
     - Market making strategies
     - Liquidation strategies
     - Technical analysis strategies
+    
+    Strategies can narrow what they receive by setting `subscribed_event_types`
+    and/or `subscribed_symbols` (as class attributes or in `__init__`/
+    `sync_state`). The engine only dispatches matching events, so a strategy
+    is never woken for feeds it ignores. None means "everything"; the symbol
+    filter only applies to events that carry a symbol.
     """
 
+    subscribed_event_types: Optional[FrozenSet[Union["EventType", str]]] = None
+    subscribed_symbols: Optional[FrozenSet[str]] = None
+    # Overload policy of this strategy's inbox; None uses the engine default
+    inbox_policy: Optional["OverflowPolicy"] = None
+    # Event types (e.g. TICK, ORDER_BOOK) of which only the latest pending event
+    # per symbol is kept in the inbox; None uses the engine default
+    conflated_event_types: Optional[FrozenSet[Union["EventType", str]]] = None
+    # Run sync_state/process_events in a dedicated worker process so heavy
+    # computation does not block the engine loop. The strategy must be
+    # picklable, and its state then lives in the worker process.
+    cpu_bound: bool = False
+    # Deadline in seconds for sync_state during warm-up; None uses the engine default
+    sync_timeout: Optional[float] = None
+
+    def accepts(self, event_type: Union["EventType", str], symbol: Optional[str]) -> bool:
+        """
+        Return True if this strategy subscribes to the given event type and symbol.
+        
+        Args:
+            event_type: The event type to check
+            symbol: The event symbol, or None for events without one
+        """
+        if self.subscribed_event_types is not None and event_type not in self.subscribed_event_types:
+            return False
+        if symbol is not None and self.subscribed_symbols is not None and symbol not in self.subscribed_symbols:
+            return False
+        return True
+
     @abstractmethod
     async def sync_state(self) -> None:
         """
@@ -74,18 +333,38 @@ class Strategy(ABC):
         pass
 
     @abstractmethod
-    async def process_event(self, event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def process_event(self, event: Event) -> Optional[Union[Action, Dict[str, Any]]]:
         """
         Process an incoming event and optionally generate an action.
         
         Args:
-            event: The event data to process
+            event: The event to process; supports attribute and dict-style access
             
         Returns:
-            Optional action dictionary, or None if no action should be taken
+            Optional Action (or action dictionary), or None if no action should be taken
         """
         pass
 
+    async def process_events(self, events: List[Event]) -> List[Union[Action, Dict[str, Any]]]:
+        """
+        Process a batch of events drained from the event queue in one wakeup.
+        
+        Override this to amortize per-event overhead during bursts. The default
+        implementation calls `process_event` for each event in order.
+        
+        Args:
+            events: The events to process, oldest first
+            
+        Returns:
+            List of generated actions, in order
+        """
+        actions = []
+        for event in events:
+            action = await self.process_event(event)
+            if action is not None:
+                actions.append(action)
+        return actions
+
 
 class Executor(ABC):
     """
@@ -99,8 +378,19 @@ class Executor(ABC):
     - Database writers
     - Notification senders
     - External API callers
+    
+    Each executor runs in its own lane, so a slow executor never delays the
+    others. Within a lane, `max_concurrency` bounds how many actions run at
+    once. Actions with the same `ordering_key()` are always executed in order,
+    while actions with different keys may overlap.
     """
 
+    max_concurrency: int = 1
+    # Overload policy of this executor's inbox; None uses the engine default
+    inbox_policy: Optional["OverflowPolicy"] = None
+    # Deadline in seconds for sync_state during warm-up; None uses the engine default
+    sync_timeout: Optional[float] = None
+
     @abstractmethod
     async def sync_state(self) -> None:
         """
@@ -112,15 +402,45 @@ class Executor(ABC):
         pass
 
     @abstractmethod
-    async def execute(self, action: Dict[str, Any]) -> None:
+    async def execute(self, action: Action) -> None:
         """
         Execute an action.
         
         Args:
-            action: The action data to execute
+            action: The action to execute; supports attribute and dict-style access
         """
         pass
 
+    async def execute_many(self, actions: List[Action]) -> None:
+        """
+        Execute a batch of actions drained from the action queue in one wakeup.
+        
+        Override this to submit several actions at once (e.g. a batch order
+        endpoint). The default implementation calls `execute` for each action
+        in order.
+        
+        Args:
+            actions: The actions to execute, oldest first
+        """
+        for action in actions:
+            await self.execute(action)
+
+    def ordering_key(self, action: Action) -> Optional[Hashable]:
+        """
+        Return the key that actions must be serialized on, if any.
+        
+        Only used when `max_concurrency > 1`. Actions returning the same key
+        (e.g. a symbol or liquidation id) run strictly in order; actions
+        returning None are fully independent.
+        
+        Args:
+            action: The action to classify
+            
+        Returns:
+            A hashable ordering key, or None
+        """
+        return None
+
 
 class EventType(str, Enum):
     """
@@ -155,3 +475,33 @@ class ActionType(str, Enum):
     
     # Custom application actions can be added by extending this enum
     # or by using string literals directly
+
+
+class EngineMode(str, Enum):
+    """
+    Enumeration of engine scheduling modes.
+    
+    EVENT wakes each stage as soon as work arrives on its queue.
+    THROTTLED keeps the original poll-and-sleep behaviour, processing at most
+    one item per stage every `throttle_interval` seconds.
+    """
+    
+    EVENT = "event"
+    THROTTLED = "throttled"
+
+
+class OverflowPolicy(str, Enum):
+    """
+    Enumeration of what a full engine channel does with a new item.
+    
+    BLOCK waits for space, applying backpressure to the producer.
+    DROP_OLDEST evicts the oldest queued item to make room.
+    DROP_NEWEST discards the incoming item.
+    SAMPLE admits one in every `sample_rate` incoming items (evicting the
+    oldest) and discards the rest.
+    """
+    
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    SAMPLE = "sample"
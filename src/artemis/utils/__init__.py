@@ -2,12 +2,18 @@
 Artemis framework utilities.
 """
 
-from .event_loop import create_task, get_loop
+from .cache import TTLCache
+from .event_loop import create_task, get_loop, new_event_loop, run
 from .log import logger, set_level
+from .singleflight import SingleFlight
 
 __all__ = [
     "get_loop",
     "create_task", 
+    "new_event_loop",
+    "run",
     "logger",
     "set_level",
+    "TTLCache",
+    "SingleFlight",
 ]
@@ -0,0 +1,90 @@
+"""
+Bounded caches for the Artemis framework.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class TTLCache(Generic[V]):
+    """
+    Mapping with per-entry expiry and least-recently-used eviction.
+
+    Entries expire `ttl` seconds after they were set; when more than
+    `maxsize` entries are held, the least recently used one is evicted, so
+    memory stays bounded however long the process runs. Expired entries are
+    dropped lazily on access and on insertion.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0, timer: Callable[[], float] = time.monotonic):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries
+            ttl: Seconds an entry stays valid
+            timer: Monotonic time source, in seconds
+        """
+        self.maxsize = max(1, maxsize)
+        self.ttl = ttl
+        self.timer = timer
+        self._data: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the live value for `key` and mark it recently used, else `default`."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        if entry[0] <= self.timer():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: Hashable, value: V, ttl: Optional[float] = None) -> None:
+        """Store `value` under `key` for `ttl` seconds (the cache's ttl by default)."""
+        now = self.timer()
+        self._data[key] = (now + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        # Expired entries sit at the front unless they were touched recently
+        while self._data:
+            oldest_key, (expires, _) = next(iter(self._data.items()))
+            if expires > now and len(self._data) <= self.maxsize:
+                break
+            del self._data[oldest_key]
+
+    def add(self, key: Hashable, value: V, ttl: Optional[float] = None) -> bool:
+        """
+        Store `value` unless `key` is already live.
+
+        Returns:
+            True if the key was added, False if it was already present
+        """
+        if self.get(key, _MISSING) is not _MISSING:
+            return False
+        self.set(key, value, ttl)
+        return True
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove `key` and return its live value, else `default`."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            return default
+        del self._data[key]
+        return value
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        """Number of held entries, including expired ones not yet dropped."""
+        return len(self._data)
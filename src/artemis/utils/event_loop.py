@@ -1,22 +1,165 @@
 """
 Event loop utilities for the Artemis framework.
+
+The runtime layer picks the event loop implementation: uvloop when it is
+installed (`pip install artemis-py[speed]`), otherwise the standard asyncio
+loop. Debug mode and the slow-callback threshold are configured explicitly,
+so production deployments never pay for asyncio's debug instrumentation by
+accident.
 """
 
 import asyncio
-from typing import Optional
+import sys
+from typing import Any, Callable, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Loop implementations accepted by `loop_factory`
+LOOP_AUTO = "auto"
+LOOP_ASYNCIO = "asyncio"
+LOOP_UVLOOP = "uvloop"
+
+
+def uvloop_available() -> bool:
+    """Return True if uvloop can be imported."""
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def loop_factory(implementation: str = LOOP_AUTO) -> Callable[[], asyncio.AbstractEventLoop]:
+    """
+    Return a callable that creates event loops of the requested implementation.
+
+    Args:
+        implementation: "auto" (uvloop if installed, else asyncio), "uvloop"
+            or "asyncio"
+
+    Returns:
+        A zero-argument loop factory
+
+    Raises:
+        ImportError: If "uvloop" is requested but not installed
+        ValueError: If the implementation is unknown
+    """
+    if implementation not in (LOOP_AUTO, LOOP_ASYNCIO, LOOP_UVLOOP):
+        raise ValueError(f"Unknown event loop implementation: {implementation}")
+    if implementation == LOOP_ASYNCIO or (implementation == LOOP_AUTO and not uvloop_available()):
+        return asyncio.new_event_loop
+    import uvloop
+
+    return uvloop.new_event_loop
+
+
+def loop_name(loop: Optional[asyncio.AbstractEventLoop] = None) -> str:
+    """Return "uvloop" or "asyncio" for a loop (the running loop by default)."""
+    loop = loop or asyncio.get_running_loop()
+    return LOOP_UVLOOP if type(loop).__module__.startswith("uvloop") else LOOP_ASYNCIO
+
+
+def new_event_loop(
+    implementation: str = LOOP_AUTO,
+    debug: bool = False,
+    slow_callback_duration: Optional[float] = None,
+) -> asyncio.AbstractEventLoop:
+    """
+    Create a configured event loop.
+
+    Args:
+        implementation: Loop implementation, see `loop_factory`
+        debug: Enable asyncio debug mode (slow; for development only)
+        slow_callback_duration: Log callbacks that run longer than this many
+            seconds; only reported in debug mode. asyncio's default if None
+
+    Returns:
+        The new (not yet running) event loop
+    """
+    loop = loop_factory(implementation)()
+    loop.set_debug(debug)
+    if slow_callback_duration is not None:
+        loop.slow_callback_duration = slow_callback_duration
+    return loop
+
+
+def run(
+    main: Coroutine[Any, Any, T],
+    implementation: str = LOOP_AUTO,
+    debug: bool = False,
+    slow_callback_duration: Optional[float] = None,
+) -> T:
+    """
+    Run a coroutine to completion on a new, configured event loop.
+
+    Drop-in replacement for `asyncio.run` that selects the loop
+    implementation and applies the debug settings.
+
+    Args:
+        main: The coroutine to run
+        implementation: Loop implementation, see `loop_factory`
+        debug: Enable asyncio debug mode
+        slow_callback_duration: Slow-callback threshold in seconds (debug mode)
+
+    Returns:
+        The coroutine's result
+    """
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(debug=debug, loop_factory=loop_factory(implementation)) as runner:
+            if slow_callback_duration is not None:
+                runner.get_loop().slow_callback_duration = slow_callback_duration
+            return runner.run(main)
+
+    loop = new_event_loop(implementation, debug, slow_callback_duration)
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(main)
+    finally:
+        try:
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+
+def run_options(config: dict) -> dict:
+    """
+    Extract `run()` keyword arguments from an app config section.
+
+    Recognized keys: `loop` ("auto", "uvloop", "asyncio"), `debug` and
+    `slow_callback_duration`.
+
+    Args:
+        config: Mapping such as the `app` section of a YAML config
+
+    Returns:
+        Keyword arguments for `run()`
+    """
+    return {
+        "implementation": config.get("loop", LOOP_AUTO),
+        "debug": bool(config.get("debug", False)),
+        "slow_callback_duration": config.get("slow_callback_duration"),
+    }
 
 
 def get_loop() -> asyncio.AbstractEventLoop:
     """
     Get the current event loop or create a new one if none exists.
-    
+
+    A new loop uses uvloop when it is installed.
+
     Returns:
         The current asyncio event loop
     """
     try:
         loop = asyncio.get_running_loop()
     except RuntimeError:
-        loop = asyncio.new_event_loop()
+        loop = new_event_loop()
         asyncio.set_event_loop(loop)
     return loop
 
@@ -24,11 +167,11 @@ def get_loop() -> asyncio.AbstractEventLoop:
 def create_task(coro, name: Optional[str] = None) -> asyncio.Task:
     """
     Create an asyncio task with optional naming.
-    
+
     Args:
         coro: The coroutine to wrap in a task
         name: Optional name for the task (useful for debugging)
-        
+
     Returns:
         The created task
     """
@@ -3,28 +3,196 @@ Logging utilities for the Artemis framework.
 
 Provides a configured logger instance with consistent formatting and levels.
 Uses loguru for advanced logging capabilities.
+
+Logging must never stall the event loop:
+- The sink is added with `enqueue=True`, so records are written by a
+  background thread instead of the task that logged them.
+- Messages are built lazily. Pass arguments instead of pre-formatting
+  (`logger.debug("event: {}", event)`, never an f-string), so nothing is
+  formatted when the level is disabled. For expensive arguments use
+  `logger.opt(lazy=True).debug("book: {}", lambda: book.render())`.
+- High-frequency sites log through a `LogSampler`, which rate-limits or
+  samples them and reports how many messages were suppressed.
+- `configure(json=True)` switches to one compact JSON object per line.
 """
 
-from loguru import logger as _logger
+import json as _json
 import sys
+import time
+import traceback
+from typing import TYPE_CHECKING, Any, Dict, Optional, TextIO
+
+from loguru import logger as _logger
+
+if TYPE_CHECKING:
+    from loguru import Record
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+TEXT_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
+)
 
 # Configure logger with consistent formatting
 logger = _logger
 
-# Remove default handler and add our custom one
-logger.remove()
-logger.add(
-    sys.stdout,
-    format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-    level="INFO"
-)
+# Current sink settings, reused by set_level()
+_settings: Dict[str, Any] = {"sink": sys.stdout, "json": False, "enqueue": True}
 
 
-def set_level(level: str) -> None:
-    """Set the logging level for all handlers."""
+def _dumps(payload: Dict[str, Any]) -> str:
+    if orjson is not None:
+        return orjson.dumps(payload, default=str).decode()
+    return _json.dumps(payload, default=str, ensure_ascii=False, separators=(",", ":"))
+
+
+def json_format(record: "Record") -> str:
+    """
+    loguru format function rendering a record as one JSON object per line.
+
+    The message is escaped by the JSON encoder, so quotes, braces and
+    newlines in messages cannot break the output.
+
+    Args:
+        record: The loguru record
+
+    Returns:
+        The format template referencing the pre-rendered JSON line
+    """
+    payload: Dict[str, Any] = {
+        "timestamp": record["time"].isoformat(),
+        "level": record["level"].name,
+        "name": record["name"],
+        "function": record["function"],
+        "line": record["line"],
+        "message": record["message"],
+    }
+    extra = {key: value for key, value in record["extra"].items() if key != "_json"}
+    if extra:
+        payload["extra"] = extra
+    exception = record["exception"]
+    if exception is not None:
+        payload["exception"] = "".join(
+            traceback.format_exception(exception.type, exception.value, exception.traceback)
+        )
+    record["extra"]["_json"] = _dumps(payload)
+    return "{extra[_json]}\n"
+
+
+def configure(
+    level: str = "INFO",
+    sink: Optional[TextIO] = None,
+    json: Optional[bool] = None,
+    enqueue: Optional[bool] = None,
+) -> None:
+    """
+    Replace all handlers with a single configured sink.
+
+    Args:
+        level: Minimum level, e.g. "DEBUG" or "INFO"
+        sink: Where to write; stdout by default
+        json: Write one JSON object per line instead of colored text
+        enqueue: Write from a background thread so logging never blocks the
+            event loop
+    """
+    if sink is not None:
+        _settings["sink"] = sink
+    if json is not None:
+        _settings["json"] = json
+    if enqueue is not None:
+        _settings["enqueue"] = enqueue
     logger.remove()
     logger.add(
-        sys.stdout,
-        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-        level=level.upper()
+        _settings["sink"],
+        format=json_format if _settings["json"] else TEXT_FORMAT,
+        level=level.upper(),
+        enqueue=_settings["enqueue"],
+        # Variable values in tracebacks are slow to render and may leak secrets
+        diagnose=False,
     )
+
+
+def set_level(level: str) -> None:
+    """Set the logging level for all handlers."""
+    configure(level)
+
+
+class LogSampler:
+    """
+    Rate limiter for a single high-frequency log site.
+
+    Create one per call site, e.g. at module level, and log through it:
+
+        _event_log = LogSampler(interval=1.0)
+        ...
+        _event_log.debug("received event: {}", event)
+
+    A message is emitted only if it is the `every`-th call and at least
+    `interval` seconds passed since the last emitted one. The next emitted
+    message reports how many were suppressed in between.
+    """
+
+    def __init__(self, every: int = 1, interval: float = 0.0):
+        """
+        Initialize the sampler.
+
+        Args:
+            every: Emit one in this many messages
+            interval: Emit at most one message per this many seconds
+        """
+        self.every = max(1, every)
+        self.interval = interval
+        self.calls = 0
+        self.suppressed = 0
+        self.next_time = 0.0
+
+    def allow(self) -> bool:
+        """Count one call and return True if it should be logged."""
+        self.calls += 1
+        if self.every > 1 and self.calls % self.every:
+            self.suppressed += 1
+            return False
+        if self.interval:
+            now = time.monotonic()
+            if now < self.next_time:
+                self.suppressed += 1
+                return False
+            self.next_time = now + self.interval
+        return True
+
+    def _emit(self, level: str, message: str, args: tuple, kwargs: dict) -> None:
+        if not self.allow():
+            return
+        if self.suppressed:
+            message = f"{message} ({self.suppressed} similar messages suppressed)"
+            self.suppressed = 0
+        # depth=2 attributes the record to the caller of debug()/info()/...
+        logger.opt(depth=2).log(level, message, *args, **kwargs)
+
+    def log(self, level: str, message: str, *args: Any, **kwargs: Any) -> None:
+        """Log at `level` if the sampler allows it."""
+        self._emit(level, message, args, kwargs)
+
+    def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
+        """Log at DEBUG if the sampler allows it."""
+        self._emit("DEBUG", message, args, kwargs)
+
+    def info(self, message: str, *args: Any, **kwargs: Any) -> None:
+        """Log at INFO if the sampler allows it."""
+        self._emit("INFO", message, args, kwargs)
+
+    def warning(self, message: str, *args: Any, **kwargs: Any) -> None:
+        """Log at WARNING if the sampler allows it."""
+        self._emit("WARNING", message, args, kwargs)
+
+    def error(self, message: str, *args: Any, **kwargs: Any) -> None:
+        """Log at ERROR if the sampler allows it."""
+        self._emit("ERROR", message, args, kwargs)
+
+
+# Remove default handler and add our custom one
+configure("INFO")
@@ -0,0 +1,71 @@
+"""
+Request coalescing for the Artemis framework.
+
+A SingleFlight runs at most one call per key at a time: callers asking for
+a key that is already being fetched await the same in-flight call instead of
+issuing their own. With a `ttl`, results are also cached briefly, so bursts
+of lookups for the same key (e.g. the mark price of a symbol during a
+liquidation cascade) cost one round trip.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+from .cache import _MISSING, TTLCache
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Coalesces concurrent calls for the same key, optionally caching results."""
+
+    def __init__(self, ttl: float = 0.0, maxsize: int = 1024):
+        """
+        Initialize the group.
+
+        Args:
+            ttl: Seconds a successful result is reused; 0 disables caching,
+                so only concurrent calls are coalesced
+            maxsize: Maximum number of cached results
+        """
+        self.cache: Optional[TTLCache[T]] = TTLCache(maxsize, ttl) if ttl > 0 else None
+        self.calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Return the result for `key`, calling `fn` only if needed.
+
+        Failures are not cached; every caller waiting on a failed call gets
+        its exception. Cancelling one caller does not cancel the shared call.
+
+        Args:
+            key: Identity of the call
+            fn: Zero-argument coroutine function producing the result
+
+        Returns:
+            The cached, in-flight or freshly computed result
+        """
+        if self.cache is not None:
+            value = self.cache.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+        future = self.calls.get(key)
+        if future is None:
+            future = self.calls[key] = asyncio.ensure_future(self._call(key, fn))
+            # Retrieve the exception even if every caller was cancelled
+            future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        return await asyncio.shield(future)
+
+    async def _call(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        try:
+            value = await fn()
+            if self.cache is not None:
+                self.cache.set(key, value)
+            return value
+        finally:
+            self.calls.pop(key, None)
+
+    def forget(self, key: Hashable) -> None:
+        """Drop the cached result for `key`; the next call fetches again."""
+        if self.cache is not None:
+            self.cache.pop(key)
@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+
+from artemis.utils.cache import TTLCache
+from artemis.utils.singleflight import SingleFlight
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_after_their_ttl():
+    timer = FakeTimer()
+    cache: TTLCache[str] = TTLCache(maxsize=10, ttl=5, timer=timer)
+    cache.set("a", "A")
+    cache.set("b", "B", ttl=1)
+
+    timer.now = 2
+    assert "b" not in cache
+    assert cache.get("a") == "A"
+    # an expired key can be added again
+    assert cache.add("b", "B2")
+    assert not cache.add("a", "A2")
+
+    timer.now = 5
+    assert cache.get("a", "gone") == "gone"
+    assert cache.pop("b") == "B2"
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache: TTLCache[int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert ("a" in cache, "b" in cache, "c" in cache) == (True, False, True)
+    assert len(cache) == 2
+
+
+def test_insertion_drops_expired_entries():
+    timer = FakeTimer()
+    cache: TTLCache[int] = TTLCache(maxsize=10, ttl=1, timer=timer)
+    for i in range(5):
+        cache.set(i, i)
+
+    timer.now = 2
+    cache.set("fresh", 0)
+
+    assert len(cache) == 1
+
+
+def test_singleflight_coalesces_concurrent_calls():
+    calls = []
+
+    async def main():
+        group: SingleFlight[int] = SingleFlight()
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return 42
+
+        results = await asyncio.gather(*(group.do("BTC", fetch) for _ in range(5)))
+        # without a ttl the next call fetches again
+        results.append(await group.do("BTC", fetch))
+        return results
+
+    assert asyncio.run(main()) == [42] * 6
+    assert len(calls) == 2
+
+
+def test_singleflight_reuses_results_until_they_expire():
+    timer = FakeTimer()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        return len(calls)
+
+    async def main():
+        group: SingleFlight[int] = SingleFlight(ttl=1)
+        assert group.cache is not None
+        group.cache.timer = timer
+        first = await group.do("BTC", fetch)
+        cached = await group.do("BTC", fetch)
+        timer.now = 2
+        expired = await group.do("BTC", fetch)
+        group.forget("BTC")
+        forgotten = await group.do("BTC", fetch)
+        return first, cached, expired, forgotten
+
+    assert asyncio.run(main()) == (1, 1, 2, 3)
+
+
+def test_singleflight_does_not_cache_failures():
+    attempts = []
+
+    async def fetch():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ConnectionError("reset")
+        return "ok"
+
+    async def main():
+        group: SingleFlight[str] = SingleFlight(ttl=60)
+        with pytest.raises(ConnectionError):
+            await group.do("BTC", fetch)
+        return await group.do("BTC", fetch)
+
+    assert asyncio.run(main()) == "ok"
+    assert len(attempts) == 2
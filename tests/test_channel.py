@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+
+from artemis import Event, OverflowPolicy
+from artemis.engine.channel import Channel, ConflatingChannel
+
+
+def fill(channel: Channel, count: int) -> None:
+    for i in range(count):
+        channel.put_nowait(i)
+
+
+def drain(channel: Channel) -> list:
+    items = []
+    while not channel.empty():
+        items.append(channel.get_nowait())
+    return items
+
+
+def test_drop_oldest_evicts_the_head():
+    channel = Channel(maxsize=3, policy=OverflowPolicy.DROP_OLDEST)
+    fill(channel, 5)
+
+    assert drain(channel) == [2, 3, 4]
+    assert (channel.accepted, channel.dropped) == (5, 2)
+
+
+def test_drop_newest_discards_the_incoming_item():
+    channel = Channel(maxsize=3, policy=OverflowPolicy.DROP_NEWEST)
+    fill(channel, 5)
+
+    assert drain(channel) == [0, 1, 2]
+    assert (channel.accepted, channel.dropped) == (3, 2)
+
+
+def test_sample_admits_one_in_sample_rate_while_full():
+    channel = Channel(maxsize=2, policy=OverflowPolicy.SAMPLE, sample_rate=3)
+    fill(channel, 8)
+
+    # 2..7 overflow: 4 and 7 are admitted, each evicting the oldest
+    assert drain(channel) == [4, 7]
+    assert channel.dropped == 6
+    assert channel.stats()["policy"] == "sample"
+
+
+def test_block_waits_for_space():
+    async def main():
+        channel = Channel(maxsize=1)
+        channel.put_nowait(0)
+        put = asyncio.create_task(channel.put(1))
+        await asyncio.sleep(0.01)
+        assert not put.done()
+        assert channel.get_nowait() == 0
+        await asyncio.wait_for(put, 1)
+        return channel
+
+    channel = asyncio.run(main())
+
+    assert drain(channel) == [1]
+    assert channel.dropped == 0
+
+
+@pytest.mark.parametrize("policy", [OverflowPolicy.DROP_OLDEST, OverflowPolicy.SAMPLE])
+def test_join_does_not_wait_for_evicted_items(policy):
+    async def main():
+        channel = Channel(maxsize=2, policy=policy, sample_rate=1)
+        fill(channel, 6)
+        consumed = drain(channel)
+        channel.done(len(consumed))
+        await asyncio.wait_for(channel.join(), 1)
+        return consumed
+
+    assert asyncio.run(main()) == [4, 5]
+
+
+def test_conflating_channel_keeps_the_latest_event_per_symbol():
+    channel = ConflatingChannel(conflated_event_types={"tick"})
+    for event in [
+        Event(event_type="tick", symbol="BTC", data={"price": 1}),
+        Event(event_type="tick", symbol="ETH", data={"price": 10}),
+        Event(event_type="trade", symbol="BTC", data={"price": 2}),
+        Event(event_type="tick", symbol="BTC", data={"price": 3}),
+        Event(event_type="tick", data={"price": 4}),
+        Event(event_type="tick", data={"price": 5}),
+        Event(event_type="tick", symbol="ETH", data={"price": 11}),
+    ]:
+        channel.put_nowait(event)
+
+    # replaced ticks keep their position; trades and symbol-less ticks queue normally
+    assert [(e.event_type, e.symbol, e["price"]) for e in drain(channel)] == [
+        ("tick", "BTC", 3),
+        ("tick", "ETH", 11),
+        ("trade", "BTC", 2),
+        ("tick", None, 4),
+        ("tick", None, 5),
+    ]
+    assert channel.stats()["conflated"] == 2
+    assert channel.accepted == 5
+
+
+def test_conflated_replacement_does_not_wait_while_full():
+    async def main():
+        channel = ConflatingChannel(maxsize=1, conflated_event_types={"tick"})
+        await channel.put(Event(event_type="tick", symbol="BTC", data={"price": 1}))
+        await asyncio.wait_for(channel.put(Event(event_type="tick", symbol="BTC", data={"price": 2})), 1)
+        consumed = drain(channel)
+        channel.done(len(consumed))
+        await asyncio.wait_for(channel.join(), 1)
+        return consumed
+
+    assert [e["price"] for e in asyncio.run(main())] == [2]
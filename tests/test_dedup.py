@@ -0,0 +1,82 @@
+import asyncio
+from typing import AsyncIterator, List, Optional
+
+from artemis import Action, Collector, Event, Executor, Strategy
+from artemis.engine import Deduplicator, Engine, field_key
+
+
+class ListCollector(Collector):
+    def __init__(self, events: List[Event]):
+        self.items = events
+
+    def start(self, timeout: Optional[int] = None) -> None:
+        pass
+
+    async def events(self) -> AsyncIterator[Event]:
+        for event in self.items:
+            yield event
+
+
+class ForwardStrategy(Strategy):
+    async def sync_state(self) -> None:
+        pass
+
+    async def process_event(self, event: Event) -> Optional[Action]:
+        return Action("claim", {"liquidation_id": event["liquidation_id"]})
+
+
+class RecordingExecutor(Executor):
+    def __init__(self):
+        self.claimed: List[int] = []
+
+    async def sync_state(self) -> None:
+        pass
+
+    async def execute(self, action: Action) -> None:
+        self.claimed.append(action["liquidation_id"])
+
+
+def liquidation(liquidation_id: Optional[int]) -> Event:
+    return Event(event_type="liquidation", data={"liquidation_id": liquidation_id})
+
+
+def test_field_key_uses_type_and_fields():
+    key = field_key("liquidation_id")
+    assert key(liquidation(7)) == ("liquidation", 7)
+    assert key(liquidation(None)) is None
+
+
+def test_deduplicator_admits_first_copy_until_forgotten():
+    dedup = Deduplicator(field_key("liquidation_id"))
+    assert dedup.admit(liquidation(1))
+    assert not dedup.admit(liquidation(1))
+    assert dedup.admit(liquidation(None))
+    assert dedup.admit(liquidation(None))
+    dedup.forget(liquidation(1))
+    assert dedup.admit(liquidation(1))
+    assert dedup.duplicates == 1
+
+
+def test_deduplicator_forgets_after_ttl():
+    dedup = Deduplicator(field_key("liquidation_id"), ttl=60)
+    now = [0.0]
+    dedup.seen.timer = lambda: now[0]
+    assert dedup.admit(liquidation(1))
+    now[0] = 59.0
+    assert not dedup.admit(liquidation(1))
+    now[0] = 61.0
+    assert dedup.admit(liquidation(1))
+
+
+def test_engine_drops_copies_from_other_collectors():
+    engine = Engine(dedup_key=field_key("liquidation_id"))
+    engine.add_collector(ListCollector([liquidation(1), liquidation(2)]))
+    engine.add_collector(ListCollector([liquidation(2), liquidation(3), liquidation(1)]))
+    engine.add_strategy(ForwardStrategy())
+    executor = RecordingExecutor()
+    engine.add_executor(executor)
+
+    asyncio.run(engine.run_until_complete())
+
+    assert sorted(executor.claimed) == [1, 2, 3]
+    assert engine.dedup.duplicates == 2
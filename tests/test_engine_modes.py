@@ -0,0 +1,68 @@
+import asyncio
+from typing import AsyncIterator, List, Optional
+
+from artemis import Action, Collector, EngineMode, Event, Executor, Strategy
+from artemis.engine import Engine
+
+
+class PushCollector(Collector):
+    def __init__(self, count: int):
+        self.count = count
+
+    def start(self, timeout: Optional[int] = None) -> None:
+        pass
+
+    async def events(self) -> AsyncIterator[Event]:
+        for i in range(self.count):
+            yield Event(event_type="tick", data={"index": i})
+
+
+class ForwardStrategy(Strategy):
+    async def sync_state(self) -> None:
+        pass
+
+    async def process_event(self, event: Event) -> Optional[Action]:
+        return Action("forward", {"index": event["index"]})
+
+
+class CountingExecutor(Executor):
+    def __init__(self):
+        self.executed: List[int] = []
+
+    async def sync_state(self) -> None:
+        pass
+
+    async def execute(self, action: Action) -> None:
+        self.executed.append(action["index"])
+
+
+def test_throttled_mode_drives_push_style_collectors():
+    engine = Engine(mode=EngineMode.THROTTLED, throttle_interval=0.001)
+    engine.add_collector(PushCollector(5))
+    engine.add_strategy(ForwardStrategy())
+    executor = CountingExecutor()
+    engine.add_executor(executor)
+
+    asyncio.run(engine.run_until_complete())
+
+    assert sorted(executor.executed) == [0, 1, 2, 3, 4]
+
+
+class FlakyCollector(PushCollector):
+    def normalize(self, raw):
+        if raw["index"] % 2:
+            raise KeyError("price")
+        return raw
+
+
+def test_normalize_errors_drop_only_the_payload():
+    engine = Engine()
+    engine.add_collector(FlakyCollector(6))
+    engine.add_strategy(ForwardStrategy())
+    executor = CountingExecutor()
+    engine.add_executor(executor)
+
+    asyncio.run(engine.run_until_complete())
+
+    assert sorted(executor.executed) == [0, 2, 4]
+    assert engine.component_errors.labels("collector", "FlakyCollector").value == 3
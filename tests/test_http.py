@@ -0,0 +1,95 @@
+import asyncio
+from typing import List
+
+from aiohttp import web
+
+from artemis.http import SessionRegistry
+
+
+async def serve(hits: List[str]) -> web.AppRunner:
+    async def ping(request):
+        hits.append(request.path)
+        return web.json_response({"success": True})
+
+    app = web.Application()
+    app.router.add_get("/ping", ping)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    return runner
+
+
+def base_url(runner: web.AppRunner) -> str:
+    host, port = runner.addresses[0][:2]
+    return f"http://{host}:{port}"
+
+
+async def wait_until(condition) -> None:
+    while not condition():
+        await asyncio.sleep(0.01)
+
+
+def test_prewarm_opens_connections_and_keeps_them_warm():
+    hits: List[str] = []
+
+    async def main():
+        runner = await serve(hits)
+        sessions = SessionRegistry(keep_warm_interval=0.05)
+        try:
+            warmed = await sessions.prewarm(f"{base_url(runner)}/ping", connections=3, name="venue")
+            assert warmed == 3
+            assert len(hits) == 3
+            # keep-warm rounds refresh all three connections
+            await asyncio.wait_for(wait_until(lambda: len(hits) >= 9), 2)
+            body = await sessions.get_json(f"{base_url(runner)}/ping", name="venue")
+            assert body == {"success": True}
+        finally:
+            await sessions.close()
+            await runner.cleanup()
+        return sessions
+
+    sessions = asyncio.run(main())
+
+    assert sessions.sessions == {}
+    assert sessions.warm_targets == []
+
+
+def test_prewarm_to_an_unreachable_host_reports_no_connections():
+    async def main():
+        sessions = SessionRegistry(timeout=1)
+        try:
+            return await sessions.prewarm("http://127.0.0.1:9/ping", connections=2, keep_warm=False)
+        finally:
+            await sessions.close()
+
+    assert asyncio.run(main()) == 0
+
+
+def test_keep_warm_callbacks_are_registered_once_and_survive_failures():
+    calls: List[str] = []
+
+    class Client:
+        async def get_account_info(self):
+            calls.append("account")
+
+    async def failing():
+        calls.append("failing")
+        raise ConnectionError("reset")
+
+    async def main():
+        sessions = SessionRegistry(keep_warm_interval=0.05)
+        client = Client()
+        try:
+            # a resync registers the same bound method again
+            sessions.keep_warm(client.get_account_info)
+            sessions.keep_warm(client.get_account_info)
+            sessions.keep_warm(failing)
+            assert len(sessions.warm_callbacks) == 2
+            await asyncio.wait_for(wait_until(lambda: calls.count("failing") >= 2), 2)
+        finally:
+            await sessions.close()
+
+    asyncio.run(main())
+
+    # one call of each per round: failures do not stop the loop, duplicates are not added
+    assert calls.count("account") == calls.count("failing") >= 2
@@ -0,0 +1,124 @@
+import asyncio
+import os
+import threading
+from typing import AsyncIterator, Optional
+
+from artemis import Action, Collector, Event, Strategy
+from artemis.engine import Engine
+from artemis.journal import Journal, JournalReader, RecordKind
+
+
+class ListCollector(Collector):
+    def __init__(self, events):
+        self.items = events
+
+    def start(self, timeout: Optional[int] = None) -> None:
+        pass
+
+    async def events(self) -> AsyncIterator[Event]:
+        for event in self.items:
+            yield event
+
+
+class IdleStrategy(Strategy):
+    async def sync_state(self) -> None:
+        pass
+
+    async def process_event(self, event: Event) -> None:
+        return None
+
+
+def test_unpicklable_event_is_skipped(tmp_path):
+    journal = Journal(str(tmp_path))
+    engine = Engine(journal=journal)
+    engine.add_collector(
+        ListCollector([
+            Event(event_type="tick", data={"index": 0}),
+            Event(event_type="tick", data={"lock": threading.Lock()}),
+            Event(event_type="tick", data={"index": 2}),
+        ])
+    )
+    engine.add_strategy(IdleStrategy())
+
+    asyncio.run(engine.run_until_complete())
+
+    assert (journal.written, journal.dropped) == (2, 1)
+    assert "artemis_journal_dropped_total 1" in engine.metrics.render()
+    with JournalReader(str(tmp_path)) as reader:
+        assert [event["index"] for _, event in reader.events()] == [0, 2]
+
+
+def test_failed_write_keeps_the_journal_running(tmp_path):
+    journal = Journal(str(tmp_path))
+
+    async def main():
+        journal.append_event(Event(event_type="tick", data={"index": 0}))
+        journal.directory = str(tmp_path / "missing")
+        await journal.flush()
+        journal.directory = str(tmp_path)
+        journal.append_event(Event(event_type="tick", data={"index": 1}))
+        await journal.close()
+
+    asyncio.run(main())
+
+    assert (journal.written, journal.dropped) == (1, 1)
+    with JournalReader(str(tmp_path)) as reader:
+        assert [event["index"] for _, event in reader.events()] == [1]
+
+
+def write(directory, records, **kwargs):
+    journal = Journal(str(directory), **kwargs)
+
+    async def main():
+        for record in records:
+            if isinstance(record, Event):
+                journal.append_event(record)
+            else:
+                journal.append_action(record)
+        await journal.close()
+
+    asyncio.run(main())
+    return journal
+
+
+def test_full_segments_rotate_and_read_back_in_order(tmp_path):
+    events = [Event(event_type="tick", data={"index": i, "pad": "x" * 64}) for i in range(20)]
+    journal = write(tmp_path, events, segment_size=1024)
+
+    with JournalReader(str(tmp_path)) as reader:
+        segments = reader.segments()
+        assert [event["index"] for _, event in reader.events()] == list(range(20))
+        timestamps = [timestamp_ns for _, timestamp_ns, _ in reader.scan()]
+
+    assert journal.written == 20
+    assert len(segments) > 2
+    # closed segments are trimmed to their used size plus the terminator
+    assert all(os.path.getsize(path) <= 1024 for path in segments)
+    assert timestamps == sorted(timestamps)
+
+
+def test_reader_separates_events_and_actions(tmp_path):
+    write(tmp_path, [
+        Event(event_type="tick", data={"index": 0}),
+        Action("order", {"index": 1}),
+        Event(event_type="tick", data={"index": 2}),
+    ])
+
+    with JournalReader(str(tmp_path)) as reader:
+        records = [(kind, record["index"]) for kind, _, record in reader.records()]
+        events = [event["index"] for _, event in reader.events()]
+
+    assert records == [(RecordKind.EVENT, 0), (RecordKind.ACTION, 1), (RecordKind.EVENT, 2)]
+    assert events == [0, 2]
+
+
+def test_reopened_journal_continues_after_the_last_segment(tmp_path):
+    write(tmp_path, [Event(event_type="tick", data={"index": 0})])
+    write(tmp_path, [Event(event_type="tick", data={"index": 1})])
+
+    with JournalReader(str(tmp_path)) as reader:
+        names = [os.path.basename(path) for path in reader.segments()]
+        events = [event["index"] for _, event in reader.events()]
+
+    assert names == ["journal-00000000.seg", "journal-00000001.seg"]
+    assert events == [0, 1]
@@ -0,0 +1,86 @@
+import asyncio
+from typing import Any, List, Optional
+
+from artemis import Action, Executor
+from artemis.engine.channel import Channel
+from artemis.engine.lanes import ExecutorLane
+
+
+class SlowExecutor(Executor):
+    def __init__(self, max_concurrency: int, delays):
+        self.max_concurrency = max_concurrency
+        self.delays = delays
+        self.executed: List[Any] = []
+        self.running = 0
+        self.peak = 0
+
+    async def sync_state(self) -> None:
+        pass
+
+    async def execute(self, action: Action) -> None:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delays.get(action.symbol, 0.01))
+            self.executed.append((action.symbol, action["index"]))
+        finally:
+            self.running -= 1
+
+    def ordering_key(self, action: Action) -> Optional[str]:
+        return action.symbol
+
+
+async def run_lane(executor: SlowExecutor, actions: List[Action]) -> None:
+    inbox = Channel()
+
+    async def handler(executor, batch):
+        for action in batch:
+            await executor.execute(action)
+
+    async def next_batch(queue):
+        batch = [await queue.get()]
+        while not queue.empty():
+            batch.append(queue.get_nowait())
+        return batch
+
+    for action in actions:
+        inbox.put_nowait(action)
+    lane = ExecutorLane(executor, inbox, handler, next_batch)
+    task = asyncio.create_task(lane.run())
+    await asyncio.wait_for(inbox.join(), 5)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    assert lane.tails == {}
+
+
+def actions(*symbols: Optional[str]) -> List[Action]:
+    return [Action("order", {"index": i}, symbol=symbol) for i, symbol in enumerate(symbols)]
+
+
+def test_actions_with_the_same_key_run_in_order():
+    # BTC is slow, so ETH and SOL overtake it, but BTC keeps its own order
+    executor = SlowExecutor(max_concurrency=4, delays={"BTC": 0.05})
+
+    asyncio.run(run_lane(executor, actions("BTC", "ETH", "BTC", "SOL", "BTC", "ETH")))
+
+    assert [i for symbol, i in executor.executed if symbol == "BTC"] == [0, 2, 4]
+    assert [i for symbol, i in executor.executed if symbol == "ETH"] == [1, 5]
+    assert executor.executed.index(("ETH", 1)) < executor.executed.index(("BTC", 0))
+
+
+def test_max_concurrency_bounds_groups_in_flight():
+    executor = SlowExecutor(max_concurrency=2, delays={})
+
+    asyncio.run(run_lane(executor, actions(*(None for _ in range(8)))))
+
+    assert len(executor.executed) == 8
+    assert executor.peak == 2
+
+
+def test_single_concurrency_preserves_global_order():
+    executor = SlowExecutor(max_concurrency=1, delays={"BTC": 0.03})
+
+    asyncio.run(run_lane(executor, actions("BTC", "ETH", None, "BTC")))
+
+    assert [i for _, i in executor.executed] == [0, 1, 2, 3]
+    assert executor.peak == 1
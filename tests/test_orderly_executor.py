@@ -0,0 +1,81 @@
+import asyncio
+import importlib
+import importlib.util
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("orderly_sdk")
+
+EXAMPLE = Path(__file__).resolve().parents[1] / "examples" / "orderly_liquidation_searcher"
+
+
+def import_example(name: str):
+    """Import a module of the Orderly example, which imports itself as `liquidation_searcher`."""
+    if "liquidation_searcher" not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            "liquidation_searcher", EXAMPLE / "__init__.py", submodule_search_locations=[str(EXAMPLE)]
+        )
+        package = importlib.util.module_from_spec(spec)
+        sys.modules["liquidation_searcher"] = package
+        spec.loader.exec_module(package)
+    return importlib.import_module(f"liquidation_searcher.{name}")
+
+
+class StaggeredClient:
+    """Transfers each claimed symbol at its own delay after the claim."""
+
+    def __init__(self, transfers):
+        self.transfers = transfers
+        self.claimed_at = None
+        self.orders = []
+
+    async def claim_liquidated_positions(self, json):
+        self.claimed_at = time.monotonic()
+        return {"success": True}
+
+    async def get_all_positions(self):
+        elapsed = time.monotonic() - self.claimed_at if self.claimed_at else -1
+        rows = [
+            {"symbol": symbol, "position_qty": qty if elapsed >= delay else 0}
+            for symbol, (delay, qty) in self.transfers.items()
+        ]
+        return {"data": {"rows": rows}}
+
+    async def create_order(self, json):
+        self.orders.append((json["symbol"], json["side"], json["order_quantity"]))
+        return {"success": True}
+
+
+def test_staggered_transfer_hedges_every_symbol():
+    orderly = import_example("executors.orderly_executor")
+    types = import_example("types")
+    executor = orderly.OrderlyExecutor("account", "key", "secret", "http://orderly", 10_000, [])
+    executor.orderly_client = StaggeredClient({"PERP_ETH_USDC": (0.05, 1.5), "PERP_BTC_USDC": (0.3, -0.02)})
+    executor.symbol_info = {
+        "PERP_ETH_USDC": {"base_tick": "0.01"},
+        "PERP_BTC_USDC": {"base_tick": "0.001"},
+    }
+
+    async def fetch_mark_price(symbol):
+        return 100.0
+
+    executor.fetch_mark_price = fetch_mark_price
+    action = {
+        "action_type": types.ActionType.ORDERLY_LIQUIDATION_ORDER,
+        "liquidation_id": 1,
+        "type": types.LiquidationType.LIQUIDATED,
+        "positions_by_perp": [
+            {"symbol": "PERP_ETH_USDC", "position_qty": 1.5},
+            {"symbol": "PERP_BTC_USDC", "position_qty": -0.02},
+        ],
+    }
+
+    asyncio.run(executor.execute(action))
+
+    assert executor.orderly_client.orders == [
+        ("PERP_ETH_USDC", "SELL", "1.50"),
+        ("PERP_BTC_USDC", "BUY", "0.020"),
+    ]
@@ -0,0 +1,79 @@
+import asyncio
+import os
+from typing import AsyncIterator, List, Optional
+
+from artemis import Action, Collector, Event, Executor, Strategy
+from artemis.engine import Engine
+from artemis.engine.process import ProcessStrategyRunner
+
+
+class CountingStrategy(Strategy):
+    cpu_bound = True
+
+    def __init__(self):
+        self.total = 0
+        self.synced_in: Optional[int] = None
+
+    async def sync_state(self) -> None:
+        self.synced_in = os.getpid()
+
+    async def process_event(self, event: Event) -> Action:
+        # state lives in the worker, so the running total spans batches
+        self.total += event["value"]
+        return Action("total", {"total": self.total, "pid": self.synced_in})
+
+
+def test_runner_round_trips_batches_through_the_worker():
+    runner = ProcessStrategyRunner(CountingStrategy())
+
+    async def main():
+        await runner.sync_state()
+        first = await runner.process_events([Event(event_type="tick", data={"value": v}) for v in (1, 2)])
+        second = await runner.process_events([Event(event_type="tick", data={"value": 3})])
+        return first + second
+
+    try:
+        actions = asyncio.run(main())
+    finally:
+        runner.close()
+
+    assert [action["total"] for action in actions] == [1, 3, 6]
+    assert {action["pid"] for action in actions} != {os.getpid()}
+    # the parent's copy is never touched
+    assert runner.strategy.total == 0
+
+
+class ListCollector(Collector):
+    def __init__(self, events):
+        self.items = events
+
+    def start(self, timeout: Optional[int] = None) -> None:
+        pass
+
+    async def events(self) -> AsyncIterator[Event]:
+        for event in self.items:
+            yield event
+
+
+class RecordingExecutor(Executor):
+    def __init__(self):
+        self.executed: List[int] = []
+
+    async def sync_state(self) -> None:
+        pass
+
+    async def execute(self, action: Action) -> None:
+        self.executed.append(action["total"])
+
+
+def test_engine_runs_cpu_bound_strategies_out_of_process():
+    engine = Engine(max_batch_size=1)
+    engine.add_collector(ListCollector([Event(event_type="tick", data={"value": v}) for v in range(1, 5)]))
+    engine.add_strategy(CountingStrategy())
+    executor = RecordingExecutor()
+    engine.add_executor(executor)
+
+    asyncio.run(engine.run_until_complete())
+
+    assert executor.executed == [1, 3, 6, 10]
+    assert engine.process_runners == {}
@@ -0,0 +1,98 @@
+import asyncio
+from typing import AsyncIterator, List, Optional
+
+from artemis import Collector, Event
+from artemis.collectors import RacedCollector
+from artemis.engine import field_key
+from artemis.metrics import MetricsRegistry
+
+
+class DelayedCollector(Collector):
+    """Yields liquidation ids after a fixed delay each."""
+
+    def __init__(self, ids: List[Optional[int]], delay: float):
+        self.ids = ids
+        self.delay = delay
+
+    def start(self, timeout: Optional[int] = None) -> None:
+        pass
+
+    async def events(self) -> AsyncIterator[dict]:
+        for liquidation_id in self.ids:
+            await asyncio.sleep(self.delay)
+            yield {"event_type": "liquidation", "liquidation_id": liquidation_id}
+
+
+class FlakyCollector(DelayedCollector):
+    """Fails once mid-stream, then delivers everything on restart."""
+
+    def __init__(self, ids, delay):
+        super().__init__(ids, delay)
+        self.attempts = 0
+
+    async def events(self) -> AsyncIterator[dict]:
+        self.attempts += 1
+        async for raw in super().events():
+            if self.attempts == 1 and raw["liquidation_id"] == 2:
+                raise ConnectionError("reset")
+            yield raw
+
+
+async def collect(race: RacedCollector) -> List[Event]:
+    return [event async for event in race.events()]
+
+
+def test_first_copy_wins_and_later_copies_are_counted():
+    fast = DelayedCollector([1, 2, 3], delay=0.01)
+    slow = DelayedCollector([1, 2, 3, 4], delay=0.03)
+    race = RacedCollector([fast, slow], key=field_key("liquidation_id"), names=["ws", "rest"])
+
+    events = asyncio.run(collect(race))
+
+    assert [event["liquidation_id"] for event in events] == [1, 2, 3, 4]
+    stats = race.stats()
+    assert (stats["ws"]["wins"], stats["ws"]["losses"], stats["ws"]["win_rate"]) == (3, 0, 1.0)
+    # id 4 only ever came from rest, so it was not raced
+    assert (stats["rest"]["events"], stats["rest"]["wins"], stats["rest"]["losses"]) == (4, 0, 3)
+    assert stats["ws"]["lead_p50_us"] > 0
+
+
+def test_events_without_an_identity_are_always_emitted():
+    race = RacedCollector(
+        [DelayedCollector([None, 1], 0.01), DelayedCollector([None, 1], 0.02)],
+        key=field_key("liquidation_id"),
+    )
+
+    events = asyncio.run(collect(race))
+
+    assert [event["liquidation_id"] for event in events] == [None, None, 1]
+    assert set(race.stats()) == {"DelayedCollector", "DelayedCollector#2"}
+
+
+def test_failed_source_restarts_and_malformed_payloads_are_counted():
+    class BrokenCollector(DelayedCollector):
+        def normalize(self, raw):
+            if raw["liquidation_id"] == 1:
+                raise KeyError("positions")
+            return raw
+
+    flaky = FlakyCollector([1, 2, 3], delay=0.001)
+    broken = BrokenCollector([1], delay=0.05)
+    metrics = MetricsRegistry()
+    race = RacedCollector(
+        [flaky, broken],
+        key=field_key("liquidation_id"),
+        names=["flaky", "broken"],
+        min_restart_delay=0.01,
+        metrics=metrics,
+    )
+
+    events = asyncio.run(collect(race))
+
+    assert flaky.attempts == 2
+    # id 1 is repeated by the restarted source, which is not a race
+    assert [event["liquidation_id"] for event in events] == [1, 2, 3]
+    assert race.stats()["broken"]["errors"] == 1
+    rendered = metrics.render()
+    assert 'artemis_errors_total{component="collector",name="broken"} 1' in rendered
+    assert 'artemis_race_wins_total{source="flaky"} 0' in rendered
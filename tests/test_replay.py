@@ -0,0 +1,79 @@
+import asyncio
+from typing import List, Optional, Tuple
+
+from artemis import Action, Event, Executor, Strategy, get_clock
+from artemis.clock import VirtualClock
+from artemis.replay import ReplayCollector, replay
+
+
+class ClockProbeStrategy(Strategy):
+    """Records the clock seen while processing each event."""
+
+    def __init__(self):
+        self.seen: List[Tuple[int, int]] = []
+
+    async def sync_state(self) -> None:
+        pass
+
+    async def process_event(self, event: Event) -> Optional[Action]:
+        self.seen.append((event["index"], get_clock().time_ns()))
+        return Action("probe", {"index": event["index"]})
+
+
+class ClockProbeExecutor(Executor):
+    """Records the clock seen while executing each action."""
+
+    def __init__(self):
+        self.seen: List[Tuple[int, int]] = []
+
+    async def sync_state(self) -> None:
+        pass
+
+    async def execute(self, action: Action) -> None:
+        self.seen.append((action["index"], get_clock().time_ns()))
+
+
+def recording(count: int) -> List[Tuple[int, Event]]:
+    return [(1_000_000_000 * (i + 1), Event(event_type="tick", data={"index": i})) for i in range(count)]
+
+
+def test_replay_clock_matches_recorded_time():
+    frames = recording(2000)
+    recorded = {event["index"]: received_ns for received_ns, event in frames}
+    strategy = ClockProbeStrategy()
+    executor = ClockProbeExecutor()
+
+    result = asyncio.run(replay(frames, [strategy], [executor], event_channel_capacity=1024))
+
+    assert result.events == 2000
+    assert result.action_count == 2000
+    assert len(strategy.seen) == 2000
+    assert all(now == recorded[index] for index, now in strategy.seen)
+    assert all(now == recorded[index] for index, now in executor.seen)
+
+
+def test_barrier_only_when_recorded_time_moves_forward():
+    frames = [(ns, Event(event_type="tick", data={"index": i})) for i, ns in enumerate((1, 1, 1, 2, 2, 3))]
+    barriers = []
+
+    async def barrier() -> None:
+        barriers.append(clock.time_ns())
+
+    async def drain() -> List[int]:
+        return [event["index"] async for event in collector.events()]
+
+    clock = VirtualClock()
+    collector = ReplayCollector(frames, clock, barrier=barrier)
+
+    assert asyncio.run(drain()) == [0, 1, 2, 3, 4, 5]
+    assert barriers == [1, 2]
+
+
+def test_replay_restores_the_previous_clock():
+    before = get_clock()
+    strategy = ClockProbeStrategy()
+
+    asyncio.run(replay(recording(10), [strategy], lockstep=False))
+
+    assert len(strategy.seen) == 10
+    assert get_clock() is before
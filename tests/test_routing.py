@@ -0,0 +1,77 @@
+import asyncio
+from typing import AsyncIterator, List, Optional
+
+import pytest
+
+from artemis import Collector, EngineMode, Event, Strategy
+from artemis.engine import Engine
+
+
+class ListCollector(Collector):
+    def __init__(self, events):
+        self.items = events
+
+    def start(self, timeout: Optional[int] = None) -> None:
+        pass
+
+    async def events(self) -> AsyncIterator[Event]:
+        for event in self.items:
+            yield event
+
+
+class RecordingStrategy(Strategy):
+    def __init__(self, event_types=None, symbols=None):
+        self.event_types = event_types
+        self.symbols = symbols
+        self.seen: List[int] = []
+
+    async def sync_state(self) -> None:
+        # subscriptions set up during warm-up are honoured
+        if self.event_types is not None:
+            self.subscribed_event_types = frozenset(self.event_types)
+        if self.symbols is not None:
+            self.subscribed_symbols = frozenset(self.symbols)
+
+    async def process_event(self, event: Event) -> None:
+        self.seen.append(event["index"])
+        return None
+
+
+EVENTS = [
+    Event(event_type="tick", symbol="BTC", data={"index": 0}),
+    Event(event_type="tick", symbol="ETH", data={"index": 1}),
+    Event(event_type="trade", symbol="BTC", data={"index": 2}),
+    Event(event_type="tick", data={"index": 3}),
+    Event(event_type="funding", symbol="ETH", data={"index": 4}),
+]
+
+
+@pytest.mark.parametrize("mode", [EngineMode.EVENT, EngineMode.THROTTLED])
+def test_strategies_only_receive_subscribed_events(mode):
+    engine = Engine(mode=mode, throttle_interval=0.001)
+    engine.add_collector(ListCollector(EVENTS))
+    everything = RecordingStrategy()
+    ticks = RecordingStrategy(event_types={"tick"})
+    btc = RecordingStrategy(symbols={"BTC"})
+    btc_ticks = RecordingStrategy(event_types={"tick"}, symbols={"BTC"})
+    for strategy in (everything, ticks, btc, btc_ticks):
+        engine.add_strategy(strategy)
+
+    asyncio.run(engine.run_until_complete())
+
+    assert sorted(everything.seen) == [0, 1, 2, 3, 4]
+    assert sorted(ticks.seen) == [0, 1, 3]
+    # the symbol filter does not apply to events without a symbol
+    assert sorted(btc.seen) == [0, 2, 3]
+    assert sorted(btc_ticks.seen) == [0, 3]
+
+
+def test_single_strategy_skips_unsubscribed_batches():
+    engine = Engine(mode=EngineMode.THROTTLED, throttle_interval=0.001)
+    engine.add_collector(ListCollector(EVENTS))
+    strategy = RecordingStrategy(event_types={"funding"})
+    engine.add_strategy(strategy)
+
+    asyncio.run(engine.run_until_complete())
+
+    assert strategy.seen == [4]
@@ -0,0 +1,59 @@
+import asyncio
+from typing import AsyncIterator, Optional
+
+from artemis import Action, Collector, Event, Executor, Strategy
+from artemis.engine import Engine
+from artemis.tracing import LatencyHistogram, mark
+
+
+class OneShotCollector(Collector):
+    def start(self, timeout: Optional[int] = None) -> None:
+        pass
+
+    async def events(self) -> AsyncIterator[Event]:
+        yield Event(event_type="tick", data={"price": 1.0})
+
+
+class ForwardStrategy(Strategy):
+    async def sync_state(self) -> None:
+        pass
+
+    async def process_event(self, event: Event) -> Optional[Action]:
+        return Action("order", {"price": event["price"]})
+
+
+class SlowExecutor(Executor):
+    async def sync_state(self) -> None:
+        pass
+
+    async def execute(self, action: Action) -> None:
+        mark(action, "order_sent")
+        await asyncio.sleep(0.05)
+
+
+def test_milestones_are_recorded_as_stages():
+    engine = Engine(trace_latency=True)
+    engine.add_collector(OneShotCollector())
+    engine.add_strategy(ForwardStrategy())
+    engine.add_executor(SlowExecutor())
+
+    asyncio.run(engine.run_until_complete())
+
+    sent = engine.tracer.histogram("order_sent")
+    end_to_end = engine.tracer.histogram("end_to_end")
+    assert sent.count == 1
+    assert sent.max < 50_000_000 <= end_to_end.max
+
+
+
+def test_percentiles_in_one_pass():
+    histogram = LatencyHistogram()
+    values = list(range(1, 10_000_000, 997))
+    for value in reversed(values):
+        histogram.record(value)
+    percentiles = (99.9, 50, 99, 90)
+    for percentile, value in zip(percentiles, histogram.percentiles(percentiles)):
+        exact = values[round(len(values) * percentile / 100) - 1]
+        assert exact <= value <= exact * 1.016
+    assert histogram.percentile(100) == histogram.max
+    assert LatencyHistogram().percentiles((50, 99)) == [0, 0]
@@ -0,0 +1,32 @@
+import asyncio
+
+from artemis.engine.warmup import sync_component
+
+
+class Component:
+    pass
+
+
+async def raise_timeout() -> None:
+    raise asyncio.TimeoutError("server timeout")
+
+
+async def never_finish() -> None:
+    await asyncio.sleep(60)
+
+
+def test_component_timeout_without_deadline_is_an_error():
+    status = asyncio.run(sync_component("executor", Component(), raise_timeout, None))
+    assert not status.ready
+    assert status.error == "server timeout"
+
+
+def test_component_timeout_within_deadline_is_not_a_deadline_miss():
+    status = asyncio.run(sync_component("executor", Component(), raise_timeout, 5.0))
+    assert status.error == "server timeout"
+
+
+def test_deadline_expiry_is_reported():
+    status = asyncio.run(sync_component("executor", Component(), never_finish, 0.05))
+    assert not status.ready
+    assert status.error == "sync_state timed out after 0.05s"
@@ -0,0 +1,95 @@
+import asyncio
+import json
+from typing import List
+
+from aiohttp import web
+
+from artemis.collectors import WebSocketCollector
+from artemis.http import SessionRegistry
+
+
+async def serve(handler) -> web.AppRunner:
+    app = web.Application()
+    app.router.add_get("/ws", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    return runner
+
+
+def url(runner: web.AppRunner) -> str:
+    host, port = runner.addresses[0][:2]
+    return f"ws://{host}:{port}/ws"
+
+
+async def take(collector: WebSocketCollector, count: int) -> List[dict]:
+    received = []
+    async for raw in collector.events():
+        received.append(raw)
+        if len(received) == count:
+            break
+    return received
+
+
+def test_reconnects_and_resubscribes_after_the_server_closes():
+    subscriptions: List[List[str]] = []
+
+    async def handler(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        connection = len(subscriptions)
+        subscriptions.append([])
+        message = json.loads(await ws.receive_str())
+        subscriptions[-1].append(message["topic"])
+        await ws.send_str(json.dumps({"connection": connection, "seq": 0}))
+        if connection == 0:
+            await ws.close()
+            return ws
+        await ws.send_str(json.dumps({"connection": connection, "seq": 1}))
+        await ws.receive()
+        return ws
+
+    async def main():
+        runner = await serve(handler)
+        sessions = SessionRegistry()
+        collector = WebSocketCollector(url(runner), topics=["liquidation"], min_reconnect_delay=0.01, sessions=sessions)
+        try:
+            return await asyncio.wait_for(take(collector, 3), 5), collector
+        finally:
+            await sessions.close()
+            await runner.cleanup()
+
+    received, collector = asyncio.run(main())
+
+    assert received == [{"connection": 0, "seq": 0}, {"connection": 1, "seq": 0}, {"connection": 1, "seq": 1}]
+    assert subscriptions == [["liquidation"], ["liquidation"]]
+    assert collector.connects == 2
+
+
+def test_silent_connection_is_reopened():
+    connections = []
+
+    async def handler(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        connections.append(ws)
+        if len(connections) > 1:
+            await ws.send_str(json.dumps({"seq": len(connections)}))
+        # the first connection never sends anything
+        await ws.receive()
+        return ws
+
+    async def main():
+        runner = await serve(handler)
+        sessions = SessionRegistry()
+        collector = WebSocketCollector(
+            url(runner), receive_timeout=0.1, heartbeat=None, min_reconnect_delay=0.01, sessions=sessions
+        )
+        try:
+            return await asyncio.wait_for(take(collector, 1), 5)
+        finally:
+            await sessions.close()
+            await runner.cleanup()
+
+    assert asyncio.run(main()) == [{"seq": 2}]
+    assert len(connections) == 2